@@ -1,3 +1,4 @@
+import argparse
 import sys
 import time
 import threading
@@ -5,6 +6,7 @@ import os
 
 
 from simulations.simulations_brandes import benchmark_brandes_custom
+from simulations.benchmark_suite import CASES, run_suite, save_results, load_results, compare
 from plot.plot import plot_random_weights, plot_all_graph_brandes
 
 
@@ -77,5 +79,49 @@ def main():
     )
     print(" → Comparação salva em 'output/imgs/brandes/brandes_comparativo_todos.png'\n")
 
+def suite(args) -> int:
+    """
+    Executa a suíte de ``simulations/benchmark_suite.py``, grava o JSON e
+    compara com a linha de base, se houver.
+
+    Returns:
+        int: 1 se algum caso regrediu em relação à linha de base, 0 caso contrário
+    """
+    results = run_suite(args.cases, args.types, args.sizes, args.repeats, args.seed)
+    os.makedirs(os.path.dirname(args.json) or '.', exist_ok=True)
+    save_results(results, args.json)
+    print(f" → Resultados salvos em '{args.json}'")
+
+    if args.save_baseline:
+        save_results(results, args.save_baseline)
+        print(f" → Linha de base salva em '{args.save_baseline}'")
+
+    if not args.baseline:
+        return 0
+    regressions = 0
+    print(f"\n>>> Comparação com '{args.baseline}' (limite +{args.threshold:.0%})")
+    for row in compare(results, load_results(args.baseline), args.threshold):
+        flag = 'REGRESSÃO' if row['regression'] else 'ok'
+        regressions += row['regression']
+        print(f"[{row['graph_type']} | n={row['n']}] {row['case']:<22} "
+              f"{row['baseline']:.4f}s -> {row['median']:.4f}s (x{row['ratio']:.2f}) {flag}")
+    return 1 if regressions else 0
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmarks do graph_lib')
+    parser.add_argument('--suite', action='store_true',
+                        help='Executa a suíte com estatísticas, memória e JSON em vez dos gráficos')
+    parser.add_argument('--cases', nargs='+', default=list(CASES), choices=CASES, help='Casos medidos')
+    parser.add_argument('--types', nargs='+', default=['erdos', 'planar'], help="Tipos de grafo ('erdos', 'barabasi', 'planar', 'strogatz', 'street')")
+    parser.add_argument('--sizes', nargs='+', type=int, default=[200, 1000], help='Números de vértices')
+    parser.add_argument('--repeats', type=int, default=5, help='Repetições por caso')
+    parser.add_argument('--seed', type=int, default=42, help='Semente dos grafos')
+    parser.add_argument('--json', default='output/benchmark.json', help='Arquivo JSON de resultados')
+    parser.add_argument('--baseline', default=None, help='JSON de referência para detectar regressões')
+    parser.add_argument('--save-baseline', default=None, help='Também grava os resultados como linha de base')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Piora relativa da mediana considerada regressão')
+    args = parser.parse_args()
+    if args.suite:
+        sys.exit(suite(args))
     main()
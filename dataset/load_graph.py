@@ -1,19 +1,17 @@
+import hashlib
+import json
+import os
+
 import osmnx as ox
 import networkx as nx
 
-def load_graph(place: str, weight_type: str = 'none') -> nx.MultiDiGraph:
-    """
-    Carrega o grafo do local especificado com pesos definidos no atributo 'weight'.
+import lib.graph_lib as glib
+from utils.utils import netx_to_csr
 
-    Args:
-        place (str): Local para carregar o grafo.
-        weight_type (str): 'length', 'travel_time', etc.
-
-    Returns:
-        nx.MultiDiGraph: Grafo multiaresta com dados geográficos completos e atributo 'weight' definido.
+def _set_weights(G: nx.MultiDiGraph, weight_type: str) -> nx.MultiDiGraph:
+    """
+    Define o atributo 'weight' de cada aresta a partir de ``weight_type``.
     """
-    G = ox.graph_from_place(place, network_type='drive')
-
     if weight_type != 'none':
         if weight_type == 'bearing':
             G = ox.bearing.add_edge_bearings(G)
@@ -41,6 +39,106 @@ def load_graph(place: str, weight_type: str = 'none') -> nx.MultiDiGraph:
 
     return G
 
+def cache_key(place: str, network_type: str = 'drive', weight_type: str = 'none',
+              source: str = None) -> str:
+    """
+    Chave do cache: hash de (local, tipo de rede, tipo de peso, arquivo
+    local, ``glib.CACHE_VERSION``). Com ``source``, o caminho absoluto, o
+    tamanho e a data de modificação do arquivo entram na chave: o grafo de
+    um arquivo local nunca é servido como o do download (nem o contrário), e
+    um arquivo alterado gera uma nova entrada.
+
+    Returns:
+        str: sha256 em hexadecimal
+    """
+    origin = None
+    if source:
+        stat = os.stat(source)
+        origin = [os.path.abspath(source), stat.st_size, stat.st_mtime_ns]
+    payload = json.dumps([place, network_type, weight_type, origin, glib.CACHE_VERSION])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _read_local(source: str) -> nx.MultiDiGraph:
+    """
+    Lê um grafo de um arquivo local .osm (XML do OpenStreetMap) ou .graphml.
+    """
+    extension = os.path.splitext(source)[1].lower()
+    if extension == '.graphml':
+        return ox.load_graphml(source, edge_dtypes={'weight': float})
+    if extension in ('.osm', '.xml'):
+        return ox.graph_from_xml(source)
+    raise ValueError(f"Formato de arquivo '{extension}' não suportado.")
+
+def load_graph(place: str, weight_type: str = 'none', network_type: str = 'drive',
+               cache_dir: str = None, offline: bool = False, source: str = None) -> nx.MultiDiGraph:
+    """
+    Carrega o grafo do local especificado com pesos definidos no atributo 'weight'.
+
+    Com ``cache_dir``, o grafo já ponderado é guardado em GraphML na primeira
+    execução e relido nas seguintes, sem acesso à rede.
+
+    Args:
+        place (str): Local para carregar o grafo.
+        weight_type (str): 'length', 'travel_time', etc.
+        network_type (str): Tipo de rede do OSMnx ('drive', 'walk', ...).
+        cache_dir (str): Diretório do cache (None desativa o cache).
+        offline (bool): Se True, nunca acessa a rede: usa o cache ou ``source``.
+        source (str): Arquivo local .osm ou .graphml usado no lugar do download.
+
+    Returns:
+        nx.MultiDiGraph: Grafo multiaresta com dados geográficos completos e atributo 'weight' definido.
+    """
+    path = None
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, cache_key(place, network_type, weight_type, source) + '.graphml')
+        if os.path.exists(path):
+            return ox.load_graphml(path, edge_dtypes={'weight': float})
+
+    if source:
+        G = _read_local(source)
+    elif offline:
+        raise FileNotFoundError(f"Grafo de '{place}' não está no cache e nenhum arquivo local foi informado.")
+    else:
+        G = ox.graph_from_place(place, network_type=network_type)
+
+    G = _set_weights(G, weight_type)
+    if path:
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        ox.save_graphml(G, tmp_path)
+        os.replace(tmp_path, path)
+    return G
+
+def load_csr(place: str, weight_type: str = 'none', network_type: str = 'drive',
+             cache_dir: str = None, offline: bool = False, source: str = None,
+             G: nx.MultiDiGraph = None, parallel: str = 'min') -> glib.CSRGraph:
+    """
+    Carrega o grafo do local já convertido para ``glib.CSRGraph``. Com
+    ``cache_dir``, o CSR fica salvo em binário (``CSRGraph.save``) e as
+    execuções seguintes o mapeiam em memória, sem download nem conversão.
+
+    Args:
+        place, weight_type, network_type, cache_dir, offline, source: Como em ``load_graph``.
+        G (nx.MultiDiGraph): Grafo já carregado, usado se o CSR não estiver no cache.
+        parallel (str): Tratamento das arestas paralelas, como em ``netx_to_csr``.
+
+    Returns:
+        glib.CSRGraph: Grafo compacto
+    """
+    path = None
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, f'{cache_key(place, network_type, weight_type, source)}.{parallel}.csr')
+        if os.path.exists(path):
+            return glib.CSRGraph.load(path)
+
+    if G is None:
+        G = load_graph(place, weight_type, network_type, cache_dir, offline, source)
+    csr = netx_to_csr(G, parallel)
+    if path:
+        csr.save(path)
+    return csr
+
 if __name__ == '__main__':
     weight_type = 'length'       # Altere conforme necessário
     directed = True              # True = DiGraph, False = Graph
@@ -0,0 +1,122 @@
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+import lib.graph_lib as glib
+
+def synthetic_street_network(n: int = 10_000,
+                             block: float = 100.0,
+                             jitter: float = 0.2,
+                             removal: float = 0.15,
+                             subdivide: float = 0.3,
+                             oneway: float = 0.2,
+                             seed: int = None,
+                             return_positions: bool = False):
+    """
+    Gera uma malha viária sintética parecida com as do OSM, já em
+    ``glib.CSRGraph`` e sem ``networkx``/``osmnx`` (vetorizado com NumPy,
+    viável até ~1M de vértices):
+
+    - cruzamentos em uma grade com posições perturbadas;
+    - uma fração das quadras fundidas (arestas removidas), o que cria ruas
+      sem saída e vértices de grau 2 e 3;
+    - ruas subdivididas em cadeias de 1 a 3 vértices intermediários de grau 2
+      (curvas), como os nós de geometria do OSM;
+    - comprimentos (m, com 3 casas) iguais à distância entre os cruzamentos
+      vezes um fator de sinuosidade log-normal, repartidos entre os trechos;
+    - uma fração de ruas de mão única (o grafo passa a ser dirigido).
+
+    Só a maior componente (fracamente) conexa é mantida, como no ``osmnx``.
+
+    Args:
+        n (int): Número aproximado de vértices
+        block (float): Lado médio da quadra (m)
+        jitter (float): Desvio padrão da perturbação dos cruzamentos, em quadras
+        removal (float): Fração das ruas da grade removidas
+        subdivide (float): Fração das ruas subdivididas em trechos
+        oneway (float): Fração das ruas de mão única (0 = grafo não dirigido)
+        seed (int): Semente do gerador
+        return_positions (bool): Se True, também retorna as coordenadas (m)
+
+    Returns:
+        glib.CSRGraph: Grafo com vértices 0..n'-1 e pesos em 'weight'
+        tuple (glib.CSRGraph, np.ndarray): Com ``return_positions``, também
+            as coordenadas (n' x 2) de cada vértice
+    """
+    rng = np.random.default_rng(seed)
+
+    # Cada rua mantida ganha em média 2 vértices intermediários com
+    # probabilidade ``subdivide``; há ~2 ruas por cruzamento
+    side = max(2, int(round((n / (1 + 4 * (1 - removal) * subdivide)) ** 0.5)))
+    crossings = side * side
+    grid = np.indices((side, side)).reshape(2, -1).T.astype(np.float64)
+    positions = (grid + rng.normal(0.0, jitter, grid.shape)) * block
+
+    ids = np.arange(crossings).reshape(side, side)
+    u = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    v = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    keep = rng.random(u.size) >= removal
+    u, v = u[keep], v[keep]
+    streets = u.size
+
+    # Comprimento de cada rua e divisão em trechos
+    straight = np.linalg.norm(positions[u] - positions[v], axis=1)
+    length = straight * np.maximum(1.0, rng.lognormal(np.log(1.05), 0.08, streets))
+    extra = np.where(rng.random(streets) < subdivide, rng.integers(1, 4, streets), 0)
+    segments = extra + 1
+
+    street_of = np.repeat(np.arange(streets), segments)
+    first = np.cumsum(segments) - segments
+    position = np.arange(street_of.size) - first[street_of]
+    new_first = crossings + np.cumsum(extra) - extra
+    tails = np.where(position == 0, u[street_of], new_first[street_of] + position - 1)
+    heads = np.where(position == segments[street_of] - 1, v[street_of], new_first[street_of] + position)
+
+    share = rng.uniform(0.5, 1.5, street_of.size)
+    share /= np.bincount(street_of, weights=share)[street_of]
+    weights = np.round(length[street_of] * share, 3)
+
+    # Vértices intermediários ao longo do segmento reto entre os cruzamentos
+    total = crossings + int(extra.sum())
+    inner = position[position > 0]
+    inner_street = street_of[position > 0]
+    fraction = (inner / segments[inner_street])[:, None]
+    positions = np.vstack([
+        positions,
+        positions[u[inner_street]] * (1 - fraction) + positions[v[inner_street]] * fraction
+    ])
+
+    # Mão única: toda a cadeia da rua segue o mesmo sentido (sorteado)
+    is_oneway = (rng.random(streets) < oneway)[street_of]
+    flip = (rng.random(streets) < 0.5)[street_of]
+    tails, heads = np.where(flip & is_oneway, heads, tails), np.where(flip & is_oneway, tails, heads)
+    twoway = ~is_oneway
+    tails, heads = np.concatenate([tails, heads[twoway]]), np.concatenate([heads, tails[twoway]])
+    weights = np.concatenate([weights, weights[twoway]])
+
+    # Maior componente fracamente conexa, renumerada de 0 a n'-1
+    adjacency = sparse.csr_matrix((np.ones(tails.size), (tails, heads)), shape=(total, total))
+    _, component = csgraph.connected_components(adjacency, directed=True, connection='weak')
+    largest = np.argmax(np.bincount(component))
+    alive = component == largest
+    relabel = np.cumsum(alive) - 1
+    arcs = alive[tails]
+    tails, heads, weights = relabel[tails[arcs]], relabel[heads[arcs]], weights[arcs]
+    positions = positions[alive]
+    size = positions.shape[0]
+
+    order = np.lexsort((heads, tails))
+    tails, heads, weights = tails[order], heads[order], weights[order]
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=size), out=indptr[1:])
+
+    graph = glib.CSRGraph(
+        glib._to_array('q', indptr),
+        glib._to_array('i' if size < 2 ** 31 else 'q', heads),
+        glib._to_array('d', weights),
+        range(size),
+        is_directed=oneway > 0
+    )
+    if return_positions:
+        return graph, positions
+    return graph
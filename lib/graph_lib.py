@@ -1,7 +1,54 @@
+import hashlib
 import heapq
-from collections import defaultdict
+import json
+import math
+import mmap
+import multiprocessing
+import os
+import pickle
+import random
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from itertools import islice
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
+
+# Versão dos resultados guardados em cache (centralidades e grafos
+# convertidos): incrementar sempre que um algoritmo ou uma conversão passar a
+# produzir valores diferentes, mesmo sem mudar ``__version__``
+CACHE_VERSION = 2
+
+_UNSET = object()
+
+# Formato binário do CSRGraph.save: magic, versão do formato e tamanho do cabeçalho JSON
+_CSR_MAGIC = b'CSRG'
+_CSR_FORMAT = 1
+_CSR_PREAMBLE = struct.Struct('<4sII')
+
+def _typecode(buffer) -> str:
+   """
+   Tipo dos itens de um buffer (``array`` ou ``memoryview`` mapeado do disco).
+   """
+   return buffer.typecode if isinstance(buffer, array) else buffer.format
+
+def _padding(offset: int) -> int:
+   return -offset % 8
+
+def _to_array(typecode: str, values) -> array:
+   """
+   Copia um array do NumPy para um ``array`` do tipo ``typecode`` (o formato
+   dos buffers do CSRGraph), sem importar o NumPy neste módulo.
+   """
+   buffer = array(typecode)
+   buffer.frombytes(values.astype(typecode, copy=False).tobytes())
+   return buffer
 
 class Graph:
    def __init__(self, is_directed=False):
@@ -10,6 +57,44 @@ class Graph:
       """
       self._adjacency_list = defaultdict(dict)
       self._is_directed = is_directed
+      # Índice reverso (antecessores de cada vértice), só para grafos dirigidos:
+      # nos não dirigidos a própria adjacência já é simétrica
+      self._predecessors = defaultdict(set) if is_directed else None
+
+   @classmethod
+   def from_edges(cls, nodes, edges, is_directed=False, parallel='last'):
+      """
+      Constrói o grafo em uma única passada pelas arestas, sem o custo de
+      ``add_edge`` por aresta.
+
+      Args:
+         nodes (iterable): Vértices (a ordem é preservada).
+         edges (iterable): Tuplas (u, v, weight).
+         is_directed (bool): Se False, adiciona também v->u.
+         parallel (str): Arestas repetidas: 'last' (a última sobrescreve,
+            como em ``add_edge``) ou 'min' (fica a de menor peso).
+
+      Returns:
+         Graph: Grafo do graph_lib.
+      """
+      if parallel not in ('last', 'min'):
+         raise ValueError(f"Tratamento de arestas paralelas '{parallel}' não suportado.")
+      graph = cls(is_directed)
+      adjacency = graph._adjacency_list
+      for node in nodes:
+         adjacency[node] = {}
+
+      keep_min = parallel == 'min'
+      for u, v, weight in edges:
+         neighbors = adjacency[u]
+         if keep_min and v in neighbors and neighbors[v]['weight'] <= weight:
+            continue
+         neighbors[v] = {'weight': weight}
+         if is_directed:
+            graph._predecessors[v].add(u)
+         else:
+            adjacency[v][u] = {'weight': weight}
+      return graph
 
    def add_node(self, node):
       """
@@ -23,14 +108,27 @@ class Graph:
       
    def remove_node(self, node):
       """
-      Remove um vértice do grafo.
+      Remove um vértice do grafo, visitando só os seus vizinhos (e, se o
+      grafo for dirigido, os seus antecessores pelo índice reverso).
 
       Args:
          node (hashable): Vértice a ser removido.
       """
-      self._adjacency_list.pop(node, None)
-      for neighbors in self._adjacency_list.values():
-         neighbors.pop(node, None)
+      neighbors = self._adjacency_list.pop(node, None)
+      if neighbors is None:
+         return
+
+      if self._is_directed:
+         for u in self._predecessors.pop(node, ()):
+            if u != node:
+               self._adjacency_list[u].pop(node, None)
+         for v in neighbors:
+            if v != node:
+               self._predecessors[v].discard(node)
+      else:
+         for v in neighbors:
+            if v != node:
+               self._adjacency_list[v].pop(node, None)
 
    def add_edge(self, node1, node2, weight=1.0):
       """ 
@@ -45,7 +143,9 @@ class Graph:
       self.add_node(node2)
 
       self._adjacency_list[node1][node2] = {'weight': weight}
-      if not self._is_directed:
+      if self._is_directed:
+         self._predecessors[node2].add(node1)
+      else:
          self._adjacency_list[node2][node1] = {'weight': weight}
 
    def nodes(self) -> list:
@@ -89,87 +189,2959 @@ class Graph:
       """
       return self._adjacency_list[node]
 
-   
-def djikstra(graph, start):
-   """
-   Encontra menores caminhos em grafo ponderado usando o algoritmo de Dijkstra
 
-   Args:
-       graph (Graph): Grafo
-       start (str): Vértice de partida
+class GraphView(Graph):
+   """
+   Visão somente leitura de um ``Graph`` com vértices ocultos.
 
-   Returns:
-       orders (list): Lista com a ordem de visitação (vértices conforme são 'finalizados')
-       predecessors (dict): Dicionário onde cada vértice aponta para lista de antecessores em caminhos mínimos
-       paths (dict): Dicionário com o número de caminhos mínimos de start até cada vértice
+   Compartilha o dict-of-dicts do grafo original (nada é copiado) e filtra os
+   vértices ocultos a cada acesso.
    """
-   
-   distances = {}
-   predecessors = {}
-   paths = {}
+   def __init__(self, graph, removed=()):
+      """
+      Args:
+         graph (Graph | GraphView): Grafo original (ou outra visão dele).
+         removed (iterable): Vértices a ocultar.
+      """
+      hidden = set(removed)
+      if isinstance(graph, GraphView):
+         hidden |= graph._hidden
+         graph = graph._graph
 
-   for node in graph.nodes():
-      distances[node] = float('inf')
-      predecessors[node] = []
-      paths[node] = 0
+      self._graph = graph
+      self._is_directed = graph.is_directed()
+      self._hidden = frozenset(node for node in hidden if node in graph._adjacency_list)
 
-   distances[start] = 0
-   paths[start] = 1
+   def add_node(self, node):
+      raise TypeError("GraphView é somente leitura.")
 
-   orders = []
-   visited = set()
+   def add_edge(self, node1, node2, weight=1.0):
+      raise TypeError("GraphView é somente leitura.")
 
-   heap = [(0, start)]
+   def remove_node(self, node):
+      """
+      Oculta o vértice ``node`` nesta visão (o grafo original não muda).
 
-   while heap:
-      dist_u, u = heapq.heappop(heap)
-      if dist_u > distances[u]:
-         continue
+      Args:
+         node (hashable): Vértice a ser removido.
+      """
+      if node in self._graph._adjacency_list:
+         self._hidden = self._hidden | {node}
 
-      if u not in visited:
-         orders.append(u)
-         visited.add(u)
+   def nodes(self) -> list:
+      """
+      Returns:
+         list: lista dos vértices visíveis.
+      """
+      hidden = self._hidden
+      return [node for node in self._graph._adjacency_list if node not in hidden]
 
-      for v, attrs in graph[u].items():
-         w = attrs['weight']
-         alt = distances[u] + w
+   def edges(self) -> list:
+      """
+      Returns:
+         list of tuples (u, v, attrs): arestas entre vértices visíveis.
+      """
+      hidden = self._hidden
+      return [
+         (u, v, attrs)
+         for u, neighbors in self._graph._adjacency_list.items() if u not in hidden
+         for v, attrs in neighbors.items() if v not in hidden
+      ]
 
-         if alt < distances[v]:
-               distances[v] = alt
-               predecessors[v] = [u]
-               paths[v] = paths[u]
-               heapq.heappush(heap, (alt, v))
-         elif alt == distances[v]:
-               predecessors[v].append(u)
-               paths[v] += paths[u]
+   def size(self) -> int:
+      """
+      Returns:
+         int: número de vértices visíveis.
+      """
+      return len(self._graph._adjacency_list) - len(self._hidden)
 
-   return orders, predecessors, paths
+   def __getitem__(self, node) -> dict:
+      """
+      Returns:
+         dict: vizinhos visíveis de ``node`` com seus atributos.
+      """
+      if node in self._hidden:
+         raise KeyError(node)
+      hidden = self._hidden
+      # .get em vez de self._graph[node]: o defaultdict do original criaria
+      # uma entrada vazia para um vértice ausente
+      neighbors = self._graph._adjacency_list.get(node, {})
+      return {v: attrs for v, attrs in neighbors.items() if v not in hidden}
 
-def brandes(graph):
+
+class CSRGraph:
    """
-   Algoritmo de Brandes para grafos ponderados
+   Grafo imutável em formato CSR (compressed sparse row).
 
-   Args:
-       graph (Graph): Grafo
+   Os vértices são numerados de 0 a n-1 e as arestas de saída do vértice ``i``
+   ocupam as posições ``indptr[i]:indptr[i+1]`` dos buffers ``indices``
+   (destinos) e ``weights`` (pesos). O rótulo original de cada vértice é
+   mantido em ``labels`` e o caminho inverso (rótulo -> id) em ``index``.
+   """
+   __slots__ = (
+      '_indptr', '_indices', '_weights', '_labels', '_index', '_is_directed',
+      '_uniform', '_tails', '_reverse', '_fingerprint'
+   )
 
-   Returns:
-       centrality (dict): Dicionário com a centralidade de cada vértice
+   def __init__(self, indptr, indices, weights, labels, is_directed=False):
+      """
+      Monta o grafo a partir dos buffers já prontos (sem cópia).
+
+      Args:
+         indptr (array): Offsets de cada vértice (tamanho n+1).
+         indices (array): Destino de cada aresta (tamanho m).
+         weights (array): Peso de cada aresta (tamanho m).
+         labels (sequence): Rótulo de cada vértice (tamanho n).
+         is_directed (bool): Se o grafo é dirigido.
+      """
+      self._indptr = indptr
+      self._indices = indices
+      self._weights = weights
+      self._labels = tuple(labels)
+      self._index = {label: i for i, label in enumerate(self._labels)}
+      self._is_directed = is_directed
+      self._uniform = _UNSET
+      self._tails = None
+      self._reverse = None
+      self._fingerprint = None
+
+   @classmethod
+   def from_edges(cls, nodes, edges, is_directed=False):
+      """
+      Constrói o grafo a partir de uma lista de vértices e de arestas.
+
+      Arestas repetidas sobrescrevem a anterior, como em ``Graph.add_edge``.
+
+      Args:
+         nodes (iterable): Vértices (a ordem define os ids).
+         edges (iterable): Tuplas (u, v, weight).
+         is_directed (bool): Se False, adiciona também v->u.
+
+      Returns:
+         CSRGraph: Grafo compacto.
+      """
+      adjacency = {node: {} for node in nodes}
+      for u, v, weight in edges:
+         adjacency.setdefault(u, {})
+         adjacency.setdefault(v, {})
+         adjacency[u][v] = weight
+         if not is_directed:
+            adjacency[v][u] = weight
+      return cls._from_adjacency(adjacency, is_directed)
+
+   @classmethod
+   def from_graph(cls, graph):
+      """
+      Converte um ``Graph`` (dict-of-dicts) para CSR, preservando a ordem dos
+      vértices e das vizinhanças.
+
+      Args:
+         graph (Graph): Grafo do graph_lib.
+
+      Returns:
+         CSRGraph: Grafo compacto.
+      """
+      adjacency = {
+         u: {v: attrs['weight'] for v, attrs in graph[u].items()}
+         for u in graph.nodes()
+      }
+      return cls._from_adjacency(adjacency, graph.is_directed())
+
+   @classmethod
+   def _from_adjacency(cls, adjacency, is_directed):
+      labels = list(adjacency.keys())
+      index = {label: i for i, label in enumerate(labels)}
+      n = len(labels)
+      id_type = 'i' if n < 2 ** 31 else 'q'
+
+      indptr = array('q', [0])
+      indices = array(id_type)
+      weights = array('d')
+      for u in labels:
+         neighbors = adjacency[u]
+         indices.extend(index[v] for v in neighbors)
+         weights.extend(neighbors.values())
+         indptr.append(len(indices))
+
+      return cls(indptr, indices, weights, labels, is_directed)
+
+   @property
+   def indptr(self):
+      return self._indptr
+
+   @property
+   def indices(self):
+      return self._indices
+
+   @property
+   def weights(self):
+      return self._weights
+
+   @property
+   def tails(self):
+      """
+      Returns:
+         array: vértice de origem de cada aresta (calculado uma vez, sob demanda).
+      """
+      if self._tails is None:
+         indptr = self._indptr
+         tails = array(_typecode(self._indices))
+         for u in range(len(indptr) - 1):
+            tails.extend([u] * (indptr[u + 1] - indptr[u]))
+         self._tails = tails
+      return self._tails
+
+   def reverse_index(self):
+      """
+      Índice das arestas de entrada: as arestas que chegam ao vértice ``v``
+      são ``edge_ids[rptr[v]:rptr[v+1]]`` (calculado uma vez, sob demanda).
+
+      Returns:
+         tuple (array, array): rptr (tamanho n+1) e edge_ids (tamanho m).
+      """
+      if self._reverse is None:
+         n = len(self._labels)
+         indices = self._indices
+         counts = [0] * (n + 1)
+         for v in indices:
+            counts[v + 1] += 1
+         for v in range(n):
+            counts[v + 1] += counts[v]
+
+         rptr = array('q', counts)
+         position = counts[:-1]
+         edge_ids = array('q', bytes(8 * len(indices)))
+         for e, v in enumerate(indices):
+            edge_ids[position[v]] = e
+            position[v] += 1
+         self._reverse = (rptr, edge_ids)
+      return self._reverse
+
+   def adjacency(self) -> list:
+      """
+      Listas de adjacência com tuplas (aresta, destino, peso) de cada id.
+      Percorrê-las é mais rápido do que indexar os três buffers a cada aresta
+      nos laços do Dijkstra e da BFS, ao custo de objetos Python por aresta (cerca de
+      4x a memória do próprio CSR). Por isso não são guardadas no grafo: quem
+      roda várias buscas monta as listas uma vez e as repassa (parâmetro
+      ``adjacency`` de ``_csr_dijkstra``), e elas são liberadas ao final.
+
+      Returns:
+         list: para cada id, a lista de tuplas de suas arestas de saída.
+      """
+      indptr, indices, weights = self._indptr, self._indices, self._weights
+      return [
+         list(zip(range(indptr[u], indptr[u + 1]), indices[indptr[u]:indptr[u + 1]],
+                  weights[indptr[u]:indptr[u + 1]]))
+         for u in range(len(indptr) - 1)
+      ]
+
+   def reversed(self):
+      """
+      Cria o grafo transposto (u->v vira v->u).
+
+      Returns:
+         tuple (CSRGraph, array): grafo transposto e, para cada aresta dele, o
+         id da aresta correspondente no grafo original.
+      """
+      rptr, edge_ids = self.reverse_index()
+      tails = self.tails
+      indices = array(_typecode(self._indices), (tails[e] for e in edge_ids))
+      weights = array('d', (self._weights[e] for e in edge_ids))
+      return CSRGraph(rptr, indices, weights, self._labels, self._is_directed), edge_ids
+
+   @property
+   def labels(self) -> tuple:
+      """
+      Returns:
+         tuple: rótulo de cada id de vértice.
+      """
+      return self._labels
+
+   def id_of(self, node) -> int:
+      """
+      Returns:
+         int: id interno do vértice ``node``.
+      """
+      return self._index[node]
+
+   def label_of(self, i: int):
+      """
+      Returns:
+         hashable: rótulo original do vértice de id ``i``.
+      """
+      return self._labels[i]
+
+   def nodes(self) -> list:
+      """
+      Returns:
+         list: lista de todos os vértices (rótulos originais).
+      """
+      return list(self._labels)
+
+   def edges(self) -> list:
+      """
+      Returns:
+         list of tuples (u, v, attrs): arestas com atributos, como em ``Graph.edges``.
+      """
+      labels, indptr, indices, weights = self._labels, self._indptr, self._indices, self._weights
+      return [
+         (labels[u], labels[indices[e]], {'weight': weights[e]})
+         for u in range(len(labels))
+         for e in range(indptr[u], indptr[u + 1])
+      ]
+
+   def is_directed(self) -> bool:
+      """
+      Returns:
+         bool: True se o grafo for dirigido, False se for não dirigido.
+      """
+      return self._is_directed
+
+   def size(self) -> int:
+      """
+      Returns:
+         int: número de vértices.
+      """
+      return len(self._labels)
+
+   def number_of_edges(self) -> int:
+      """
+      Returns:
+         int: número de arcos armazenados (arestas não dirigidas contam duas vezes).
+      """
+      return len(self._indices)
+
+   def degree(self, i: int) -> int:
+      """
+      Returns:
+         int: grau de saída do vértice de id ``i``.
+      """
+      return self._indptr[i + 1] - self._indptr[i]
+
+   def neighbors(self, i: int):
+      """
+      Returns:
+         iterator of (int, float): pares (id do vizinho, peso) do vértice de id ``i``.
+      """
+      start, end = self._indptr[i], self._indptr[i + 1]
+      return zip(self._indices[start:end], self._weights[start:end])
+
+   def without_nodes(self, nodes) -> 'CSRGraph':
+      """
+      Cria um novo CSR sem os vértices informados (e suas arestas).
+
+      Args:
+         nodes (iterable): Rótulos dos vértices a remover.
+
+      Returns:
+         CSRGraph: Grafo resultante, com ids renumerados.
+      """
+      removed = {self._index[node] for node in nodes if node in self._index}
+      labels = self._labels
+      adjacency = {}
+      for u in range(len(labels)):
+         if u in removed:
+            continue
+         adjacency[labels[u]] = {
+            labels[v]: w for v, w in self.neighbors(u) if v not in removed
+         }
+      return CSRGraph._from_adjacency(adjacency, self._is_directed)
+
+   def uniform_weight(self):
+      """
+      Returns:
+         float | None: o peso comum a todas as arestas, ou None se os pesos variam.
+      """
+      if self._uniform is _UNSET:
+         weights = self._weights
+         first = weights[0] if len(weights) else 1.0
+         self._uniform = first if all(w == first for w in weights) else None
+      return self._uniform
+
+   def save(self, path):
+      """
+      Salva o grafo em formato binário compacto: um cabeçalho JSON seguido
+      dos buffers crus (indptr, indices, weights) e da tabela de rótulos,
+      alinhados em 8 bytes, para que ``load`` possa mapeá-los sem cópia.
+
+      A escrita é atômica (arquivo temporário + rename).
+
+      Args:
+         path (str): Caminho do arquivo.
+      """
+      labels = self._labels
+      int_labels = all(type(label) is int for label in labels) and all(
+         -2 ** 63 <= label < 2 ** 63 for label in labels
+      )
+      label_bytes = array('q', labels).tobytes() if int_labels else pickle.dumps(labels)
+      header = json.dumps({
+         'n': len(labels),
+         'm': len(self._indices),
+         'directed': self._is_directed,
+         'index_type': _typecode(self._indices),
+         'labels': 'int' if int_labels else 'pickle',
+         'label_bytes': len(label_bytes),
+         'byteorder': sys.byteorder,
+      }).encode()
+
+      sections = [
+         memoryview(self._indptr).cast('B'),
+         memoryview(self._indices).cast('B'),
+         memoryview(self._weights).cast('B'),
+         label_bytes,
+      ]
+      tmp_path = f'{path}.{os.getpid()}.tmp'
+      with open(tmp_path, 'wb') as file:
+         file.write(_CSR_PREAMBLE.pack(_CSR_MAGIC, _CSR_FORMAT, len(header)))
+         file.write(header)
+         offset = _CSR_PREAMBLE.size + len(header)
+         for section in sections:
+            file.write(bytes(_padding(offset)))
+            offset += _padding(offset)
+            file.write(section)
+            offset += len(section)
+      os.replace(tmp_path, path)
+
+   @classmethod
+   def load(cls, path, use_mmap=True):
+      """
+      Carrega um grafo salvo por ``save``. Com ``use_mmap`` os buffers são
+      ``memoryview`` sobre o arquivo mapeado em memória (somente leitura): o
+      sistema carrega as páginas sob demanda e as compartilha entre processos.
+
+      Args:
+         path (str): Caminho do arquivo.
+         use_mmap (bool): Se False, lê os buffers para arrays em memória.
+
+      Returns:
+         CSRGraph: Grafo carregado.
+      """
+      with open(path, 'rb') as file:
+         if use_mmap:
+            data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+         else:
+            data = memoryview(file.read())
+
+      magic, version, header_size = _CSR_PREAMBLE.unpack_from(data)
+      if magic != _CSR_MAGIC or version != _CSR_FORMAT:
+         raise ValueError(f"Arquivo '{path}' não é um CSRGraph (formato {version}) suportado.")
+      offset = _CSR_PREAMBLE.size
+      header = json.loads(bytes(data[offset:offset + header_size]))
+      offset += header_size
+      if header['byteorder'] != sys.byteorder:
+         raise ValueError(f"Ordem de bytes '{header['byteorder']}' não suportada.")
+
+      n, m = header['n'], header['m']
+      buffers = []
+      for typecode, count in (('q', n + 1), (header['index_type'], m), ('d', m)):
+         offset += _padding(offset)
+         size = struct.calcsize(typecode) * count
+         buffer = data[offset:offset + size].cast(typecode)
+         buffers.append(buffer if use_mmap else array(typecode, buffer))
+         offset += size
+
+      offset += _padding(offset)
+      label_bytes = data[offset:offset + header['label_bytes']]
+      if header['labels'] == 'int':
+         labels = label_bytes.cast('q').tolist()
+      else:
+         labels = pickle.loads(label_bytes)
+
+      return cls(*buffers, labels, header['directed'])
+
+   def fingerprint(self) -> str:
+      """
+      Impressão digital do grafo (estrutura, pesos, rótulos e direção),
+      calculada uma vez: grafos iguais têm a mesma, qualquer mudança a altera.
+
+      Returns:
+         str: sha256 em hexadecimal
+      """
+      if self._fingerprint is None:
+         digest = hashlib.sha256()
+         digest.update(b'directed' if self._is_directed else b'undirected')
+         for buffer in (self._indptr, self._indices, self._weights):
+            digest.update(_typecode(buffer).encode())
+            digest.update(memoryview(buffer).cast('B'))
+         digest.update(repr(self._labels).encode())
+         self._fingerprint = digest.hexdigest()
+      return self._fingerprint
+
+   def __reduce__(self):
+      # Buffers mapeados (memoryview) não são serializáveis: envia cópias em array
+      buffers = (
+         buffer if isinstance(buffer, array) else array(_typecode(buffer), buffer)
+         for buffer in (self._indptr, self._indices, self._weights)
+      )
+      return (CSRGraph, (*buffers, self._labels, self._is_directed))
+
+   def nbytes(self) -> int:
+      """
+      Returns:
+         int: memória aproximada (bytes) usada pelos buffers e pelo mapeamento de rótulos.
+      """
+      buffers = sum(
+         buffer.itemsize * len(buffer)
+         for buffer in (self._indptr, self._indices, self._weights)
+      )
+      return buffers + sys.getsizeof(self._labels) + sys.getsizeof(self._index)
+
+   def __getitem__(self, node) -> dict:
+      """
+      Permite usar G[u][v]['weight'] como em ``Graph`` (monta o dict sob demanda).
+
+      Returns:
+         dict: vizinhos de ``node`` com seus atributos.
+      """
+      labels = self._labels
+      return {labels[v]: {'weight': w} for v, w in self.neighbors(self._index[node])}
+
+
+class CSRView:
    """
-   centrality = {v: 0 for v in graph.nodes()}
-   
-   for s in graph.nodes():
-      orders, predecessors, paths = djikstra(graph, s)
-      
-      contribution = {v: 0 for v in graph.nodes()}
-      while orders:
-         w = orders.pop()
-         
-         for v in predecessors[w]:
-            contribution[v] += (paths[v]/paths[w]) * (1 + contribution[w])
-         if w != s:
-            centrality[w] += contribution[w]
-            
-   return centrality
+   Visão de um ``CSRGraph`` com vértices ocultos, sem copiar os buffers.
+
+   Guarda só duas máscaras (n + m bytes): vértices visíveis e arestas ativas
+   (as que não tocam vértice oculto). Os motores de ``brandes``,
+   ``simulate_SIR`` e afins percorrem o CSR original pulando as arestas
+   inativas; as demais funções recebem uma cópia compacta via ``as_csr``.
+   """
+   __slots__ = ('_csr', '_node_alive', '_edge_alive')
+
+   def __init__(self, graph, removed=()):
+      """
+      Args:
+         graph (CSRGraph | CSRView): Grafo original (ou outra visão dele).
+         removed (iterable): Rótulos dos vértices a ocultar.
+      """
+      if isinstance(graph, CSRView):
+         self._csr = graph.csr
+         self._node_alive = bytearray(graph.node_alive)
+         self._edge_alive = bytearray(graph.edge_alive)
+      else:
+         self._csr = graph
+         self._node_alive = bytearray(b'\x01') * graph.size()
+         self._edge_alive = bytearray(b'\x01') * graph.number_of_edges()
+
+      for node in removed:
+         self._hide(node)
+
+   def _hide(self, node):
+      csr = self._csr
+      if node not in csr._index:
+         return
+      x = csr.id_of(node)
+      if not self._node_alive[x]:
+         return
 
-def degree_centrality(graph: Graph) -> dict:
-   return {v: len(graph[v]) for v in graph.nodes()}
\ No newline at end of file
+      self._node_alive[x] = 0
+      edge_alive = self._edge_alive
+      for e in range(csr.indptr[x], csr.indptr[x + 1]):
+         edge_alive[e] = 0
+      rptr, edge_ids = csr.reverse_index()
+      for e in edge_ids[rptr[x]:rptr[x + 1]]:
+         edge_alive[e] = 0
+
+   @property
+   def csr(self) -> CSRGraph:
+      return self._csr
+
+   @property
+   def node_alive(self) -> bytearray:
+      return self._node_alive
+
+   @property
+   def edge_alive(self) -> bytearray:
+      return self._edge_alive
+
+   def node_ids(self) -> list:
+      """
+      Returns:
+         list: ids (no CSR original) dos vértices visíveis.
+      """
+      return [i for i, alive in enumerate(self._node_alive) if alive]
+
+   def id_of(self, node) -> int:
+      return self._csr.id_of(node)
+
+   def label_of(self, i: int):
+      return self._csr.label_of(i)
+
+   def nodes(self) -> list:
+      """
+      Returns:
+         list: lista dos vértices visíveis (rótulos originais).
+      """
+      labels = self._csr.labels
+      return [labels[i] for i in self.node_ids()]
+
+   def edges(self) -> list:
+      """
+      Returns:
+         list of tuples (u, v, attrs): arestas ativas, como em ``Graph.edges``.
+      """
+      csr, edge_alive = self._csr, self._edge_alive
+      labels, indptr, indices, weights = csr.labels, csr.indptr, csr.indices, csr.weights
+      return [
+         (labels[u], labels[indices[e]], {'weight': weights[e]})
+         for u in self.node_ids()
+         for e in range(indptr[u], indptr[u + 1]) if edge_alive[e]
+      ]
+
+   def is_directed(self) -> bool:
+      return self._csr.is_directed()
+
+   def size(self) -> int:
+      """
+      Returns:
+         int: número de vértices visíveis.
+      """
+      return sum(self._node_alive)
+
+   def number_of_edges(self) -> int:
+      """
+      Returns:
+         int: número de arcos ativos.
+      """
+      return sum(self._edge_alive)
+
+   def degree(self, i: int) -> int:
+      """
+      Returns:
+         int: grau de saída (arestas ativas) do vértice de id ``i``.
+      """
+      indptr, edge_alive = self._csr.indptr, self._edge_alive
+      return sum(edge_alive[indptr[i]:indptr[i + 1]])
+
+   def neighbors(self, i: int):
+      """
+      Returns:
+         iterator of (int, float): pares (id do vizinho, peso) pelas arestas ativas.
+      """
+      csr, edge_alive = self._csr, self._edge_alive
+      return (
+         (csr.indices[e], csr.weights[e])
+         for e in range(csr.indptr[i], csr.indptr[i + 1]) if edge_alive[e]
+      )
+
+   def fingerprint(self) -> str:
+      """
+      Returns:
+         str: sha256 do grafo original combinado com a máscara de vértices visíveis.
+      """
+      digest = hashlib.sha256(self._csr.fingerprint().encode())
+      digest.update(self._node_alive)
+      return digest.hexdigest()
+
+   def without_nodes(self, nodes) -> 'CSRView':
+      """
+      Returns:
+         CSRView: nova visão que oculta também ``nodes``.
+      """
+      return CSRView(self, nodes)
+
+   def materialize(self) -> CSRGraph:
+      """
+      Returns:
+         CSRGraph: cópia compacta só com os vértices visíveis (ids renumerados).
+      """
+      labels = self._csr.labels
+      return self._csr.without_nodes(labels[i] for i, alive in enumerate(self._node_alive) if not alive)
+
+   def __getitem__(self, node) -> dict:
+      """
+      Returns:
+         dict: vizinhos visíveis de ``node`` com seus atributos.
+      """
+      i = self._csr.id_of(node)
+      if not self._node_alive[i]:
+         raise KeyError(node)
+      labels = self._csr.labels
+      return {labels[v]: {'weight': w} for v, w in self.neighbors(i)}
+
+
+def as_csr(graph) -> CSRGraph:
+   """
+   Retorna a representação CSR de um grafo.
+
+   Args:
+      graph (Graph | CSRGraph | CSRView): Grafo
+
+   Returns:
+      CSRGraph: O próprio grafo, se já for CSR, ou uma conversão dele.
+   """
+   if isinstance(graph, CSRGraph):
+      return graph
+   if isinstance(graph, CSRView):
+      return graph.materialize()
+   return CSRGraph.from_graph(graph)
+
+def fingerprint(graph) -> str:
+   """
+   Impressão digital de qualquer grafo do graph_lib (ver ``CSRGraph.fingerprint``).
+
+   Args:
+      graph (Graph | CSRGraph | CSRView): Grafo
+
+   Returns:
+      str: sha256 em hexadecimal
+   """
+   if isinstance(graph, CSRView):
+      return graph.fingerprint()
+   return as_csr(graph).fingerprint()
+
+def unwrap(graph):
+   """
+   Separa um grafo no CSR sobre o qual os motores trabalham e nas máscaras
+   de uma eventual visão (``CSRView``), sem copiar os buffers.
+
+   Args:
+      graph (Graph | CSRGraph | CSRView): Grafo
+
+   Returns:
+      tuple: (csr, ids dos vértices visíveis, máscara de arestas ativas ou None)
+   """
+   if isinstance(graph, CSRView):
+      return graph.csr, graph.node_ids(), graph.edge_alive
+   csr = as_csr(graph)
+   return csr, range(csr.size()), None
+
+   
+def djikstra(graph, start):
+   """
+   Encontra menores caminhos em grafo ponderado usando o algoritmo de Dijkstra
+
+   Args:
+       graph (Graph): Grafo
+       start (str): Vértice de partida
+
+   Returns:
+       orders (list): Lista com a ordem de visitação (vértices conforme são 'finalizados')
+       predecessors (dict): Dicionário onde cada vértice aponta para lista de antecessores em caminhos mínimos
+       paths (dict): Dicionário com o número de caminhos mínimos de start até cada vértice
+   """
+   
+   distances = {}
+   predecessors = {}
+   paths = {}
+
+   for node in graph.nodes():
+      distances[node] = float('inf')
+      predecessors[node] = []
+      paths[node] = 0
+
+   distances[start] = 0
+   paths[start] = 1
+
+   orders = []
+   visited = set()
+
+   heap = [(0, start)]
+
+   while heap:
+      dist_u, u = heapq.heappop(heap)
+      if dist_u > distances[u]:
+         continue
+
+      if u not in visited:
+         orders.append(u)
+         visited.add(u)
+
+      for v, attrs in graph[u].items():
+         w = attrs['weight']
+         alt = distances[u] + w
+
+         if alt < distances[v]:
+               distances[v] = alt
+               predecessors[v] = [u]
+               paths[v] = paths[u]
+               heapq.heappush(heap, (alt, v))
+         elif alt == distances[v]:
+               predecessors[v].append(u)
+               paths[v] += paths[u]
+
+   return orders, predecessors, paths
+
+def _csr_dijkstra(csr, start, alive=None, adjacency=None):
+   """
+   Dijkstra sobre ids inteiros de um CSRGraph (mesma semântica de ``djikstra``).
+
+   Args:
+      csr (CSRGraph): Grafo
+      start (int): Id de partida
+      alive (bytearray): Máscara de arestas ativas (None = todas)
+      adjacency (list): ``csr.adjacency()`` já montada, para reaproveitá-la
+         entre várias fontes (None = monta só para esta busca)
+
+   Returns:
+      orders (list): Ids na ordem em que são finalizados
+      predecessors (list): Arestas (ids) que chegam a cada id por caminhos mínimos (None se inalcançável)
+      paths (list): Número de caminhos mínimos de start até cada id
+   """
+   if adjacency is None:
+      adjacency = csr.adjacency()
+   n = len(adjacency)
+   heappush, heappop = heapq.heappush, heapq.heappop
+
+   distances = [math.inf] * n
+   predecessors = [None] * n
+   paths = [0] * n
+
+   distances[start] = 0
+   predecessors[start] = []
+   paths[start] = 1
+
+   orders = []
+   heap = [(0, start)]
+
+   while heap:
+      dist_u, u = heappop(heap)
+      # Entrada obsoleta: u já foi finalizado com distância menor
+      if dist_u > distances[u]:
+         continue
+      orders.append(u)
+
+      paths_u = paths[u]
+      for e, v, w in adjacency[u]:
+         if alive is not None and not alive[e]:
+            continue
+         alt = dist_u + w
+         dist_v = distances[v]
+
+         if alt < dist_v:
+            distances[v] = alt
+            predecessors[v] = [e]
+            paths[v] = paths_u
+            heappush(heap, (alt, v))
+         elif alt == dist_v:
+            predecessors[v].append(e)
+            paths[v] += paths_u
+
+   return orders, predecessors, paths
+
+def _shortest_path_tree(csr, start, weighted=True, alive=None, target=None):
+   """
+   Árvore de caminhos mínimos a partir de ``start``. Usa dicionários em vez
+   de listas de tamanho n, de modo que uma consulta com ``target`` que
+   termina cedo custa apenas o que foi visitado.
+
+   Args:
+      csr (CSRGraph): Grafo
+      start (int): Id de partida
+      weighted (bool): Se False, cada aresta vale 1
+      alive (bytearray): Máscara de arestas ativas (None = todas)
+      target (int): Id de destino; a busca para quando ele é finalizado
+
+   Returns:
+      settled (dict): Distância de cada id finalizado, na ordem de finalização
+      parents (dict): Id anterior de cada id alcançado no caminho mínimo
+   """
+   indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+   heappush, heappop = heapq.heappush, heapq.heappop
+
+   distances = {start: 0}
+   parents = {start: None}
+   settled = {}
+   heap = [(0, start)]
+
+   while heap:
+      dist_u, u = heappop(heap)
+      if u in settled:
+         continue
+      settled[u] = dist_u
+      if u == target:
+         break
+
+      # Direto nos buffers: montar ``csr.adjacency()`` custaria O(m) por
+      # consulta e anularia a parada antecipada em ``target``
+      for e in range(indptr[u], indptr[u + 1]):
+         if alive is not None and not alive[e]:
+            continue
+         v = indices[e]
+         alt = dist_u + (weights[e] if weighted else 1)
+         if alt < distances.get(v, math.inf):
+            distances[v] = alt
+            parents[v] = u
+            heappush(heap, (alt, v))
+
+   return settled, parents
+
+def shortest_paths(graph, source, target=None, weighted=True):
+   """
+   Menores caminhos a partir de ``source`` (Dijkstra sobre o CSR). Com
+   ``target``, a busca para assim que o destino é finalizado.
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+       source: Vértice de partida
+       target: Vértice de destino (None = todos)
+       weighted (bool): Se False, mede os caminhos em número de arestas
+
+   Returns:
+       dict: Sem ``target``, a distância de ``source`` a cada vértice alcançável
+       tuple (float, list): Com ``target``, a distância e os vértices do
+          caminho mínimo (math.inf e [] se inalcançável)
+   """
+   csr, _, alive = unwrap(graph)
+   start = csr.id_of(source)
+   stop = None if target is None else csr.id_of(target)
+   if isinstance(graph, CSRView) and not (graph.node_alive[start] and (stop is None or graph.node_alive[stop])):
+      raise KeyError(source if not graph.node_alive[start] else target)
+
+   settled, parents = _shortest_path_tree(csr, start, weighted, alive, stop)
+   labels = csr.labels
+   if target is None:
+      return {labels[v]: dist for v, dist in settled.items()}
+
+   if stop not in settled:
+      return math.inf, []
+   path = []
+   v = stop
+   while v is not None:
+      path.append(labels[v])
+      v = parents[v]
+   path.reverse()
+   return settled[stop], path
+
+def _csr_bfs(csr, start, alive=None, adjacency=None):
+   """
+   Busca em largura sobre ids inteiros de um CSRGraph, contando caminhos
+   mínimos em número de arestas (caso não ponderado do Brandes).
+
+   Args:
+      csr (CSRGraph): Grafo
+      start (int): Id de partida
+      alive (bytearray): Máscara de arestas ativas (None = todas)
+      adjacency (list): ``csr.adjacency()`` já montada, como em ``_csr_dijkstra``
+
+   Returns:
+      orders (list): Ids em ordem não decrescente de distância
+      predecessors (list): Arestas (ids) que chegam a cada id por caminhos mínimos (None se inalcançável)
+      paths (list): Número de caminhos mínimos de start até cada id
+   """
+   if adjacency is None:
+      adjacency = csr.adjacency()
+   n = len(adjacency)
+
+   distances = [-1] * n
+   predecessors = [None] * n
+   paths = [0] * n
+
+   distances[start] = 0
+   predecessors[start] = []
+   paths[start] = 1
+
+   # A própria lista de saída serve de fila (a BFS só acrescenta ao fim)
+   orders = [start]
+
+   for u in orders:
+      next_dist = distances[u] + 1
+      paths_u = paths[u]
+      for e, v, _ in adjacency[u]:
+         if alive is not None and not alive[e]:
+            continue
+         dist_v = distances[v]
+
+         if dist_v < 0:
+            distances[v] = next_dist
+            predecessors[v] = [e]
+            paths[v] = paths_u
+            orders.append(v)
+         elif dist_v == next_dist:
+            predecessors[v].append(e)
+            paths[v] += paths_u
+
+   return orders, predecessors, paths
+
+def _dependencies(csr, start, weighted=True, alive=None, excluded=None, adjacency=None):
+   """
+   Passo de fonte única do Brandes: caminhos mínimos a partir de ``start`` e
+   propagação das dependências na ordem inversa.
+
+   Args:
+      csr (CSRGraph): Grafo
+      start (int): Id da fonte
+      weighted (bool): Se False, usa BFS em vez de Dijkstra
+      alive (bytearray): Máscara de arestas ativas (None = todas)
+      excluded (set): Ids que não contam como destino dos pares (start, t)
+      adjacency (list): ``csr.adjacency()`` reaproveitada entre fontes
+
+   Returns:
+      orders (list): Ids alcançados, na ordem de finalização
+      predecessors (list): Arestas de caminhos mínimos que chegam a cada id
+      contribution (list): Dependência de ``start`` em cada id
+   """
+   single_source = _csr_dijkstra if weighted else _csr_bfs
+   orders, predecessors, paths = single_source(csr, start, alive, adjacency)
+   tails = csr.tails
+
+   contribution = [0] * csr.size()
+   for w in reversed(orders):
+      weight_w = contribution[w] if excluded and w in excluded else 1 + contribution[w]
+      for e in predecessors[w]:
+         v = tails[e]
+         contribution[v] += (paths[v]/paths[w]) * weight_w
+
+   return orders, predecessors, contribution
+
+def _lowmem_sources(csr, sources, weighted=True, alive=None):
+   """
+   Variante de ``_brandes_sources`` com memória O(n + m) e sem alocações por
+   fonte: distâncias, contagens de caminhos e dependências ficam em arrays
+   alocados uma vez e, ao fim de cada fonte, só as posições visitadas são
+   zeradas. Os antecessores não são guardados: na propagação inversa, as
+   arestas de entrada de ``w`` (índice reverso) são testadas com a mesma
+   expressão usada na ida (d[v] + peso == d[w]).
+
+   Com pesos positivos o resultado é idêntico ao de ``_brandes_sources``.
+   """
+   n = csr.size()
+   indptr, indices, weights, tails = csr.indptr, csr.indices, csr.weights, csr.tails
+   rptr, edge_ids = csr.reverse_index()
+   inf = float('inf')
+
+   centrality = array('d', bytes(8 * n))
+   distances = [inf] * n
+   paths = [0] * n
+   contribution = [0] * n
+
+   for s in sources:
+      distances[s] = 0
+      paths[s] = 1
+      orders = []
+
+      if weighted:
+         heap = [(0, s)]
+         while heap:
+            dist_u, u = heapq.heappop(heap)
+            if dist_u > distances[u]:
+               continue
+            orders.append(u)
+            paths_u = paths[u]
+            for e in range(indptr[u], indptr[u + 1]):
+               if alive is not None and not alive[e]:
+                  continue
+               v = indices[e]
+               alt = dist_u + weights[e]
+               dist_v = distances[v]
+               if alt < dist_v:
+                  distances[v] = alt
+                  paths[v] = paths_u
+                  heapq.heappush(heap, (alt, v))
+               elif alt == dist_v:
+                  paths[v] += paths_u
+      else:
+         orders.append(s)
+         for u in orders:
+            next_dist = distances[u] + 1
+            paths_u = paths[u]
+            for e in range(indptr[u], indptr[u + 1]):
+               if alive is not None and not alive[e]:
+                  continue
+               v = indices[e]
+               dist_v = distances[v]
+               if dist_v == inf:
+                  distances[v] = next_dist
+                  paths[v] = paths_u
+                  orders.append(v)
+               elif dist_v == next_dist:
+                  paths[v] += paths_u
+
+      for w in reversed(orders):
+         dist_w = distances[w]
+         coeff = 1 + contribution[w]
+         paths_w = paths[w]
+         for e in edge_ids[rptr[w]:rptr[w + 1]]:
+            v = tails[e]
+            if distances[v] + (weights[e] if weighted else 1) == dist_w and (alive is None or alive[e]):
+               contribution[v] += (paths[v]/paths_w) * coeff
+         if w != s:
+            centrality[w] += contribution[w]
+
+      for v in orders:
+         distances[v] = inf
+         paths[v] = 0
+         contribution[v] = 0
+
+   return centrality
+
+def _brandes_sources(csr, sources, weighted=True, alive=None, lowmem=False, adjacency=None):
+   """
+   Acumula a centralidade parcial de Brandes para um subconjunto de fontes.
+
+   Args:
+      csr (CSRGraph): Grafo
+      sources (iterable): Ids das fontes
+      weighted (bool): Se False, usa BFS em vez de Dijkstra
+      alive (bytearray): Máscara de arestas ativas (None = todas)
+      lowmem (bool): Se True, usa ``_lowmem_sources``
+      adjacency (list): ``csr.adjacency()`` montada uma vez por chamada (ou
+         por processo) e repassada a todos os blocos de fontes
+
+   Returns:
+      array: Centralidade parcial de cada id (array 'd')
+   """
+   if isinstance(csr, (ChainContraction, BlockDecomposition)):
+      return csr.partial_centrality(sources)
+   if lowmem:
+      return _lowmem_sources(csr, sources, weighted, alive)
+
+   centrality = array('d', bytes(8 * csr.size()))
+   if adjacency is None:
+      adjacency = csr.adjacency()
+
+   for s in sources:
+      orders, _, contribution = _dependencies(csr, s, weighted, alive, adjacency=adjacency)
+      for w in orders:
+         if w != s:
+            centrality[w] += contribution[w]
+
+   return centrality
+
+_worker_graph = None
+
+def _init_worker(csr, alive=None, adjacency=False):
+   global _worker_graph
+   # As listas de adjacência são montadas uma vez por processo e servem a
+   # todos os blocos de fontes que ele recebe
+   _worker_graph = (csr, alive, csr.adjacency() if adjacency else None)
+
+def _brandes_worker(sources, weighted=True, lowmem=False):
+   csr, alive, adjacency = _worker_graph
+   return _brandes_sources(csr, sources, weighted, alive, lowmem, adjacency)
+
+def _source_chunks(n, chunk_size=None):
+   """
+   Divide as fontes 0..n-1 em blocos contíguos. O particionamento depende só
+   de ``n`` e ``chunk_size`` (nunca do número de processos), o que garante a
+   mesma ordem de soma dos parciais nos modos serial e paralelo.
+   """
+   if chunk_size is None:
+      chunk_size = max(1, -(-n // 256))
+   return [range(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+
+def _process_pool(workers, csr, alive=None, adjacency=False):
+   """
+   Cria o pool de processos que recebe o grafo uma única vez por worker: com
+   'fork' os buffers são herdados do processo pai, sem pickling. Com
+   ``adjacency``, cada worker monta ``csr.adjacency()`` ao iniciar.
+   """
+   methods = multiprocessing.get_all_start_methods()
+   context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+   return ProcessPoolExecutor(
+      max_workers=workers,
+      mp_context=context,
+      initializer=_init_worker,
+      initargs=(csr, alive, adjacency)
+   )
+
+def _accumulate(csr, chunks, centrality, pool=None, weighted=True, alive=None, on_chunk=None,
+                lowmem=False, adjacency=None):
+   """
+   Soma em ``centrality``, na ordem dos blocos, as centralidades parciais de
+   cada bloco de fontes (em série ou no pool de processos). ``on_chunk(i)`` é
+   chamado depois que o bloco ``i`` foi somado; ``adjacency`` é repassada aos
+   blocos do modo serial (no pool, cada worker tem a sua).
+   """
+   if pool is None:
+      partials = (_brandes_sources(csr, chunk, weighted, alive, lowmem, adjacency) for chunk in chunks)
+   else:
+      partials = pool.map(partial(_brandes_worker, weighted=weighted, lowmem=lowmem), chunks)
+
+   for i, values in enumerate(partials):
+      for v, c in enumerate(values):
+         centrality[v] += c
+      if on_chunk is not None:
+         on_chunk(i)
+
+def _save_checkpoint(path, key, done, centrality):
+   """
+   Grava de forma atômica o estado de um ``brandes`` em andamento: a chave
+   do cálculo, quantos blocos de fontes já foram somados e o acumulador.
+   """
+   tmp_path = f'{path}.{os.getpid()}.tmp'
+   with open(tmp_path, 'wb') as file:
+      file.write(json.dumps({'key': key, 'done': done}).encode() + b'\n')
+      file.write(centrality.tobytes())
+   os.replace(tmp_path, path)
+
+def _load_checkpoint(path, key, n):
+   """
+   Lê um checkpoint de ``brandes``.
+
+   Returns:
+      tuple (int, array) | None: blocos já somados e acumulador, ou None se
+      o arquivo não existe ou é de outro cálculo (outro grafo ou parâmetros)
+   """
+   try:
+      with open(path, 'rb') as file:
+         header = json.loads(file.readline())
+         centrality = array('d')
+         centrality.frombytes(file.read())
+   except (OSError, ValueError):
+      return None
+   if header.get('key') != key or len(centrality) != n:
+      return None
+   return header['done'], centrality
+
+def _expand_ranges(np, starts, counts):
+   """
+   Concatena os intervalos [starts[i], starts[i] + counts[i]) em um só array.
+   """
+   total = int(counts.sum())
+   shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+   return np.arange(total, dtype=np.int64) + shift
+
+def _numpy_bfs_batch(np, sparse, adjacency, transposed, batch, n):
+   """
+   Brandes não ponderado para um lote de fontes. A fronteira de cada nível é
+   uma matriz esparsa n x b e a expansão é o produto A^T @ F; a propagação das
+   dependências volta nível a nível com A @ C. Retorna None se a contagem de
+   caminhos estourar o float64.
+   """
+   b = len(batch)
+   cols = np.arange(b)
+   dist = np.full((n, b), -1, dtype=np.int32)
+   sigma = np.zeros((n, b))
+   dist[batch, cols] = 0
+   sigma[batch, cols] = 1
+
+   levels = [(batch, cols)]
+   frontier = sparse.csr_matrix((np.ones(b), (batch, cols)), shape=(n, b))
+   while frontier.nnz:
+      reached = (transposed @ frontier).tocoo()
+      keep = dist[reached.row, reached.col] < 0
+      rows, cc, paths = reached.row[keep], reached.col[keep], reached.data[keep]
+      if rows.size == 0:
+         break
+
+      dist[rows, cc] = len(levels)
+      sigma[rows, cc] = paths
+      levels.append((rows, cc))
+      frontier = sparse.csr_matrix((paths, (rows, cc)), shape=(n, b))
+
+   if not np.isfinite(sigma).all():
+      return None
+
+   delta = np.zeros((n, b))
+   for level in range(len(levels) - 1, 0, -1):
+      rows, cc = levels[level]
+      coeff = (1 + delta[rows, cc]) / sigma[rows, cc]
+      spread = (adjacency @ sparse.csr_matrix((coeff, (rows, cc)), shape=(n, b))).tocoo()
+      keep = dist[spread.row, spread.col] == level - 1
+      rows, cc = spread.row[keep], spread.col[keep]
+      delta[rows, cc] += sigma[rows, cc] * spread.data[keep]
+
+   delta[batch, cols] = 0
+   return delta.sum(axis=1)
+
+def _numpy_dijkstra_batch(np, csgraph, adjacency, tails, heads, weights, batch, n):
+   """
+   Brandes ponderado para um lote de fontes. As distâncias vêm de
+   ``scipy.sparse.csgraph.dijkstra``; os antecessores são reconstruídos pelas
+   arestas justas (d[u] + w == d[v]) e o DAG de caminhos mínimos é percorrido
+   em camadas (ordem topológica de Kahn), cada camada com operações de array.
+   Retorna None se a contagem de caminhos estourar o float64.
+   """
+   b = len(batch)
+   dist = np.ascontiguousarray(csgraph.dijkstra(adjacency, directed=True, indices=batch).T)
+
+   # Pares (aresta, fonte) que pertencem ao DAG, em índices planos v * b + j
+   dist_tail = dist[tails]
+   tight = np.isfinite(dist_tail) & (dist_tail + weights[:, None] == dist[heads])
+   edge_ids, cols = np.nonzero(tight)
+   del dist_tail, tight
+   flat_tail = tails[edge_ids] * b + cols
+   flat_head = heads[edge_ids] * b + cols
+
+   size = n * b
+   by_tail = np.argsort(flat_tail, kind='stable')
+   out_ptr = np.zeros(size + 1, dtype=np.int64)
+   np.cumsum(np.bincount(flat_tail, minlength=size), out=out_ptr[1:])
+   out_head = flat_head[by_tail]
+
+   by_head = np.argsort(flat_head, kind='stable')
+   in_ptr = np.zeros(size + 1, dtype=np.int64)
+   np.cumsum(np.bincount(flat_head, minlength=size), out=in_ptr[1:])
+   in_tail = flat_tail[by_head]
+
+   pending = np.diff(in_ptr)
+   sigma = np.zeros(size)
+   sources = batch * b + np.arange(b)
+   sigma[sources] = 1
+
+   layers = [sources]
+   frontier = sources
+   while True:
+      idx = _expand_ranges(np, out_ptr[frontier], out_ptr[frontier + 1] - out_ptr[frontier])
+      if idx.size == 0:
+         break
+      targets = out_head[idx]
+      np.add.at(sigma, targets, np.repeat(sigma[frontier], out_ptr[frontier + 1] - out_ptr[frontier]))
+      np.subtract.at(pending, targets, 1)
+      targets = np.unique(targets)
+      frontier = targets[pending[targets] == 0]
+      if frontier.size == 0:
+         break
+      layers.append(frontier)
+
+   if not np.isfinite(sigma).all():
+      return None
+
+   delta = np.zeros(size)
+   for layer in reversed(layers[1:]):
+      coeff = (1 + delta[layer]) / sigma[layer]
+      counts = in_ptr[layer + 1] - in_ptr[layer]
+      preds = in_tail[_expand_ranges(np, in_ptr[layer], counts)]
+      np.add.at(delta, preds, sigma[preds] * np.repeat(coeff, counts))
+
+   delta[sources] = 0
+   return delta.reshape(n, b).sum(axis=1)
+
+def _numpy_brandes(csr, weighted, batch_size=None, sources=None, alive=None):
+   """
+   Motor vetorizado (NumPy/SciPy) do Brandes: processa as fontes em lotes de
+   ``batch_size``, com matrizes densas n x batch_size por lote. ``sources`` e
+   ``alive`` restringem as fontes e as arestas, como em ``unwrap``.
+
+   As contagens de caminhos são float64; um lote cuja contagem estoura
+   (mais de ~1e308 caminhos mínimos, como em grades grandes) é refeito pelo
+   motor por fonte.
+
+   Returns:
+      list: Centralidade de cada id
+   """
+   import numpy as np
+   from scipy import sparse
+   from scipy.sparse import csgraph
+
+   n = csr.size()
+   if batch_size is None:
+      batch_size = max(1, min(256, 4_000_000 // max(1, n)))
+
+   indptr = np.frombuffer(csr.indptr, dtype=np.int64)
+   indices = np.frombuffer(csr.indices, dtype=np.int32 if csr.indices.itemsize == 4 else np.int64)
+   weights = np.frombuffer(csr.weights, dtype=np.float64)
+   tails = np.repeat(np.arange(n), np.diff(indptr))
+   heads = indices.astype(np.int64)
+   if alive is not None:
+      keep = np.frombuffer(alive, dtype=np.uint8).astype(bool)
+      tails, heads, weights = tails[keep], heads[keep], weights[keep]
+   sources = np.arange(n) if sources is None else np.asarray(sources, dtype=np.int64)
+   batches = [sources[i:i + batch_size] for i in range(0, len(sources), batch_size)]
+   centrality = np.zeros(n)
+
+   if weighted:
+      # O csr_matrix soma entradas repetidas: arcos paralelos (netx_to_csr com
+      # parallel='keep') ficam só com o menor peso para as distâncias; a
+      # multiplicidade dos empatados volta nas arestas justas de cada lote
+      key = tails * n + heads
+      order = np.lexsort((weights, key))
+      first = order[np.concatenate([[True], key[order][1:] != key[order][:-1]])] if key.size else order
+      adjacency = sparse.csr_matrix((weights[first], (tails[first], heads[first])), shape=(n, n))
+   else:
+      # Aqui a soma das repetidas é a multiplicidade, usada nas contagens
+      adjacency = sparse.csr_matrix((np.ones(len(heads)), (tails, heads)), shape=(n, n))
+      transposed = adjacency.T.tocsr()
+
+   for batch in batches:
+      with np.errstate(over='ignore', invalid='ignore'):
+         if weighted:
+            partial = _numpy_dijkstra_batch(np, csgraph, adjacency, tails, heads, weights, batch, n)
+         else:
+            partial = _numpy_bfs_batch(np, sparse, adjacency, transposed, batch, n)
+      if partial is None:
+         # A contagem de caminhos estourou o float64: refaz o lote com os
+         # inteiros do Python (sem limite) do motor por fonte
+         partial = np.frombuffer(_brandes_sources(csr, batch.tolist(), weighted, alive), dtype=np.float64)
+      centrality += partial
+
+   return centrality.tolist()
+
+def _is_weighted(csr, weighted):
+   """
+   Resolve o parâmetro ``weighted``: None detecta pesos uniformes (positivos),
+   caso em que a BFS dá os mesmos caminhos mínimos que o Dijkstra.
+   """
+   if weighted is not None:
+      return weighted
+   uniform = csr.uniform_weight()
+   return uniform is None or uniform <= 0
+
+class ChainContraction:
+   """
+   Contração das cadeias de vértices de grau 2 de um grafo não dirigido para
+   o Brandes (motor 'chains').
+
+   Cada cadeia a - x1 - ... - xk - b (xi com exatamente dois vizinhos) vira
+   uma superaresta a - b com a soma dos pesos, e as buscas rodam no grafo
+   reduzido (só vértices de grau != 2). O resultado continua exato:
+
+   - um vértice interno xi como fonte é uma fonte virtual com sementes em a
+     (distância d(a, xi)) e em b (distância d(xi, b));
+   - os destinos internos de uma cadeia são alcançados por a ou por b,
+     conforme o ponto de corte (d(s, b) - d(s, a) + L) / 2 ao longo dela, e
+     entram na propagação inversa como peso extra em a e b;
+   - a dependência que atravessa uma superaresta é creditada a todos os seus
+     vértices internos e a dos destinos internos é acumulada em histogramas
+     por cadeia, expandidos uma única vez no fim de cada bloco de fontes.
+
+   Laços (cadeias com a == b) e ciclos isolados ganham vértices mantidos
+   extras para que toda cadeia tenha extremos distintos. Como no Brandes, os
+   empates são detectados por igualdade exata: com pesos reais, use
+   ``resolution`` em ``brandes`` para que as somas ao longo das cadeias
+   empatem como no grafo original.
+   """
+   def __init__(self, csr, weighted=True, alive=None):
+      """
+      Args:
+         csr (CSRGraph): Grafo não dirigido
+         weighted (bool): Se False, cada aresta vale 1
+         alive (bytearray): Máscara de arestas ativas (None = todas)
+      """
+      if csr.is_directed():
+         raise ValueError("Contração de cadeias em grafo dirigido não suportada.")
+      n = csr.size()
+      indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+      neighbors = [
+         [(indices[e], weights[e] if weighted else 1)
+          for e in range(indptr[u], indptr[u + 1]) if alive is None or alive[e]]
+         for u in range(n)
+      ]
+      kept = bytearray(
+         not (len(nb) == 2 and nb[0][0] != nb[1][0] and u != nb[0][0] and u != nb[1][0])
+         for u, nb in enumerate(neighbors)
+      )
+
+      # Repete até que nenhuma cadeia seja um laço: o vértice do meio de cada
+      # laço e um vértice de cada ciclo isolado passam a ser mantidos
+      while True:
+         chains = []
+         visited = bytearray(n)
+         extra = []
+         for a in range(n):
+            if not kept[a]:
+               continue
+            for v, w in neighbors[a]:
+               if kept[v] or visited[v]:
+                  continue
+               nodes, lengths = [], [w]
+               previous, current = a, v
+               while not kept[current]:
+                  visited[current] = 1
+                  nodes.append(current)
+                  (x, wx), (y, wy) = neighbors[current]
+                  previous, current, w = (current, x, wx) if y == previous else (current, y, wy)
+                  lengths.append(w)
+               if current == a:
+                  extra.append(nodes[len(nodes) // 2])
+               chains.append((a, current, nodes, lengths))
+         for u in range(n):
+            if not kept[u] and not visited[u]:
+               extra.append(u)
+               # Marca o resto do ciclo para escolher um único vértice nele
+               previous, current = u, neighbors[u][0][0]
+               while current != u:
+                  visited[current] = 1
+                  (x, _), (y, _) = neighbors[current]
+                  previous, current = current, x if y == previous else y
+         if not extra:
+            break
+         for u in extra:
+            kept[u] = 1
+
+      self._n = n
+      self._kept = [u for u in range(n) if kept[u]]
+      rid = {u: i for i, u in enumerate(self._kept)}
+
+      # Grafo reduzido: listas (aresta, destino, peso) como em ``CSRGraph.adjacency``
+      adjacency = [[] for _ in self._kept]
+      tails = []
+      edge_chain = []
+      for u in self._kept:
+         for v, w in neighbors[u]:
+            if kept[v]:
+               adjacency[rid[u]].append((len(tails), rid[v], w))
+               tails.append(rid[u])
+               edge_chain.append(-1)
+
+      self._ends = []
+      self._nodes = []
+      self._offsets = []
+      self._lengths = []
+      self._chain_of = {}
+      for c, (a, b, nodes, lengths) in enumerate(chains):
+         offsets = []
+         total = 0
+         for w in lengths[:-1]:
+            total += w
+            offsets.append(total)
+         total += lengths[-1]
+         ra, rb = rid[a], rid[b]
+         for tail, head in ((ra, rb), (rb, ra)):
+            adjacency[tail].append((len(tails), head, total))
+            tails.append(tail)
+            edge_chain.append(c)
+         self._ends.append((ra, rb))
+         self._nodes.append(nodes)
+         self._offsets.append(offsets)
+         self._lengths.append(total)
+         for i, u in enumerate(nodes):
+            self._chain_of[u] = (c, i)
+
+      self._rid = rid
+      self._adjacency = adjacency
+      self._tails = tails
+      self._edge_chain = edge_chain
+
+   def size(self) -> int:
+      """
+      Returns:
+         int: número de vértices do grafo reduzido.
+      """
+      return len(self._kept)
+
+   def number_of_chains(self) -> int:
+      """
+      Returns:
+         int: número de cadeias contraídas.
+      """
+      return len(self._nodes)
+
+   def _dijkstra(self, seeds):
+      """
+      Dijkstra no grafo reduzido a partir de sementes (id, distância), cada
+      uma com um caminho.
+      """
+      adjacency = self._adjacency
+      n = len(adjacency)
+      heappush, heappop = heapq.heappush, heapq.heappop
+
+      distances = [math.inf] * n
+      predecessors = [None] * n
+      paths = [0] * n
+      heap = []
+      for r, d in seeds:
+         distances[r] = d
+         predecessors[r] = []
+         paths[r] = 1
+         heap.append((d, r))
+      heapq.heapify(heap)
+
+      orders = []
+      while heap:
+         dist_u, u = heappop(heap)
+         if dist_u > distances[u]:
+            continue
+         orders.append(u)
+
+         paths_u = paths[u]
+         for e, v, w in adjacency[u]:
+            alt = dist_u + w
+            dist_v = distances[v]
+            if alt < dist_v:
+               distances[v] = alt
+               predecessors[v] = [e]
+               paths[v] = paths_u
+               heappush(heap, (alt, v))
+            elif alt == dist_v:
+               predecessors[v].append(e)
+               paths[v] += paths_u
+
+      return orders, predecessors, paths, distances
+
+   @staticmethod
+   def _split(offsets, length, d1, d2, paths1, paths2):
+      """
+      Divide os vértices internos de uma cadeia entre os alcançados pelo
+      extremo 1 e pelo extremo 2.
+
+      Returns:
+         tuple: (j, tie, s1, s2): os j primeiros vêm pelo extremo 1; se
+            ``tie``, o vértice j (base 0) empata e seus caminhos se dividem
+            nas frações s1 e s2
+      """
+      k = len(offsets)
+      if d2 == math.inf:
+         return k, False, 0, 0
+      if d1 == math.inf:
+         return 0, False, 0, 0
+      j = bisect_left(offsets, (d2 - d1 + length) / 2)
+      if j < k and d1 + offsets[j] == d2 + (length - offsets[j]):
+         total = paths1 + paths2
+         return j, True, paths1 / total, paths2 / total
+      return j, False, 0, 0
+
+   def _own_chain(self, c, i, distances, paths, credit):
+      """
+      Destinos na própria cadeia da fonte interna ``i``: cada lado (até a e
+      até b) é tratado como uma cadeia cujo outro extremo é a fonte.
+
+      Returns:
+         tuple (float, float): peso extra dos destinos alcançados por a e por b
+      """
+      nodes, offsets, length = self._nodes[c], self._offsets[c], self._lengths[c]
+      ra, rb = self._ends[c]
+      p = offsets[i]
+      k = len(nodes)
+      extra_a = extra_b = 0
+
+      # Lado de a: extremo 1 = a, extremo 2 = a própria fonte
+      j, tie, s1, s2 = self._split(offsets[:i], p, distances[ra], 0, paths[ra], 1)
+      for pos in range(i):
+         # Destinos por a além de pos, destinos pela fonte antes de pos
+         value = max(0, j - pos - 1) + max(0, pos - j - tie)
+         if tie:
+            value += s1 if pos < j else s2 if pos > j else 0
+         credit[nodes[pos]] += value
+      extra_a = j + s1
+
+      # Lado de b: extremo 1 = a fonte, extremo 2 = b
+      side = [offset - p for offset in offsets[i + 1:]]
+      j, tie, s1, s2 = self._split(side, length - p, 0, distances[rb], 1, paths[rb])
+      for pos in range(k - i - 1):
+         value = max(0, j - pos - 1) + max(0, pos - j - tie)
+         if tie:
+            value += s1 if pos < j else s2 if pos > j else 0
+         credit[nodes[i + 1 + pos]] += value
+      extra_b = (k - i - 1 - j - tie) + s2
+      return extra_a, extra_b
+
+   def partial_centrality(self, sources):
+      """
+      Centralidade de Brandes (no grafo original) dos pares com origem em
+      ``sources``.
+
+      Args:
+         sources (iterable): Ids (do grafo original) das fontes
+
+      Returns:
+         array: Centralidade parcial de cada id do grafo original (array 'd')
+      """
+      kept, rid, tails, edge_chain = self._kept, self._rid, self._tails, self._edge_chain
+      ends, offsets_of, lengths = self._ends, self._offsets, self._lengths
+      chains = len(self._nodes)
+      n_reduced = len(kept)
+      inf = math.inf
+
+      credit = array('d', bytes(8 * self._n))
+      flow = [0] * chains
+      # Histogramas dos destinos internos de cada cadeia (ver ``_expand``)
+      before = [[0] * (len(nodes) + 1) for nodes in self._nodes]
+      after = [[0] * (len(nodes) + 1) for nodes in self._nodes]
+      tie_before = [[0] * len(nodes) for nodes in self._nodes]
+      tie_after = [[0] * len(nodes) for nodes in self._nodes]
+
+      for s in sources:
+         own = self._chain_of.get(s)
+         if own is None:
+            root = rid[s]
+            seeds = [(root, 0)]
+         else:
+            root = -1
+            c, i = own
+            ra, rb = ends[c]
+            p = offsets_of[c][i]
+            seeds = [(ra, p), (rb, lengths[c] - p)]
+         orders, predecessors, paths, distances = self._dijkstra(seeds)
+
+         through = [0] * n_reduced
+         skip = own[0] if own is not None else -1
+         # Mesmo cálculo de ``_split``, em linha: é o laço mais quente por fonte
+         for c, (r1, r2), offsets, length in zip(range(chains), ends, offsets_of, lengths):
+            d1, d2 = distances[r1], distances[r2]
+            if c == skip or (d1 == inf and d2 == inf):
+               continue
+            k = len(offsets)
+            if d2 == inf:
+               j = k
+            elif d1 == inf:
+               j = 0
+            else:
+               j = bisect_left(offsets, (d2 - d1 + length) / 2)
+               if j < k and d1 + offsets[j] == d2 + (length - offsets[j]):
+                  total = paths[r1] + paths[r2]
+                  s1, s2 = paths[r1] / total, paths[r2] / total
+                  through[r1] += j + s1
+                  through[r2] += k - j - 1 + s2
+                  before[c][j] += 1
+                  after[c][j + 1] += 1
+                  tie_before[c][j] += s1
+                  tie_after[c][j] += s2
+                  continue
+            through[r1] += j
+            through[r2] += k - j
+            before[c][j] += 1
+            after[c][j] += 1
+
+         if own is not None:
+            extra_a, extra_b = self._own_chain(own[0], own[1], distances, paths, credit)
+            through[ra] += extra_a
+            through[rb] += extra_b
+
+         contribution = [0] * n_reduced
+         seed_flow = {}
+         for w in reversed(orders):
+            coeff = ((w != root) + through[w] + contribution[w]) / paths[w]
+            for e in predecessors[w]:
+               v = tails[e]
+               f = paths[v] * coeff
+               contribution[v] += f
+               if edge_chain[e] >= 0:
+                  flow[edge_chain[e]] += f
+            if w != root:
+               credit[kept[w]] += contribution[w] + through[w]
+
+         if own is not None:
+            # Caminhos que saem da fonte pelas sementes percorrem a cadeia até a ou b
+            c, i = own
+            nodes = self._nodes[c]
+            for r, d, side in ((ra, p, nodes[:i]), (rb, lengths[c] - p, nodes[i + 1:])):
+               if distances[r] == d:
+                  f = ((r != root) + through[r] + contribution[r]) / paths[r]
+                  for u in side:
+                     credit[u] += f
+
+      self._expand(credit, flow, before, after, tie_before, tie_after)
+      return credit
+
+   def _expand(self, credit, flow, before, after, tie_before, tie_after):
+      """
+      Credita aos vértices internos o fluxo das superarestas e os destinos
+      internos acumulados nos histogramas. Para o vértice de posição i (base
+      0) de uma cadeia com k internos:
+
+      - ``before[j]`` conta fontes cujos j primeiros internos vêm pelo
+        extremo 1: i recebe max(0, j - i - 1);
+      - ``after[j]`` conta fontes cujos internos a partir de j vêm pelo
+        extremo 2: i recebe max(0, i - j);
+      - ``tie_before[t]``/``tie_after[t]``: frações do interno empatado t,
+        creditadas aos internos antes/depois dele.
+      """
+      for c, nodes in enumerate(self._nodes):
+         k = len(nodes)
+         values = [flow[c]] * k
+
+         # Soma de before[j] * (j - i - 1) para j > i + 1, de trás para frente
+         acc = count = 0
+         for i in range(k - 1, -1, -1):
+            count += before[c][i + 1]
+            values[i] += acc
+            acc += count
+         # Soma de after[j] * (i - j) para j < i, da frente para trás
+         acc = count = 0
+         for i in range(k):
+            values[i] += acc
+            count += after[c][i]
+            acc += count
+         # Frações do empatado
+         acc = 0
+         for i in range(k - 1, -1, -1):
+            values[i] += acc
+            acc += tie_before[c][i]
+         acc = 0
+         for i in range(k):
+            values[i] += acc
+            acc += tie_after[c][i]
+
+         for u, value in zip(nodes, values):
+            credit[u] += value
+
+class BlockDecomposition:
+   """
+   Decomposição de um grafo não dirigido em componentes biconexas (árvore de
+   blocos e articulações) para o Brandes (motor 'blocks').
+
+   Um caminho mínimo entre dois vértices de um mesmo bloco nunca sai dele,
+   então cada bloco é resolvido isoladamente, com pesos de multiplicidade:
+   w_B(v) é o número de vértices que chegam ao bloco B por v (o próprio v e
+   tudo o que pende dele fora de B). A centralidade de x é
+
+   - a soma, em cada bloco B de x, da dependência dos pares (s, t) de B
+     (s, t != x) ponderada por w_B(s) * w_B(t);
+   - para articulações, os pares ordenados separados por x: (N - 1)^2 menos
+     a soma dos quadrados dos tamanhos das partes de G - x, com N o tamanho
+     da componente conexa.
+
+   Blocos de dois vértices (pontes, como as das ruas sem saída e das árvores
+   da periferia) não têm vértices internos e não geram buscas: franjas em
+   árvore custam tempo linear.
+   """
+   def __init__(self, csr, weighted=True, alive=None):
+      """
+      Args:
+         csr (CSRGraph): Grafo não dirigido
+         weighted (bool): Se False, cada aresta vale 1
+         alive (bytearray): Máscara de arestas ativas (None = todas)
+      """
+      if csr.is_directed():
+         raise ValueError("Decomposição em blocos em grafo dirigido não suportada.")
+      n = csr.size()
+      indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+      neighbors = [
+         [(indices[e], weights[e] if weighted else 1)
+          for e in range(indptr[u], indptr[u + 1])
+          if indices[e] != u and (alive is None or alive[e])]
+         for u in range(n)
+      ]
+
+      # Hopcroft-Tarjan iterativo: ``size`` é o tamanho da subárvore da DFS e
+      # ``hang`` a soma das subárvores filhas separadas de u por u
+      disc = [-1] * n
+      low = [0] * n
+      size = [1] * n
+      hang = [0] * n
+      parts = [[] for _ in range(n)]
+      self._n = n
+      self._blocks = []
+      self._blocks_of = [[] for _ in range(n)]
+      self._cut_pairs = [0] * n
+      clock = 0
+      for root in range(n):
+         if disc[root] >= 0:
+            continue
+         disc[root] = low[root] = clock
+         clock += 1
+         visited = [root]
+         stack = [root]
+         blocks = []
+         # Quadro: [vértice, pai, próximo vizinho, aresta ao pai já pulada]
+         frames = [[root, -1, 0, False]]
+         while frames:
+            frame = frames[-1]
+            u = frame[0]
+            if frame[2] < len(neighbors[u]):
+               v = neighbors[u][frame[2]][0]
+               frame[2] += 1
+               if v == frame[1] and not frame[3]:
+                  frame[3] = True
+               elif disc[v] < 0:
+                  disc[v] = low[v] = clock
+                  clock += 1
+                  visited.append(v)
+                  stack.append(v)
+                  frames.append([v, u, 0, False])
+               elif disc[v] < low[u]:
+                  low[u] = disc[v]
+               continue
+
+            frames.pop()
+            if not frames:
+               break
+            p = frames[-1][0]
+            size[p] += size[u]
+            if low[u] < low[p]:
+               low[p] = low[u]
+            if low[u] >= disc[p]:
+               # u inicia um bloco cujo vértice mais alto é p
+               hang[p] += size[u]
+               parts[p].append(size[u])
+               members = [p]
+               while True:
+                  x = stack.pop()
+                  members.append(x)
+                  if x == u:
+                     break
+               blocks.append((members, u))
+
+         total = size[root]
+         for u in visited:
+            rest = total - 1 - hang[u]
+            self._cut_pairs[u] = (total - 1) ** 2 - rest ** 2 - sum(c * c for c in parts[u])
+         for members, start in blocks:
+            if len(members) < 3:
+               continue
+            b = len(self._blocks)
+            local = {u: i for i, u in enumerate(members)}
+            adjacency = [[(local[v], w) for v, w in neighbors[u] if v in local] for u in members]
+            multiplicity = [total - size[start]] + [1 + hang[u] for u in members[1:]]
+            self._blocks.append((members, adjacency, multiplicity))
+            for i, u in enumerate(members):
+               self._blocks_of[u].append((b, i))
+
+   def number_of_blocks(self) -> int:
+      """
+      Returns:
+         int: número de blocos com três ou mais vértices (os que geram buscas).
+      """
+      return len(self._blocks)
+
+   def partial_centrality(self, sources):
+      """
+      Centralidade de Brandes dos pares com origem em ``sources``: cada fonte
+      roda uma busca em cada bloco (não trivial) a que pertence e soma a
+      própria parcela dos pares separados por ela.
+
+      Args:
+         sources (iterable): Ids das fontes
+
+      Returns:
+         array: Centralidade parcial de cada id (array 'd')
+      """
+      heappush, heappop = heapq.heappush, heapq.heappop
+      credit = array('d', bytes(8 * self._n))
+      for s in sources:
+         credit[s] += self._cut_pairs[s]
+         for b, i in self._blocks_of[s]:
+            members, adjacency, multiplicity = self._blocks[b]
+            k = len(members)
+            distances = [math.inf] * k
+            predecessors = [None] * k
+            paths = [0] * k
+            distances[i] = 0
+            predecessors[i] = []
+            paths[i] = 1
+            heap = [(0, i)]
+            orders = []
+            while heap:
+               dist_u, u = heappop(heap)
+               if dist_u > distances[u]:
+                  continue
+               orders.append(u)
+               paths_u = paths[u]
+               for v, w in adjacency[u]:
+                  alt = dist_u + w
+                  dist_v = distances[v]
+                  if alt < dist_v:
+                     distances[v] = alt
+                     predecessors[v] = [u]
+                     paths[v] = paths_u
+                     heappush(heap, (alt, v))
+                  elif alt == dist_v:
+                     predecessors[v].append(u)
+                     paths[v] += paths_u
+
+            source_weight = multiplicity[i]
+            contribution = [0] * k
+            for w in reversed(orders):
+               if w == i:
+                  continue
+               coeff = (multiplicity[w] + contribution[w]) / paths[w]
+               for v in predecessors[w]:
+                  contribution[v] += paths[v] * coeff
+               credit[members[w]] += source_weight * contribution[w]
+      return credit
+
+def _quantize(csr, resolution):
+   """
+   Cópia do grafo (compartilhando ``indptr`` e ``indices``) com cada peso
+   arredondado para um múltiplo inteiro de ``resolution`` e guardado nessa
+   unidade. Somas de inteiros são exatas em float64 até 2**53, então caminhos
+   de mesmo comprimento empatam exatamente, em qualquer ordem de soma.
+
+   Raises:
+      ValueError: Se a resolução não for positiva ou for pequena demais para
+         que as somas sejam exatas.
+   """
+   if not resolution > 0:
+      raise ValueError(f"Resolução {resolution} não suportada.")
+   weights = array('d', (float(round(w / resolution)) for w in csr.weights))
+   if sum(weights) >= 2 ** 53:
+      raise ValueError(f"Resolução {resolution} não suportada: pequena demais para os pesos.")
+   return CSRGraph(csr.indptr, csr.indices, weights, csr.labels, csr.is_directed())
+
+def brandes(graph, workers=None, chunk_size=None, weighted=None, engine='python', batch_size=None,
+            checkpoint=None, checkpoint_every=60.0, progress=None, resolution=None):
+   """
+   Algoritmo de Brandes para grafos ponderados
+
+   Caminhos mínimos empatados são detectados por igualdade exata das
+   distâncias. Com pesos reais (comprimentos do OSM, por exemplo), somas do
+   mesmo comprimento em ordens diferentes podem diferir no último bit e o
+   empate se perde; ``resolution`` arredonda os pesos para múltiplos inteiros
+   dessa unidade (por ex. 1e-3 para milímetros), tornando a comparação exata
+   e igual em todos os motores. As contagens de caminhos são inteiros do
+   Python nos motores 'python' e 'lowmem', sem estouro nem perda de precisão.
+
+   Com ``checkpoint``, o acumulador e o número de blocos de fontes concluídos
+   são gravados no arquivo a cada ``checkpoint_every`` segundos, sempre entre
+   dois blocos; se a execução for interrompida (erro, Ctrl-C), uma nova
+   chamada com o mesmo grafo e parâmetros continua do último checkpoint, com
+   resultado idêntico ao de uma execução sem interrupção. O arquivo é
+   removido ao terminar.
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+       workers (int): Número de processos. None ou 1 executa em série;
+           0 usa todos os núcleos disponíveis
+       chunk_size (int): Quantidade de fontes por bloco (padrão: n/256)
+       weighted (bool): False ignora os pesos e usa BFS; None (padrão) usa
+           BFS automaticamente quando todas as arestas têm o mesmo peso
+       engine (str): 'python' (laço por fonte), 'lowmem' (laço por fonte com
+           memória O(n + m), para grafos muito grandes), 'chains' (buscas no
+           grafo com as cadeias de vértices de grau 2 contraídas; só grafos
+           não dirigidos, ver ``ChainContraction``), 'blocks' (buscas só
+           dentro de cada componente biconexa; só grafos não dirigidos, ver
+           ``BlockDecomposition``) ou 'numpy' (lotes de
+           fontes vetorizados com NumPy/SciPy; ignora ``workers``)
+       batch_size (int): Fontes por lote no motor 'numpy'
+       checkpoint (str): Arquivo de checkpoint (todos os motores exceto 'numpy')
+       checkpoint_every (float): Intervalo mínimo (s) entre dois checkpoints
+       progress (callable): Chamada como ``progress(fontes concluídas, total)``
+           a cada bloco de fontes concluído
+       resolution (float): Unidade para a qual os pesos são arredondados
+           antes do cálculo (None = pesos originais)
+
+   Returns:
+       centrality (dict): Dicionário com a centralidade de cada vértice
+   """
+   csr, sources, alive = unwrap(graph)
+   labels = csr.labels
+   weighted = _is_weighted(csr, weighted)
+   if weighted and resolution is not None:
+      csr = _quantize(csr, resolution)
+
+   if engine == 'numpy':
+      if checkpoint is not None:
+         raise ValueError("Checkpoint não suportado no motor 'numpy'.")
+      values = _numpy_brandes(csr, weighted, batch_size, sources, alive)
+      return {labels[v]: values[v] for v in sources}
+   if engine not in ('python', 'lowmem', 'chains', 'blocks'):
+      raise ValueError(f"Motor '{engine}' não suportado.")
+   lowmem = engine == 'lowmem'
+   kernel = csr
+   if engine == 'chains':
+      kernel = ChainContraction(csr, weighted, alive)
+   elif engine == 'blocks':
+      kernel = BlockDecomposition(csr, weighted, alive)
+
+   chunks = [sources[r.start:r.stop] for r in _source_chunks(len(sources), chunk_size)]
+   if workers == 0:
+      workers = os.cpu_count()
+
+   centrality = array('d', bytes(8 * csr.size()))
+   done = 0
+   if checkpoint is not None:
+      key = {
+         'fingerprint': graph.fingerprint() if isinstance(graph, CSRView) else csr.fingerprint(),
+         'weighted': weighted,
+         'resolution': resolution,
+         'engine': engine,
+         'chunks': [len(chunk) for chunk in chunks],
+      }
+      state = _load_checkpoint(checkpoint, key, csr.size())
+      if state is not None:
+         done, centrality = state
+
+   total = len(sources)
+   completed = sum(len(chunk) for chunk in chunks[:done])
+   last_save = time.monotonic()
+
+   def on_chunk(i):
+      nonlocal completed, last_save
+      completed += len(chunks[done + i])
+      if progress is not None:
+         progress(completed, total)
+      if checkpoint is not None and time.monotonic() - last_save >= checkpoint_every:
+         _save_checkpoint(checkpoint, key, done + i + 1, centrality)
+         last_save = time.monotonic()
+
+   if progress is not None:
+      progress(completed, total)
+
+   # Listas de adjacência só no laço por fonte (os kernels têm as suas e o
+   # 'lowmem' indexa o CSR direto), montadas uma vez para todos os blocos
+   use_adjacency = kernel is csr and not lowmem
+   if workers and workers > 1 and len(chunks) - done > 1:
+      with _process_pool(workers, kernel, alive, use_adjacency) as pool:
+         _accumulate(kernel, chunks[done:], centrality, pool, weighted, on_chunk=on_chunk, lowmem=lowmem)
+   else:
+      adjacency = csr.adjacency() if use_adjacency else None
+      _accumulate(kernel, chunks[done:], centrality, weighted=weighted, alive=alive, on_chunk=on_chunk,
+                  lowmem=lowmem, adjacency=adjacency)
+
+   if checkpoint is not None and os.path.exists(checkpoint):
+      os.remove(checkpoint)
+   return {labels[v]: centrality[v] for v in sources}
+
+def _sample_order(csr, rng, strategy='uniform', sources=None, alive=None):
+   """
+   Gera a ordem em que as fontes são amostradas. Qualquer prefixo da ordem é
+   uma amostra sem reposição: uniforme ou estratificada pelo grau (cada grau
+   aparece no prefixo na proporção do seu tamanho).
+   """
+   if sources is None:
+      sources = range(csr.size())
+   if strategy == 'uniform':
+      order = list(sources)
+      rng.shuffle(order)
+      return order
+
+   if strategy == 'degree':
+      indptr = csr.indptr
+      strata = defaultdict(list)
+      for v in sources:
+         degree = csr.degree(v) if alive is None else sum(alive[indptr[v]:indptr[v + 1]])
+         strata[degree].append(v)
+
+      keys = []
+      for members in strata.values():
+         rng.shuffle(members)
+         offset = rng.random()
+         keys.extend(((i + offset) / len(members), v) for i, v in enumerate(members))
+      keys.sort()
+      return [v for _, v in keys]
+
+   raise ValueError(f"Estratégia de amostragem '{strategy}' não suportada.")
+
+def _hoeffding_sample_size(n, epsilon, delta):
+   """
+   Número de fontes que garante, com probabilidade 1 - delta, erro máximo
+   epsilon na centralidade normalizada por n(n-2) de todos os vértices
+   (desigualdade de Hoeffding + união sobre os n vértices).
+   """
+   return min(n, math.ceil(math.log(2 * n / delta) / (2 * epsilon ** 2)))
+
+def brandes_approx(graph, k_sources=None, epsilon=None, delta=0.1, seed=None,
+                   strategy='uniform', top_k=None, batch_size=None, patience=3,
+                   min_overlap=0.98, workers=None, weighted=None, resolution=None):
+   """
+   Brandes aproximado por amostragem de fontes: acumula as dependências só de
+   uma amostra de fontes e reescala por n/k.
+
+   O tamanho da amostra é ``k_sources`` ou, se ``epsilon`` for informado, o
+   necessário para o limite (epsilon, delta). Com ``top_k`` o modo é
+   adaptativo: as fontes são processadas em lotes e a execução para quando o
+   conjunto dos top_k vértices fica estável (ao menos ``min_overlap`` dele se
+   repete) por ``patience`` lotes seguidos.
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+       k_sources (int): Número de fontes amostradas
+       epsilon (float): Erro máximo na centralidade normalizada por n(n-2)
+       delta (float): Probabilidade de o erro ultrapassar epsilon
+       seed (int): Semente da amostragem
+       strategy (str): 'uniform' ou 'degree' (estratificada pelo grau)
+       top_k (int): Tamanho do ranking monitorado no modo adaptativo
+       batch_size (int): Fontes por lote no modo adaptativo (padrão: 1% de n)
+       patience (int): Lotes com o top_k estável antes de parar
+       min_overlap (float): Fração do top_k que deve se repetir entre lotes
+       workers (int): Número de processos, como em ``brandes``
+       weighted (bool): Uso dos pesos, como em ``brandes``
+       resolution (float): Arredondamento dos pesos, como em ``brandes``
+
+   Returns:
+       centrality (dict): Dicionário com a centralidade estimada de cada vértice
+   """
+   if k_sources is None and epsilon is None:
+      raise ValueError("Informe k_sources ou epsilon.")
+
+   csr, sources, alive = unwrap(graph)
+   n = len(sources)
+   if n == 0:
+      return {}
+
+   limit = k_sources if k_sources is not None else _hoeffding_sample_size(n, epsilon, delta)
+   limit = max(1, min(n, limit))
+   order = _sample_order(csr, random.Random(seed), strategy, sources, alive)[:limit]
+
+   if batch_size is None:
+      batch_size = max(1, -(-n // 100)) if top_k else limit
+   if workers == 0:
+      workers = os.cpu_count()
+   parallel = workers is not None and workers > 1
+   weighted = _is_weighted(csr, weighted)
+   if weighted and resolution is not None:
+      csr = _quantize(csr, resolution)
+
+   centrality = array('d', bytes(8 * csr.size()))
+   adjacency = csr.adjacency() if not parallel else None
+   done = 0
+   stable = 0
+   previous = None
+
+   with _process_pool(workers, csr, alive, True) if parallel else nullcontext() as pool:
+      while done < limit:
+         batch = order[done:done + batch_size]
+         # Em série o lote é um bloco só: blocos de uma fonte pagariam um
+         # array O(n) e sua soma por fonte
+         pieces = [batch]
+         if parallel:
+            pieces = [batch[r.start:r.stop] for r in _source_chunks(len(batch), -(-len(batch) // (4 * workers)))]
+         _accumulate(csr, pieces, centrality, pool, weighted, alive, adjacency=adjacency)
+         done += len(batch)
+
+         if top_k:
+            current = set(heapq.nlargest(top_k, sources, key=centrality.__getitem__))
+            overlap = len(current & previous) / len(current) if previous else 0
+            stable = stable + 1 if overlap >= min_overlap else 0
+            previous = current
+            if stable >= patience:
+               break
+
+   scale = n / done
+   labels = csr.labels
+   return {labels[v]: centrality[v] * scale for v in sources}
+
+def _edge_sources(csr, sources, weighted=True, alive=None, nodes=False, adjacency=None):
+   """
+   Variante de ``_brandes_sources`` que acumula também a dependência que
+   atravessa cada aresta, na mesma propagação inversa.
+
+   Returns:
+      tuple (array, array | None): Centralidade parcial de cada aresta e, se
+         ``nodes``, de cada vértice (arrays 'd')
+   """
+   single_source = _csr_dijkstra if weighted else _csr_bfs
+   if adjacency is None:
+      adjacency = csr.adjacency()
+   tails = csr.tails
+   n = csr.size()
+   edge_values = array('d', bytes(8 * csr.number_of_edges()))
+   node_values = array('d', bytes(8 * n)) if nodes else None
+
+   for s in sources:
+      orders, predecessors, paths = single_source(csr, s, alive, adjacency)
+      contribution = [0] * n
+      for w in reversed(orders):
+         weight_w = 1 + contribution[w]
+         for e in predecessors[w]:
+            v = tails[e]
+            value = (paths[v]/paths[w]) * weight_w
+            edge_values[e] += value
+            contribution[v] += value
+         if nodes and w != s:
+            node_values[w] += contribution[w]
+
+   return edge_values, node_values
+
+def _edge_worker(sources, weighted=True, nodes=False):
+   csr, alive, adjacency = _worker_graph
+   return _edge_sources(csr, sources, weighted, alive, nodes, adjacency)
+
+def _twin_arcs(csr):
+   """
+   Para cada arco u->v de um grafo não dirigido, o id do arco v->u que
+   representa a mesma aresta (arestas paralelas são pareadas na ordem).
+   """
+   indptr, indices = csr.indptr, csr.indices
+   arcs = defaultdict(list)
+   for u in range(csr.size()):
+      for e in range(indptr[u], indptr[u + 1]):
+         arcs[u, indices[e]].append(e)
+
+   twins = array('q', range(len(indices)))
+   for (u, v), forward in arcs.items():
+      backward = arcs.get((v, u), ())
+      for e, twin in zip(forward, backward):
+         twins[e] = twin
+   return twins
+
+def edge_brandes(graph, workers=None, chunk_size=None, weighted=None, resolution=None,
+                 k_sources=None, seed=None, nodes=False):
+   """
+   Centralidade de intermediação das arestas (Brandes): a dependência de
+   cada fonte que atravessa a aresta u->v de um caminho mínimo é
+   sigma(u) / sigma(v) * (1 + delta(v)), acumulada na mesma propagação
+   inversa da centralidade dos vértices, que pode ser obtida junto.
+
+   O resultado é indexado pelo id da aresta no CSR (``glib.as_csr(graph)``,
+   ou ``view.csr`` em uma ``CSRView``), de u = ``csr.tails[e]`` a
+   v = ``csr.indices[e]``, em vez de um dicionário por pares de vértices.
+   Em grafos não dirigidos os dois arcos de uma aresta recebem o mesmo valor
+   (a soma dos dois sentidos) e, como em ``brandes``, cada par é contado nas
+   duas ordens. Arestas ocultas de uma visão ficam com 0.
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+       workers (int): Número de processos, como em ``brandes``
+       chunk_size (int): Quantidade de fontes por bloco, como em ``brandes``
+       weighted (bool): Uso dos pesos, como em ``brandes``
+       resolution (float): Arredondamento dos pesos, como em ``brandes``
+       k_sources (int): Se informado, amostra esse número de fontes
+           (uniforme) e reescala por n/k, como em ``brandes_approx``
+       seed (int): Semente da amostragem
+       nodes (bool): Se True, também retorna a centralidade dos vértices
+
+   Returns:
+       array: Centralidade de cada aresta (array 'd', por id de aresta)
+       tuple (array, dict): Com ``nodes``, também a centralidade de cada vértice
+   """
+   csr, sources, alive = unwrap(graph)
+   n = len(sources)
+   weighted = _is_weighted(csr, weighted)
+   if weighted and resolution is not None:
+      csr = _quantize(csr, resolution)
+
+   selected = sources
+   if k_sources is not None and n > 0:
+      selected = _sample_order(csr, random.Random(seed), 'uniform', sources, alive)[:max(1, min(n, k_sources))]
+   scale = n / len(selected) if len(selected) else 1.0
+
+   chunks = [selected[r.start:r.stop] for r in _source_chunks(len(selected), chunk_size)]
+   if workers == 0:
+      workers = os.cpu_count()
+
+   edge_values = array('d', bytes(8 * csr.number_of_edges()))
+   node_values = array('d', bytes(8 * csr.size()))
+   parallel = workers is not None and workers > 1 and len(chunks) > 1
+   with _process_pool(workers, csr, alive, True) if parallel else nullcontext() as pool:
+      if pool is None:
+         adjacency = csr.adjacency()
+         partials = (_edge_sources(csr, chunk, weighted, alive, nodes, adjacency) for chunk in chunks)
+      else:
+         partials = pool.map(partial(_edge_worker, weighted=weighted, nodes=nodes), chunks)
+      for partial_edges, partial_nodes in partials:
+         for e, value in enumerate(partial_edges):
+            edge_values[e] += value
+         if nodes:
+            for v, value in enumerate(partial_nodes):
+               node_values[v] += value
+
+   if not csr.is_directed():
+      twins = _twin_arcs(csr)
+      edge_values = array('d', (
+         edge_values[e] + edge_values[twin] if twin != e else edge_values[e]
+         for e, twin in enumerate(twins)
+      ))
+   if scale != 1.0:
+      for e in range(len(edge_values)):
+         edge_values[e] *= scale
+
+   if nodes:
+      labels = csr.labels
+      return edge_values, {labels[v]: node_values[v] * scale for v in sources}
+   return edge_values
+
+def _moment_sources(csr, sources, weighted=True, alive=None, adjacency=None, total=None, squares=None):
+   """
+   Soma e soma dos quadrados das dependências de cada fonte em cada id
+   (para as variâncias empíricas de ``top_k_betweenness``). Com ``total`` e
+   ``squares`` (listas, mais rápidas de atualizar que arrays 'd'), acumula
+   direto neles em vez de alocar arrays novos.
+
+   Returns:
+      tuple (array, array): Somas e somas dos quadrados (arrays 'd')
+   """
+   if total is None:
+      total = array('d', bytes(8 * csr.size()))
+      squares = array('d', bytes(8 * csr.size()))
+   if adjacency is None:
+      adjacency = csr.adjacency()
+   for s in sources:
+      orders, _, contribution = _dependencies(csr, s, weighted, alive, adjacency=adjacency)
+      # orders[0] é a própria fonte
+      for w in islice(orders, 1, None):
+         value = contribution[w]
+         total[w] += value
+         squares[w] += value * value
+   return total, squares
+
+def _moments_worker(sources, weighted=True):
+   csr, alive, adjacency = _worker_graph
+   return _moment_sources(csr, sources, weighted, alive, adjacency)
+
+def top_k_betweenness(graph, k, epsilon=0.0, delta=0.1, seed=None, batch_size=None,
+                      workers=None, weighted=None, resolution=None) -> list:
+   """
+   Os k vértices de maior centralidade de intermediação, sem calcular o valor
+   exato de todos: as fontes são amostradas sem reposição em lotes que dobram
+   de tamanho e, a cada lote, cada vértice ganha um intervalo de confiança
+   (Bernstein-Serfling empírico: variância da amostra e correção de
+   população finita, com união sobre vértices e lotes). Para assim que o
+   limite inferior de todo vértice do top k supera o limite superior de
+   todo vértice fora dele (menos a tolerância ``epsilon``); no pior caso
+   todas as fontes são processadas e o resultado é o exato.
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+       k (int): Tamanho do ranking
+       epsilon (float): Tolerância na fronteira do top k, na centralidade
+           normalizada por n(n-2) (0 = conjunto certificado)
+       delta (float): Probabilidade de o conjunto certificado estar errado
+       seed (int): Semente da amostragem
+       batch_size (int): Fontes do primeiro lote (padrão: 1% de n)
+       workers (int): Número de processos, como em ``brandes``
+       weighted (bool): Uso dos pesos, como em ``brandes``
+       resolution (float): Arredondamento dos pesos, como em ``brandes``
+
+   Returns:
+       list: Pares (vértice, centralidade estimada), do maior para o menor
+   """
+   csr, sources, alive = unwrap(graph)
+   n = len(sources)
+   k = min(k, n)
+   if k <= 0:
+      return []
+   weighted = _is_weighted(csr, weighted)
+   if weighted and resolution is not None:
+      csr = _quantize(csr, resolution)
+
+   order = _sample_order(csr, random.Random(seed), 'uniform', sources, alive)
+   if batch_size is None:
+      batch_size = max(1, -(-n // 100))
+   if workers == 0:
+      workers = os.cpu_count()
+   parallel = workers is not None and workers > 1
+
+   # Cada dependência fica em [0, n - 2]; união sobre os n vértices, os dois
+   # lados do intervalo e os lotes (no máximo log2(n / batch_size) + 1)
+   rounds = max(1, math.ceil(math.log2(max(1, n / batch_size)))) + 1
+   log_term = math.log(5 * 2 * n * rounds / delta)
+   kappa = 7 / 3 + 3 / math.sqrt(2)
+   tolerance = epsilon * n * (n - 2)
+
+   total = [0.0] * csr.size()
+   squares = [0.0] * csr.size()
+   adjacency = csr.adjacency() if not parallel else None
+   done = 0
+   with _process_pool(workers, csr, alive, True) if parallel else nullcontext() as pool:
+      while True:
+         batch = order[done:max(batch_size, 2 * done)]
+         if pool is None:
+            # Em série o lote inteiro é um bloco só, somado direto nos
+            # acumuladores (sem um par de arrays O(n) por bloco)
+            _moment_sources(csr, batch, weighted, alive, adjacency, total, squares)
+         else:
+            pieces = [batch[r.start:r.stop] for r in _source_chunks(len(batch), -(-len(batch) // (4 * workers)))]
+            for partial_total, partial_squares in pool.map(partial(_moments_worker, weighted=weighted), pieces):
+               for v in sources:
+                  total[v] += partial_total[v]
+                  squares[v] += partial_squares[v]
+         done += len(batch)
+
+         scale = n / done
+         top = heapq.nlargest(k, sources, key=total.__getitem__)
+         if done == n or k == n:
+            break
+
+         rho = (1 - done / n) * (1 + 1 / done if done > n / 2 else 1)
+         fixed = kappa * (n - 2) * log_term / done
+         def radius(v):
+            mean = total[v] / done
+            variance = max(0.0, squares[v] / done - mean * mean)
+            return n * (math.sqrt(2 * variance * rho * log_term / done) + fixed)
+
+         members = set(top)
+         lower = min(total[v] * scale - radius(v) for v in top)
+         upper = max(total[v] * scale + radius(v) for v in sources if v not in members)
+         if lower >= upper - tolerance:
+            break
+
+   labels = csr.labels
+   return [(labels[v], total[v] * scale) for v in top]
+
+def group_betweenness(graph, group, weighted=None, resolution=None, normalized=False) -> float:
+   """
+   Centralidade de intermediação de grupo (Everett e Borgatti): soma, sobre
+   os pares ordenados (s, t) com s e t fora do grupo, da fração dos caminhos
+   mínimos de s a t que passam por ao menos um vértice do grupo. Em cada
+   fonte, os caminhos que evitam o grupo são contados no mesmo DAG de
+   caminhos mínimos (zerando os vértices do grupo) e a fração é
+   1 - evitam / total.
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+       group (iterable): Vértices do grupo
+       weighted (bool): Uso dos pesos, como em ``brandes``
+       resolution (float): Arredondamento dos pesos, como em ``brandes``
+       normalized (bool): Se True, divide pelo número de pares ordenados
+           fora do grupo
+
+   Returns:
+       float: Centralidade de intermediação do grupo
+   """
+   csr, sources, alive = unwrap(graph)
+   weighted = _is_weighted(csr, weighted)
+   if weighted and resolution is not None:
+      csr = _quantize(csr, resolution)
+   members = {csr.id_of(node) for node in group}
+   single_source = _csr_dijkstra if weighted else _csr_bfs
+   adjacency = csr.adjacency()
+   tails = csr.tails
+
+   total = 0.0
+   for s in sources:
+      if s in members:
+         continue
+      orders, predecessors, paths = single_source(csr, s, alive, adjacency)
+      avoiding = {s: 1}
+      for w in orders[1:]:
+         if w in members:
+            avoiding[w] = 0
+            continue
+         avoiding[w] = sum(avoiding[tails[e]] for e in predecessors[w])
+         total += 1 - avoiding[w] / paths[w]
+
+   if normalized:
+      outside = sum(1 for s in sources if s not in members)
+      return total / (outside * (outside - 1)) if outside > 1 else 0.0
+   return total
+
+def _sample_paths(csr, sources, seeds, targets, per_source, weighted=True, alive=None,
+                  adjacency=None):
+   """
+   Sorteia, para cada fonte, ``per_source`` destinos em ``targets`` e um
+   caminho mínimo uniforme até cada um, reaproveitando o DAG (antecessores e
+   contagens de caminhos) da fonte para todos eles: a partir do destino, cada
+   antecessor é escolhido com probabilidade proporcional às suas contagens.
+
+   Returns:
+      list: Vértices internos de cada caminho (lista vazia se não houver
+         caminho ou se ele não tiver vértices internos)
+   """
+   single_source = _csr_dijkstra if weighted else _csr_bfs
+   if adjacency is None:
+      adjacency = csr.adjacency()
+   tails = csr.tails
+   sampled = []
+   for s, seed in zip(sources, seeds):
+      rng = random.Random(seed)
+      _, predecessors, paths = single_source(csr, s, alive, adjacency)
+      for _ in range(per_source):
+         t = rng.choice(targets)
+         while t == s:
+            t = rng.choice(targets)
+         inner = []
+         if paths[t]:
+            w = t
+            while True:
+               threshold = rng.random() * paths[w]
+               for e in predecessors[w]:
+                  v = tails[e]
+                  threshold -= paths[v]
+                  if threshold < 0:
+                     break
+               if v == s:
+                  break
+               inner.append(v)
+               w = v
+         sampled.append(inner)
+   return sampled
+
+def _paths_worker(sources, seeds, targets, per_source, weighted=True):
+   csr, alive, adjacency = _worker_graph
+   return _sample_paths(csr, sources, seeds, targets, per_source, weighted, alive, adjacency)
+
+def greedy_group_betweenness(graph, k, samples=20000, per_source=50, seed=None,
+                             workers=None, weighted=None, resolution=None) -> list:
+   """
+   Escolhe um grupo de k vértices com alta centralidade de intermediação de
+   grupo: sorteia ``samples`` pares (s, t) com um caminho mínimo uniforme
+   cada e resolve a cobertura máxima gulosa sobre esses caminhos (cada
+   vértice escolhido cobre os caminhos que passam por ele; aproximação
+   1 - 1/e do ótimo da amostra). Ao contrário da união de rankings, um
+   vértice cujos caminhos já estão cobertos por outro não ganha nada.
+
+   As fontes são sorteadas em blocos de ``per_source`` destinos, de modo que
+   uma única busca serve a vários caminhos; as buscas podem rodar em
+   processos (``workers``), com resultado independente do número deles.
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+       k (int): Tamanho do grupo
+       samples (int): Número de caminhos sorteados
+       per_source (int): Caminhos sorteados por fonte
+       seed (int): Semente da amostragem
+       workers (int): Número de processos, como em ``brandes``
+       weighted (bool): Uso dos pesos, como em ``brandes``
+       resolution (float): Arredondamento dos pesos, como em ``brandes``
+
+   Returns:
+       list: Vértices do grupo, na ordem de escolha
+   """
+   csr, sources, alive = unwrap(graph)
+   if len(sources) < 2 or k <= 0:
+      return []
+   weighted = _is_weighted(csr, weighted)
+   if weighted and resolution is not None:
+      csr = _quantize(csr, resolution)
+
+   rng = random.Random(seed)
+   count = -(-samples // per_source)
+   origins = [rng.choice(sources) for _ in range(count)]
+   seeds = [rng.getrandbits(64) for _ in range(count)]
+   if workers == 0:
+      workers = os.cpu_count()
+   parallel = workers is not None and workers > 1
+
+   pieces = _source_chunks(count, -(-count // (4 * workers)) if parallel else None)
+   with _process_pool(workers, csr, alive, True) if parallel else nullcontext() as pool:
+      if pool is None:
+         adjacency = csr.adjacency()
+         batches = (_sample_paths(csr, origins[r.start:r.stop], seeds[r.start:r.stop], sources,
+                                  per_source, weighted, alive, adjacency) for r in pieces)
+      else:
+         batches = pool.map(
+            partial(_paths_worker, targets=sources, per_source=per_source, weighted=weighted),
+            [origins[r.start:r.stop] for r in pieces],
+            [seeds[r.start:r.stop] for r in pieces]
+         )
+      covering = defaultdict(list)
+      path_id = 0
+      for batch in batches:
+         for inner in batch:
+            for v in inner:
+               covering[v].append(path_id)
+            path_id += 1
+
+   # Guloso preguiçoso: a cobertura de um vértice só diminui, então o topo do
+   # heap só precisa ser recontado
+   covered = bytearray(path_id)
+   heap = [(-len(paths), v) for v, paths in covering.items()]
+   heapq.heapify(heap)
+   chosen = []
+   while heap and len(chosen) < k:
+      _, v = heapq.heappop(heap)
+      gain = sum(1 for p in covering[v] if not covered[p])
+      if heap and gain < -heap[0][0]:
+         heapq.heappush(heap, (-gain, v))
+         continue
+      if gain == 0:
+         break
+      chosen.append(v)
+      for p in covering[v]:
+         covered[p] = 1
+
+   # Completa com os vértices mais frequentes nos caminhos (ou quaisquer) se
+   # os caminhos sorteados já estiverem todos cobertos
+   if len(chosen) < k:
+      taken = set(chosen)
+      rest = sorted((v for v in sources if v not in taken), key=lambda v: -len(covering.get(v, ())))
+      chosen.extend(rest[:k - len(chosen)])
+
+   labels = csr.labels
+   return [labels[v] for v in chosen]
+
+class DynamicBrandes:
+   """
+   Centralidade de Brandes com atualização incremental após remoção de
+   vértices ou arestas.
+
+   O estado guarda, para cada fonte ``s``, um bitset com as arestas do seu DAG
+   de caminhos mínimos (n * m / 8 bytes no total). Removido um elemento, só
+   são recalculadas as fontes cujo DAG passa por ele:
+
+   - aresta (u, v): fontes em que a aresta está no DAG;
+   - vértice x: fontes em que x é interno (alguma aresta de saída de x está
+     no DAG). Nas demais, x é apenas folha e os pares (s, x) são descontados
+     de uma vez com um passo a partir de x no grafo transposto.
+
+   Se a atualização tocaria quase todas as fontes, o estado é recalculado do
+   zero, de modo que uma remoção nunca custa mais que ~um Brandes completo.
+   """
+   def __init__(self, graph, weighted=None, resolution=None):
+      """
+      Calcula o Brandes completo e os DAGs de todas as fontes.
+
+      Args:
+         graph (Graph | CSRGraph | CSRView): Grafo
+         weighted (bool): Uso dos pesos, como em ``brandes``
+         resolution (float): Arredondamento dos pesos, como em ``brandes``
+      """
+      csr, sources, alive = unwrap(graph)
+      n = csr.size()
+      m = csr.number_of_edges()
+
+      self._weighted = _is_weighted(csr, weighted)
+      if self._weighted and resolution is not None:
+         csr = _quantize(csr, resolution)
+      self._csr = csr
+      self._alive = bytearray(alive) if alive is not None else bytearray(b'\x01') * m
+      self._removed = bytearray(b'\x01') * n
+      for s in sources:
+         self._removed[s] = 0
+      self._centrality = array('d', bytes(8 * n))
+      self._dags = [None] * n
+      # As buscas se repetem a cada remoção: as listas de adjacência ficam
+      # com o objeto (bem menores que os DAGs guardados)
+      self._adjacency = csr.adjacency()
+
+      if csr.is_directed():
+         self._transposed, transposed_ids = csr.reversed()
+         self._transposed_adjacency = self._transposed.adjacency()
+         self._transposed_alive = bytearray(self._alive[e] for e in transposed_ids)
+         self._transposed_position = array('q', bytes(8 * m))
+         for k, e in enumerate(transposed_ids):
+            self._transposed_position[e] = k
+
+      for s in sources:
+         self._add_source(s, 1)
+
+   def _add_source(self, s, sign, excluded=None):
+      """
+      Soma (sign=1) ou subtrai (sign=-1) a dependência da fonte ``s`` no
+      grafo atual; ao somar, atualiza também o DAG guardado de ``s``.
+      """
+      orders, predecessors, contribution = _dependencies(
+         self._csr, s, self._weighted, self._alive, excluded, self._adjacency
+      )
+      centrality = self._centrality
+      for w in orders:
+         if w != s:
+            centrality[w] += sign * contribution[w]
+
+      if sign > 0:
+         dag = bytearray((self._csr.number_of_edges() + 7) // 8)
+         for w in orders:
+            for e in predecessors[w]:
+               dag[e >> 3] |= 1 << (e & 7)
+         self._dags[s] = dag
+
+   def _sources_using(self, edges):
+      """
+      Returns:
+         list: fontes ativas cujo DAG contém alguma das arestas ``edges``.
+      """
+      edges = [e for e in edges if self._alive[e]]
+      return [
+         s for s, dag in enumerate(self._dags)
+         if dag is not None and any(dag[e >> 3] >> (e & 7) & 1 for e in edges)
+      ]
+
+   def _kill_edges(self, edges):
+      for e in edges:
+         self._alive[e] = 0
+         if self._csr.is_directed():
+            self._transposed_alive[self._transposed_position[e]] = 0
+
+   def _recompute(self, sources, edges, excluded=None):
+      """
+      Troca a dependência antiga de ``sources`` pela nova, sem ``edges``.
+      """
+      for s in sources:
+         self._add_source(s, -1, excluded)
+      self._kill_edges(edges)
+      for s in sources:
+         self._add_source(s, 1)
+
+   def _rebuild(self, edges):
+      """
+      Recalcula tudo do zero sem ``edges``: usado quando quase todas as fontes
+      seriam afetadas e a atualização custaria mais que o Brandes completo.
+      """
+      self._kill_edges(edges)
+      self._centrality = array('d', bytes(8 * self._csr.size()))
+      for s in range(self._csr.size()):
+         if self._removed[s]:
+            self._dags[s] = None
+         else:
+            self._add_source(s, 1)
+
+   def remove_edge(self, u, v) -> int:
+      """
+      Remove a aresta (u, v) (e (v, u), se o grafo for não dirigido).
+
+      Args:
+         u, v (hashable): Vértices da aresta.
+
+      Returns:
+         int: número de fontes recalculadas.
+      """
+      csr = self._csr
+      a, b = csr.id_of(u), csr.id_of(v)
+      pairs = [(a, b)] if csr.is_directed() else [(a, b), (b, a)]
+      edges = [
+         e
+         for x, y in pairs
+         for e in range(csr.indptr[x], csr.indptr[x + 1])
+         if csr.indices[e] == y and self._alive[e]
+      ]
+
+      affected = self._sources_using(edges)
+      self._recompute(affected, edges)
+      return len(affected)
+
+   def remove_nodes(self, nodes) -> int:
+      """
+      Remove de uma vez vários vértices e todas as suas arestas.
+
+      Args:
+         nodes (iterable): Vértices a serem removidos.
+
+      Returns:
+         int: número de fontes recalculadas.
+      """
+      csr = self._csr
+      targets = {csr.id_of(node) for node in nodes} - {
+         x for x in range(csr.size()) if self._removed[x]
+      }
+      if not targets:
+         return 0
+
+      rptr, edge_ids = csr.reverse_index()
+      out_edges = [
+         e for x in targets
+         for e in range(csr.indptr[x], csr.indptr[x + 1]) if self._alive[e]
+      ]
+      in_edges = [
+         e for x in targets
+         for e in edge_ids[rptr[x]:rptr[x + 1]] if self._alive[e]
+      ]
+      affected = [s for s in self._sources_using(out_edges) if s not in targets]
+      remaining = csr.size() - sum(self._removed) - len(targets)
+
+      if 2 * (len(affected) + len(targets)) >= remaining:
+         for x in targets:
+            self._removed[x] = 1
+         self._rebuild(out_edges + in_edges)
+         return remaining
+
+      for x in targets:
+         # Pares (x, t): dependência de x como fonte
+         self._add_source(x, -1)
+         # Pares (s, x) com s fora de targets: x como fonte no grafo transposto
+         if csr.is_directed():
+            orders, _, contribution = _dependencies(
+               self._transposed, x, self._weighted, self._transposed_alive, targets,
+               self._transposed_adjacency
+            )
+            for w in orders:
+               if w != x:
+                  self._centrality[w] -= contribution[w]
+         else:
+            self._add_source(x, -1, targets)
+
+      # Fontes em que algum vértice removido é interno: os pares (s, x) já
+      # foram descontados acima
+      self._recompute(affected, out_edges + in_edges, excluded=targets)
+
+      for x in targets:
+         self._removed[x] = 1
+         self._dags[x] = None
+         self._centrality[x] = 0
+      return len(affected)
+
+   def remove_node(self, node) -> int:
+      """
+      Remove o vértice ``node`` e todas as suas arestas.
+
+      Args:
+         node (hashable): Vértice a ser removido.
+
+      Returns:
+         int: número de fontes recalculadas.
+      """
+      return self.remove_nodes([node])
+
+   def centrality(self) -> dict:
+      """
+      Returns:
+         dict: centralidade atual de cada vértice não removido.
+      """
+      labels = self._csr.labels
+      return {
+         labels[v]: c
+         for v, c in enumerate(self._centrality)
+         if not self._removed[v]
+      }
+
+def connected_components(graph) -> list:
+   """
+   Componentes conexas (fracamente conexas, se o grafo for dirigido).
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+
+   Returns:
+       list: Lista de componentes (listas de vértices), da maior para a menor
+   """
+   csr, sources, alive = unwrap(graph)
+   indptr, indices, tails = csr.indptr, csr.indices, csr.tails
+   rptr, edge_ids = csr.reverse_index() if csr.is_directed() else (None, None)
+
+   component = [-1] * csr.size()
+   components = []
+   for root in sources:
+      if component[root] >= 0:
+         continue
+      component[root] = len(components)
+      members = [root]
+      for u in members:
+         edges = range(indptr[u], indptr[u + 1])
+         neighbors = [indices[e] for e in edges if alive is None or alive[e]]
+         if rptr is not None:
+            neighbors += [
+               tails[e] for e in edge_ids[rptr[u]:rptr[u + 1]] if alive is None or alive[e]
+            ]
+         for v in neighbors:
+            if component[v] < 0:
+               component[v] = component[root]
+               members.append(v)
+      components.append(members)
+
+   components.sort(key=len, reverse=True)
+   labels = csr.labels
+   return [[labels[v] for v in members] for members in components]
+
+def _distances(csr, start, weighted=True, alive=None):
+   """
+   Distâncias mínimas de ``start`` a todos os ids (inf se inalcançável).
+   """
+   indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+   distances = [float('inf')] * csr.size()
+   distances[start] = 0
+
+   if not weighted:
+      queue = deque([start])
+      while queue:
+         u = queue.popleft()
+         next_dist = distances[u] + 1
+         for e in range(indptr[u], indptr[u + 1]):
+            if alive is not None and not alive[e]:
+               continue
+            v = indices[e]
+            if distances[v] == float('inf'):
+               distances[v] = next_dist
+               queue.append(v)
+      return distances
+
+   heap = [(0, start)]
+   while heap:
+      dist_u, u = heapq.heappop(heap)
+      if dist_u > distances[u]:
+         continue
+      for e in range(indptr[u], indptr[u + 1]):
+         if alive is not None and not alive[e]:
+            continue
+         v = indices[e]
+         alt = dist_u + weights[e]
+         if alt < distances[v]:
+            distances[v] = alt
+            heapq.heappush(heap, (alt, v))
+   return distances
+
+def global_efficiency(graph, k_sources=None, seed=None, weighted=None) -> float:
+   """
+   Eficiência global: média de 1/d(s, t) sobre todos os pares s != t (pares
+   desconectados contam 0). Com ``k_sources``, estima a média a partir de uma
+   amostra uniforme de fontes.
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+       k_sources (int): Número de fontes amostradas (None = todas)
+       seed (int): Semente da amostragem
+       weighted (bool): Uso dos pesos, como em ``brandes``
+
+   Returns:
+       float: Eficiência global
+   """
+   csr, sources, alive = unwrap(graph)
+   n = len(sources)
+   if n < 2:
+      return 0.0
+
+   weighted = _is_weighted(csr, weighted)
+   if k_sources is not None and k_sources < n:
+      sources = random.Random(seed).sample(sources, k_sources)
+
+   total = 0.0
+   for s in sources:
+      total += sum(1 / d for d in _distances(csr, s, weighted, alive) if 0 < d < float('inf'))
+   return total / (len(sources) * (n - 1))
+
+def degree_centrality(graph) -> dict:
+   """
+   Centralidade de grau (número de vizinhos de saída de cada vértice).
+
+   Args:
+       graph (Graph | CSRGraph | CSRView): Grafo
+
+   Returns:
+       dict: Dicionário com o grau de cada vértice
+   """
+   if isinstance(graph, (CSRGraph, CSRView)):
+      csr, sources, _ = unwrap(graph)
+      return {csr.label_of(i): graph.degree(i) for i in sources}
+   return {v: len(graph[v]) for v in graph.nodes()}
@@ -1,24 +1,44 @@
+import heapq
 import time
 import sys
 import threading
 import random
 
-from dataset.load_graph import load_graph
-from utils.utils import netx_to_graph_lib, remove_nodes
+from tqdm import tqdm
+
+from dataset.load_graph import load_graph, load_csr, cache_key
+from utils.utils import remove_nodes
+from utils.cache import CentralityCache
 from plot.plot import (
    plot_graph,
    plot_bars,
    plot_SIR_comparison,
    plot_graph_with_removed
 )
-from simulations.simulations import simulate_SIR
+from simulations.ensemble import simulate_SIR_ensemble
 import lib.graph_lib as glib
 
+# Réplicas Monte-Carlo da simulação SIR por cenário
+SIR_REPLICAS = 100
+
+# Cache local do grafo baixado e do CSR convertido
+PLACE = 'Natal, Rio Grande do Norte, Brazil'
+CACHE_DIR = 'cache'
+
+# Resolução (m) dos comprimentos no Brandes: empates exatos entre caminhos
+LENGTH_RESOLUTION = 1e-3
+
+# Sem a thread de monitoramento do tqdm: as barras convivem com os pools de
+# processos (fork de um processo com threads pode travar)
+tqdm.monitor_interval = 0
+
 class live_timer:
    """
    Context manager que exibe em tempo real:
    Descrição: XX.Xs
    até o bloco terminar, sem interferir nas suas variáveis de tempo.
+
+   Roda em uma thread: não usar em blocos que criam pools de processos.
    """
    def __init__(self, desc: str, interval: float = 0.2):
       self.desc = desc
@@ -46,20 +66,35 @@ class live_timer:
       self._thread.join()
 
 
+def brandes_with_progress(G, checkpoint: str):
+   """
+   Brandes exato com barra de progresso (fontes concluídas e ETA) e
+   checkpoint periódico: se interrompido, a próxima execução continua dali.
+   """
+   with tqdm(total=G.size(), desc="glib.brandes", unit=" fontes") as bar:
+      return glib.brandes(
+         G,
+         workers=0,
+         checkpoint=checkpoint,
+         progress=lambda done, total: bar.update(done - bar.n),
+         resolution=LENGTH_RESOLUTION
+      )
+
+
 def main():
    print(f'Graph Lib Version: {glib.__version__}\n')
 
    # Carrega o grafo
    print('Carregando o grafo de Natal-RN...')
    with live_timer("load_graph"):
-      G_nx = load_graph('Natal, Rio Grande do Norte, Brazil', 'length')
+      G_nx = load_graph(PLACE, 'length', cache_dir=CACHE_DIR)
    plot_graph(G_nx, 'output/imgs/natal.png', figsize=(20, 20), node_size=10)
    print(" → imagem 'output/imgs/natal.png' gerada\n")
 
    # Converte para graph_lib
-   print('Convertendo para graph_lib...')
-   with live_timer("netx_to_graph_lib"):
-      G = netx_to_graph_lib(G_nx)
+   print('Convertendo para graph_lib (CSR)...')
+   with live_timer("load_csr"):
+      G = load_csr(PLACE, 'length', cache_dir=CACHE_DIR, G=G_nx)
    print()
    
    # Estatísticas de peso
@@ -68,21 +103,20 @@ def main():
    mean_weight = sum(weights) / len(weights) if weights else 0
    print(f'Grafo de Natal-RN com peso médio de {mean_weight:.2f}, entre {weight_min:.2f} e {weight_max:.2f} ({len(G.edges())} arestas)\n')
 
-   # Centralidades
+   # Centralidades (reaproveitadas do cache se o grafo não mudou; os tempos
+   # são os do cálculo original)
+   centrality_cache = CentralityCache(f'{CACHE_DIR}/centrality')
+
    print('Calculando centralidade de intermediação (Brandes)...')
-   start_time = time.time()
-   with live_timer("glib.brandes"):
-      cb = glib.brandes(G)
-   end_time = time.time()
-   cb_time = end_time - start_time
+   checkpoint = f"{CACHE_DIR}/{cache_key(PLACE, 'drive', 'length')}.brandes.ckpt"
+   cb, cb_time = centrality_cache.get_or_compute(
+      G, 'brandes', lambda: brandes_with_progress(G, checkpoint), {'resolution': LENGTH_RESOLUTION}
+   )
    
    print('Calculando centralidade de grau...')
-   start_time = time.time()
    with live_timer("glib.degree_centrality"):
-      dc = glib.degree_centrality(G)
+      dc, dc_time = centrality_cache.get_or_compute(G, 'degree_centrality', lambda: glib.degree_centrality(G))
    print()
-   end_time = time.time()
-   dc_time = end_time - start_time
    
    plot_bars(['Brandes', 'Grau'], [cb_time, dc_time], 'Tempo de execução (s)', 'Comparação de centralidades', 'output/imgs/times.png')
    
@@ -92,15 +126,24 @@ def main():
    k5 = max(1, total_nodes // 20)    # 5%
 
    # Top sets
-   cb_top_10 = [n for n, _ in sorted(cb.items(), key=lambda x: x[1], reverse=True)[:k10]]
-   dc_top_10 = [n for n, _ in sorted(dc.items(), key=lambda x: x[1], reverse=True)[:k10]]
-   cb_top_5 = [n for n, _ in sorted(cb.items(), key=lambda x: x[1], reverse=True)[:k5]]
-   dc_top_5 = [n for n, _ in sorted(dc.items(), key=lambda x: x[1], reverse=True)[:k5]]
+   # (seleção parcial: os top 5% são o prefixo dos top 10%)
+   cb_top_10 = [n for n, _ in heapq.nlargest(k10, cb.items(), key=lambda x: x[1])]
+   dc_top_10 = [n for n, _ in heapq.nlargest(k10, dc.items(), key=lambda x: x[1])]
+   cb_top_5 = cb_top_10[:k5]
+   dc_top_5 = dc_top_10[:k5]
 
    # Estratégia mista: união dos top 5% de cada
    mixed_set = set(cb_top_5) | set(dc_top_5)
    mixed_top = list(mixed_set)
 
+   # Grupo: 10% escolhidos juntos pela intermediação de grupo (sem contar
+   # duas vezes os caminhos já cobertos, como na união da estratégia mista)
+   print('Escolhendo grupo de remoção (intermediação de grupo)...')
+   # Sem live_timer: o cálculo cria um pool de processos (ver live_timer)
+   start = time.time()
+   group_top = glib.greedy_group_betweenness(G, k10, seed=0, workers=0, resolution=LENGTH_RESOLUTION)
+   print(f"glib.greedy_group_betweenness → concluído em {time.time() - start:.2f}s\n")
+
    # Random para comparação (10%)
    random_top = random.sample(list(G.nodes()), k10)
 
@@ -109,6 +152,7 @@ def main():
    plot_graph_with_removed(G_nx, cb_top_10,  'output/imgs/brandes_10.png', figsize=(20,20), node_size=10)
    plot_graph_with_removed(G_nx, dc_top_10,   'output/imgs/grau_10.png',    figsize=(20,20), node_size=10)
    plot_graph_with_removed(G_nx, mixed_top,   'output/imgs/mixed_10.png',   figsize=(20,20), node_size=10)
+   plot_graph_with_removed(G_nx, group_top,   'output/imgs/group_10.png',   figsize=(20,20), node_size=10)
    plot_graph_with_removed(G_nx, random_top,  'output/imgs/random_10.png',   figsize=(20,20), node_size=10)
    print(" → imagens de remoção salvas em 'output/imgs/'\n")
 
@@ -118,6 +162,7 @@ def main():
       'Brandes 10%': total_nodes - len(cb_top_10),
       'Grau 10%':   total_nodes - len(dc_top_10),
       'Mista 10%':   total_nodes - len(mixed_top),
+      'Grupo 10%':   total_nodes - len(group_top),
       'Random 10%': total_nodes - len(random_top)
    }
    plot_bars(
@@ -135,6 +180,7 @@ def main():
       'Brandes 10%': remove_nodes(G, cb_top_10),
       'Grau 10%':   remove_nodes(G, dc_top_10),
       'Mista 10%':   remove_nodes(G, mixed_top),
+      'Grupo 10%':   remove_nodes(G, group_top),
       'Random 10%': remove_nodes(G, random_top)
    }
    results = {}
@@ -151,17 +197,19 @@ def main():
    print("Nós infectados: ", len(infected))
     
    for name, graph in graphs.items():
-      print(f"Simulando SIR em: {name}")
-      S_count, I_count, R_count, I_total = simulate_SIR(
+      print(f"Simulando SIR em: {name} ({SIR_REPLICAS} réplicas)")
+      results[name] = simulate_SIR_ensemble(
          graph,
+         replicas=SIR_REPLICAS,
+         workers=0,
          steps=1000,
          mean_weight=mean_weight,
          infected_nodes=infected,
          min_days_infected=5,
          days_to_lose_immunity=180,
+         engine='numpy',
          verbose=True
       )
-      results[name] = {'S': S_count, 'I': I_count, 'R': R_count, 'I_total': I_total}
       print(f" → Simulação {name} concluída\n")
 
    # Plot final comparação SIR
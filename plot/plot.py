@@ -113,6 +113,7 @@ def plot_SIR_comparison(results: dict, path_dir: str = None):
 
     Args:
         results (dict): Dicionário com os nomes dos grafos como chave e um dict com listas 'S', 'I', 'R', 'I_total' como valor.
+            Se o dict tiver 'bands' (resumo de ``simulate_SIR_ensemble``), desenha também a faixa de confiança.
         path_dir (str, opcional): Diretório onde as imagens serão salvas. Se None, apenas exibe.
     """
     if path_dir:
@@ -134,6 +135,9 @@ def plot_SIR_comparison(results: dict, path_dir: str = None):
             y = valores[metric]
             x = list(range(len(y)))
             plt.plot(x, y, label=nome, color=colors[i % len(colors)])
+            if 'bands' in valores:
+                low, high = valores['bands'][metric]
+                plt.fill_between(x, low, high, color=colors[i % len(colors)], alpha=0.2)
 
         plt.xlabel("Iterações")
         plt.ylabel(f"Número de {metric}")
@@ -149,6 +153,46 @@ def plot_SIR_comparison(results: dict, path_dir: str = None):
         else:
             plt.show()
 
+def plot_removal_curves(results: dict, path_dir: str = None):
+    """
+    Gera 2 gráficos comparando, ao longo das rodadas de remoção, o tamanho da
+    maior componente conexa e a eficiência global entre estratégias.
+
+    Args:
+        results (dict): Nome da estratégia como chave e o dict retornado por
+            ``adaptive_removal`` (listas 'n_removed', 'lcc', 'efficiency') como valor.
+        path_dir (str, opcional): Diretório onde as imagens serão salvas. Se None, apenas exibe.
+    """
+    if path_dir:
+        os.makedirs(path_dir, exist_ok=True)
+
+    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
+    metrics = {
+        'lcc': ("Maior componente conexa", "Nós na maior componente"),
+        'efficiency': ("Eficiência global", "Eficiência"),
+    }
+
+    for metric, (title, ylabel) in metrics.items():
+        plt.figure(figsize=(10, 6))
+
+        for i, (nome, valores) in enumerate(results.items()):
+            plt.plot(valores['n_removed'], valores[metric], label=nome,
+                     color=colors[i % len(colors)], marker='o')
+
+        plt.xlabel("Nós removidos")
+        plt.ylabel(ylabel)
+        plt.title(title)
+        plt.legend()
+        plt.grid(True)
+        plt.tight_layout()
+
+        if path_dir:
+            caminho = os.path.join(path_dir, f"remocao_{metric}.png")
+            plt.savefig(caminho, dpi=300)
+            plt.close()
+        else:
+            plt.show()
+
 def plot_graph(
     G: nx.Graph,
     nome_arquivo: str = None,
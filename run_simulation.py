@@ -1,16 +1,21 @@
 import argparse
 import csv
+import heapq
 import os
 import time
 import random
-from dataset.load_graph import load_graph
-from utils.utils import netx_to_graph_lib, remove_nodes
+from dataset.load_graph import load_graph, load_csr, cache_key
+from utils.utils import remove_nodes
+from utils.cache import CentralityCache
 from plot.plot import plot_graph_with_removed, plot_SIR_comparison
-from simulations.simulations import simulate_SIR
+from simulations.ensemble import simulate_SIR_ensemble
 import lib.graph_lib as glib
 
 
-def run_simulation(place: str, percent: float = 0.1, output_dir: str = 'output'):
+def run_simulation(place: str, percent: float = 0.1, output_dir: str = 'output', workers: int = 0,
+                   epsilon: float = None, replicas: int = 100, seed: int = None,
+                   cache_dir: str = 'cache', offline: bool = False, source: str = None,
+                   resolution: float = 1e-3):
    os.makedirs(output_dir, exist_ok=True)
    imgs_dir = os.path.join(output_dir, 'imgs')
    os.makedirs(imgs_dir, exist_ok=True)
@@ -20,28 +25,39 @@ def run_simulation(place: str, percent: float = 0.1, output_dir: str = 'output')
    # 1. Load and convert graph
    with open(log_path, 'w') as log:
       log.write(f"Run simulation on: {place}\nPercent: {percent}\nStarted at {time.ctime()}\n")
-   G_nx = load_graph(place, 'length')
-   G = netx_to_graph_lib(G_nx)
+   G_nx = load_graph(place, 'length', cache_dir=cache_dir, offline=offline, source=source)
+   G = load_csr(place, 'length', cache_dir=cache_dir, source=source, G=G_nx)
 
    # Estatísticas de peso para SIR (usa 1.0 se não houver arestas ponderadas)
    weights = [attrs.get('weight', 1.0) for _, _, attrs in G.edges()]
    mean_weight = sum(weights) / len(weights) if weights else 1.0
 
    # 2. Compute centralities
-   cb = glib.brandes(G)
-   dc = glib.degree_centrality(G)
-
-   # 3. Determine top sets
    total = G.size()
    k = max(1, int(total * percent))
-   cb_top = [n for n,_ in sorted(cb.items(), key=lambda x: x[1], reverse=True)[:k]]
-   dc_top = [n for n,_ in sorted(dc.items(), key=lambda x: x[1], reverse=True)[:k]]
+   if epsilon is None:
+      centrality_cache = CentralityCache(os.path.join(cache_dir, 'centrality')) if cache_dir else None
+      checkpoint = None
+      if cache_dir:
+         checkpoint = os.path.join(cache_dir, cache_key(place, 'drive', 'length', source) + '.brandes.ckpt')
+      compute = lambda: glib.brandes(G, workers=workers, checkpoint=checkpoint, resolution=resolution)
+      if centrality_cache:
+         cb, _ = centrality_cache.get_or_compute(G, 'brandes', compute, {'resolution': resolution})
+      else:
+         cb = compute()
+      cb_ranked = heapq.nlargest(k, cb.items(), key=lambda x: x[1])
+   else:
+      # Só o ranking dos top k importa: amostragem progressiva até certificar o top k
+      cb_ranked = glib.top_k_betweenness(G, k, epsilon=epsilon, workers=workers, resolution=resolution)
+   dc = glib.degree_centrality(G)
+   dc_ranked = heapq.nlargest(k, dc.items(), key=lambda x: x[1])
+
+   # 3. Determine top sets (os rankings já vêm ordenados: o top k/2 é o prefixo)
+   cb_top = [n for n, _ in cb_ranked]
+   dc_top = [n for n, _ in dc_ranked]
    # mixed half-half
    k_half = max(1, k // 2)
-   mixed_top = list(set(
-      [n for n,_ in sorted(cb.items(), key=lambda x: x[1], reverse=True)[:k_half]] +
-      [n for n,_ in sorted(dc.items(), key=lambda x: x[1], reverse=True)[:k_half]]
-   ))
+   mixed_top = list(set(cb_top[:k_half] + dc_top[:k_half]))
 
    # 4. Save removed nodes list
    with open(csv_path, 'w', newline='') as fcsv:
@@ -73,18 +89,24 @@ def run_simulation(place: str, percent: float = 0.1, output_dir: str = 'output')
    # 7. Run SIR and collect
    results = {}
    for name, graph in graphs.items():
-      S, I, R, I_total = simulate_SIR(
+      summary = simulate_SIR_ensemble(
          graph,
+         replicas=replicas,
+         seed=seed,
+         workers=workers,
          steps=1000,
          mean_weight=mean_weight,
          infected_nodes=initial,
          min_days_infected=5,
          days_to_lose_immunity=180,
-         verbose=False
+         engine='numpy'
       )
-      results[name] = {'S': S, 'I': I, 'R': R, 'I_total': I_total}
+      results[name] = summary
+      low, high = summary['bands']['I_total']
       with open(log_path, 'a') as log:
-         log.write(f"Scenario: {name}\nTotal infected: {I_total}\n")
+         log.write(f"Scenario: {name}\nReplicas: {replicas}\n"
+                   f"Total infected (mean): {summary['I_total'][-1]:.1f} "
+                   f"[{low[-1]:.0f}, {high[-1]:.0f}]\n")
 
    # 8. Plot SIR comparison
    plot_SIR_comparison(results, imgs_dir)
@@ -98,5 +120,22 @@ if __name__ == '__main__':
    parser.add_argument('--percent', type=float, default=0.1,
                      help='Percentage of top nodes to remove')
    parser.add_argument('--output', default='output', help='Output directory')
+   parser.add_argument('--workers', type=int, default=0,
+                     help='Processes for Brandes (0 = all cores, 1 = serial)')
+   parser.add_argument('--epsilon', type=float, default=None,
+                     help='Use top_k_betweenness (progressive sampling) with this tolerance (default: exact)')
+   parser.add_argument('--replicas', type=int, default=100,
+                     help='Monte-Carlo SIR replicas per scenario')
+   parser.add_argument('--seed', type=int, default=None, help='Seed for the SIR replicas')
+   parser.add_argument('--cache-dir', default='cache',
+                     help='Directory for cached graphs (empty string disables the cache)')
+   parser.add_argument('--offline', action='store_true',
+                     help='Never download: use the cache or --source')
+   parser.add_argument('--source', default=None,
+                     help='Local .osm or .graphml file used instead of downloading')
+   parser.add_argument('--resolution', type=float, default=1e-3,
+                     help='Round edge lengths to multiples of this (m) in exact Brandes so equal paths tie')
    args = parser.parse_args()
-   run_simulation(args.place, args.percent, args.output)
+   run_simulation(args.place, args.percent, args.output, args.workers, args.epsilon,
+                  args.replicas, args.seed, args.cache_dir or None, args.offline, args.source,
+                  args.resolution)
@@ -0,0 +1,199 @@
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+
+import lib.graph_lib as glib
+from simulations.simulations import simulate_SIR
+from simulations.simulations_brandes import _random_weighted_graph
+from utils.utils import netx_to_graph_lib, remove_nodes
+
+CASES = (
+    'brandes', 'brandes_numpy', 'djikstra', 'shortest_paths', 'degree_centrality',
+    'simulate_SIR', 'netx_to_graph_lib', 'remove_nodes', 'networkx_betweenness'
+)
+
+def _maxrss_kb() -> int:
+    """
+    Pico de memória residente do processo atual, em KiB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em KiB no Linux e em bytes no macOS
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def _setup(case: str, graph_type: str, n: int, seed: int):
+    """
+    Monta os dados de ``case`` fora da medição e retorna a função (sem
+    argumentos) a ser medida.
+    """
+    random.seed(seed)
+    G_nx = _random_weighted_graph(n, graph_type, seed)
+    if case == 'netx_to_graph_lib':
+        return lambda: netx_to_graph_lib(G_nx)
+    if case == 'networkx_betweenness':
+        return lambda: nx.betweenness_centrality(G_nx, normalized=False, weight='weight')
+
+    graph = netx_to_graph_lib(G_nx)
+    csr = glib.as_csr(graph)
+    if case == 'brandes':
+        return lambda: glib.brandes(csr)
+    if case == 'brandes_numpy':
+        return lambda: glib.brandes(csr, engine='numpy')
+    if case == 'djikstra':
+        source = graph.nodes()[0]
+        return lambda: glib.djikstra(graph, source)
+    if case == 'shortest_paths':
+        source = graph.nodes()[0]
+        return lambda: glib.shortest_paths(csr, source)
+    if case == 'degree_centrality':
+        return lambda: glib.degree_centrality(graph)
+    if case == 'simulate_SIR':
+        infected = graph.nodes()[:max(1, n // 100)]
+        return lambda: simulate_SIR(csr, infected_nodes=infected, seed=seed)
+    if case == 'remove_nodes':
+        victims = random.sample(graph.nodes(), max(1, n // 10))
+        return lambda: remove_nodes(graph, victims)
+    raise ValueError(f"Caso '{case}' não suportado.")
+
+def _run_case(case: str, graph_type: str, n: int, seed: int, repeats: int) -> dict:
+    """
+    Executa um caso inteiro (no processo filho): aquecimento, ``repeats``
+    medições de tempo, uma execução sob ``tracemalloc`` e o pico de RSS.
+    """
+    fn = _setup(case, graph_type, n, seed)
+    rss_setup = _maxrss_kb()
+    fn()
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    rss_peak = _maxrss_kb()
+
+    tracemalloc.start()
+    fn()
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if repeats > 1:
+        q1, _, q3 = statistics.quantiles(times, n=4, method='inclusive')
+    else:
+        q1 = q3 = times[0]
+    return {
+        'case': case,
+        'graph_type': graph_type,
+        'n': n,
+        'repeats': repeats,
+        'median': statistics.median(times),
+        'iqr': q3 - q1,
+        'min': min(times),
+        'times': times,
+        'tracemalloc_peak': traced_peak,
+        'peak_rss_kb': rss_peak,
+        'rss_growth_kb': rss_peak - rss_setup,
+    }
+
+def run_suite(cases: list = CASES,
+              graph_types: list = ('erdos', 'planar'),
+              sizes: list = (200, 1000),
+              repeats: int = 5,
+              seed: int = 42,
+              verbose: bool = True) -> dict:
+    """
+    Mede cada caso em cada tipo de grafo e tamanho. Cada medição roda em um
+    processo novo ('spawn'), para que o pico de RSS seja só daquele caso e
+    não herde a memória das medições anteriores.
+
+    Args:
+        cases (list): Casos de ``CASES`` a medir
+        graph_types (list): Geradores de ``benchmark_brandes_custom``
+        sizes (list): Números de vértices
+        repeats (int): Repetições medidas (após uma de aquecimento)
+        seed (int): Semente dos grafos
+        verbose (bool): Se True, imprime cada resultado
+
+    Returns:
+        dict: 'meta' (ambiente) e 'results' (mediana, IQR, mínimo e tempos
+            em s, pico do tracemalloc em bytes, pico de RSS e seu aumento
+            durante a medição em KiB, por caso)
+    """
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for graph_type in graph_types:
+        for n in sizes:
+            for case in cases:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    result = pool.submit(_run_case, case, graph_type, n, seed, repeats).result()
+                results.append(result)
+                if verbose:
+                    print(f"[{graph_type} | n={n}] {case:<22} mediana = {result['median']:.4f}s "
+                          f"(IQR {result['iqr']:.4f}s), tracemalloc = {result['tracemalloc_peak'] / 1024:.0f} KiB, "
+                          f"RSS = {result['peak_rss_kb'] / 1024:.1f} MiB (+{result['rss_growth_kb'] / 1024:.1f})")
+
+    meta = {
+        'version': glib.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': seed,
+    }
+    return {'meta': meta, 'results': results}
+
+def save_results(results: dict, path: str):
+    """
+    Grava os resultados de ``run_suite`` em JSON.
+    """
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+def load_results(path: str) -> dict:
+    """
+    Lê resultados gravados por ``save_results``.
+    """
+    with open(path) as file:
+        return json.load(file)
+
+def compare(results: dict, baseline: dict, threshold: float = 0.1) -> list:
+    """
+    Compara a mediana de cada caso com a da linha de base. Um caso regrediu
+    se ficou mais de ``threshold`` (fração) mais lento e a diferença é maior
+    que a soma dos IQRs das duas medições (ruído).
+
+    Args:
+        results (dict): Resultados atuais (``run_suite``)
+        baseline (dict): Resultados de referência
+        threshold (float): Piora relativa tolerada
+
+    Returns:
+        list: Dicionários com 'case', 'graph_type', 'n', 'baseline', 'median',
+            'ratio' e 'regression' de cada caso presente nos dois resultados
+    """
+    reference = {
+        (r['case'], r['graph_type'], r['n']): r for r in baseline['results']
+    }
+    comparison = []
+    for result in results['results']:
+        old = reference.get((result['case'], result['graph_type'], result['n']))
+        if old is None:
+            continue
+        ratio = result['median'] / old['median'] if old['median'] > 0 else float('inf')
+        noise = result['iqr'] + old['iqr']
+        comparison.append({
+            'case': result['case'],
+            'graph_type': result['graph_type'],
+            'n': result['n'],
+            'baseline': old['median'],
+            'median': result['median'],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold and result['median'] - old['median'] > noise,
+        })
+    return comparison
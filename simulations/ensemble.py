@@ -0,0 +1,157 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from tqdm import tqdm
+
+from simulations.simulations import simulate_SIR
+
+METRICS = ('S', 'I', 'R', 'I_total')
+
+_worker_state = None
+
+def _init_worker(graph, kwargs):
+    global _worker_state
+    _worker_state = (graph, kwargs)
+
+def _run_replicas(seeds):
+    graph, kwargs = _worker_state
+    return [simulate_SIR(graph, seed=seed, **kwargs) for seed in seeds]
+
+def replica_seeds(seed: int, replicas: int) -> list:
+    """
+    Sementes independentes e reprodutíveis para cada réplica, derivadas de
+    ``seed`` com ``numpy.random.SeedSequence``.
+
+    Args:
+        seed (int): Semente do ensemble (None = entropia do sistema)
+        replicas (int): Número de réplicas
+
+    Returns:
+        list: Uma semente (int) por réplica
+    """
+    children = np.random.SeedSequence(seed).spawn(replicas)
+    return [int(child.generate_state(1)[0]) for child in children]
+
+def iter_SIR_replicas(graph, replicas: int = 100, seed: int = None, workers: int = 0,
+                      chunk_size: int = None, **kwargs):
+    """
+    Executa ``replicas`` simulações ``simulate_SIR`` independentes, em série
+    ou em um pool de processos. O grafo é enviado uma única vez a cada worker
+    (herdado via 'fork' quando disponível) e as réplicas vão em blocos de
+    sementes.
+
+    Args:
+        graph (glib.Graph | glib.CSRGraph | glib.CSRView): Grafo do graph_lib
+        replicas (int): Número de réplicas
+        seed (int): Semente do ensemble (ver ``replica_seeds``)
+        workers (int): Número de processos. None ou 1 executa em série;
+            0 usa todos os núcleos disponíveis
+        chunk_size (int): Réplicas por tarefa do pool (padrão: replicas / (4 * workers))
+        **kwargs: Demais parâmetros de ``simulate_SIR`` (exceto ``seed``)
+
+    Yields:
+        tuple: (S, I, R, I_total) de cada réplica, na ordem das sementes
+    """
+    kwargs['verbose'] = False
+    seeds = replica_seeds(seed, replicas)
+    if workers == 0:
+        workers = os.cpu_count()
+
+    if not workers or workers <= 1 or replicas <= 1:
+        for replica_seed in seeds:
+            yield simulate_SIR(graph, seed=replica_seed, **kwargs)
+        return
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-replicas // (4 * workers)))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, replicas, chunk_size)]
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(graph, kwargs)) as pool:
+        for runs in pool.map(_run_replicas, chunks):
+            yield from runs
+
+def summarize_SIR(runs: list, band: tuple = (0.05, 0.95)) -> dict:
+    """
+    Resume um conjunto de réplicas em trajetórias médias, medianas e faixas
+    de quantis. Réplicas que terminaram antes (sem S nem I) são estendidas
+    com o último valor.
+
+    Args:
+        runs (list): Tuplas (S, I, R, I_total) retornadas por ``simulate_SIR``
+        band (tuple): Quantis inferior e superior da faixa de confiança
+
+    Returns:
+        dict: Média de cada métrica em 'S', 'I', 'R', 'I_total' (mesmo formato
+            de ``plot_SIR_comparison``), 'median' e 'bands' (pares de listas
+            inferior/superior) por métrica e 'replicas'
+    """
+    runs = [run for run in runs if run]
+    summary = {'replicas': len(runs), 'median': {}, 'bands': {}}
+    if not runs:
+        return summary
+
+    length = max(len(run[0]) for run in runs)
+    for k, metric in enumerate(METRICS):
+        values = np.array(
+            [run[k] + [run[k][-1]] * (length - len(run[k])) for run in runs],
+            dtype=np.float64
+        )
+        low, median, high = np.quantile(values, [band[0], 0.5, band[1]], axis=0)
+        summary[metric] = values.mean(axis=0).tolist()
+        summary['median'][metric] = median.tolist()
+        summary['bands'][metric] = (low.tolist(), high.tolist())
+    return summary
+
+def iter_SIR_ensemble(graph, replicas: int = 100, every: int = 10, band: tuple = (0.05, 0.95),
+                      seed: int = None, workers: int = 0, verbose: bool = False, **kwargs):
+    """
+    Ensemble Monte-Carlo de ``simulate_SIR`` com resumo parcial a cada
+    ``every`` réplicas concluídas, para acompanhar a convergência (ou
+    redesenhar as faixas) antes do fim.
+
+    Args:
+        graph (glib.Graph | glib.CSRGraph | glib.CSRView): Grafo do graph_lib
+        replicas (int): Número de réplicas
+        every (int): Réplicas entre dois resumos parciais
+        band (tuple): Quantis da faixa de confiança (ver ``summarize_SIR``)
+        seed (int): Semente do ensemble
+        workers (int): Número de processos, como em ``iter_SIR_replicas``
+        verbose (bool): Se True, mostra a barra de progresso das réplicas
+        **kwargs: Demais parâmetros de ``simulate_SIR``
+
+    Yields:
+        dict: Resumo (ver ``summarize_SIR``) das réplicas concluídas até o momento
+    """
+    runs = []
+    replicas_iter = iter_SIR_replicas(graph, replicas, seed, workers, **kwargs)
+    for run in tqdm(replicas_iter, total=replicas, desc="Réplicas SIR", disable=not verbose):
+        runs.append(run)
+        if len(runs) % every == 0 or len(runs) == replicas:
+            yield summarize_SIR(runs, band)
+
+def simulate_SIR_ensemble(graph, replicas: int = 100, band: tuple = (0.05, 0.95),
+                          seed: int = None, workers: int = 0, verbose: bool = False, **kwargs) -> dict:
+    """
+    Executa ``replicas`` simulações SIR e retorna o resumo final.
+
+    Args:
+        graph (glib.Graph | glib.CSRGraph | glib.CSRView): Grafo do graph_lib
+        replicas (int): Número de réplicas
+        band (tuple): Quantis da faixa de confiança
+        seed (int): Semente do ensemble
+        workers (int): Número de processos (0 = todos os núcleos)
+        verbose (bool): Se True, mostra a barra de progresso das réplicas
+        **kwargs: Demais parâmetros de ``simulate_SIR`` (por ex. ``engine='numpy'``)
+
+    Returns:
+        dict: Resumo das réplicas (ver ``summarize_SIR``)
+    """
+    summary = summarize_SIR([], band)
+    for summary in iter_SIR_ensemble(graph, replicas, replicas, band, seed, workers, verbose, **kwargs):
+        pass
+    return summary
@@ -0,0 +1,96 @@
+import heapq
+import lib.graph_lib as glib
+from tqdm import tqdm
+from utils.utils import remove_nodes
+
+def _round_metrics(residual: glib.CSRView, efficiency_sources: int, seed: int):
+    """
+    Tamanho da maior componente conexa e eficiência global do grafo residual.
+    """
+    components = glib.connected_components(residual)
+    lcc = len(components[0]) if components else 0
+    efficiency = glib.global_efficiency(residual, k_sources=efficiency_sources, seed=seed)
+    return lcc, efficiency
+
+def adaptive_removal(graph: glib.Graph,
+                     fraction: float = 0.1,
+                     batch_size: int = None,
+                     method: str = 'approx',
+                     epsilon: float = 0.05,
+                     efficiency_sources: int = 200,
+                     seed: int = None,
+                     resolution: float = None,
+                     verbose: bool = False):
+    """
+    Remoção adaptativa de vértices por intermediação: a cada rodada remove os
+    ``batch_size`` vértices mais centrais do grafo residual e recalcula a
+    centralidade antes da próxima rodada.
+
+    Args:
+        graph (glib.Graph | glib.CSRGraph): Grafo do graph_lib
+        fraction (float): Fração dos vértices a remover no total
+        batch_size (int): Vértices removidos por rodada (padrão: 10% do total a remover)
+        method (str): Como recalcular a centralidade a cada rodada:
+            'approx' (``glib.brandes_approx`` com parada no top batch_size),
+            'incremental' (``glib.DynamicBrandes``, exato) ou
+            'static' (calcula uma vez, sem recálculo, para comparação)
+        epsilon (float): Limite de erro do modo 'approx'
+        efficiency_sources (int): Fontes amostradas para a eficiência global (None = todas)
+        seed (int): Semente das amostragens
+        resolution (float): Arredondamento dos pesos no cálculo da
+            centralidade, como em ``glib.brandes``
+        verbose (bool): Se True, mostra a barra de progresso
+
+    Returns:
+        dict: 'removed' (vértices na ordem de remoção) e, por rodada (a
+            primeira é o grafo original), 'n_removed', 'lcc' e 'efficiency'
+    """
+    csr = glib.as_csr(graph)
+    budget = max(1, int(csr.size() * fraction))
+    if batch_size is None:
+        batch_size = max(1, budget // 10)
+
+    removed = []
+    lcc, efficiency = _round_metrics(csr, efficiency_sources, seed)
+    results = {'removed': removed, 'n_removed': [0], 'lcc': [lcc], 'efficiency': [efficiency]}
+
+    if method == 'incremental':
+        dynamic = glib.DynamicBrandes(csr, resolution=resolution)
+    elif method == 'static':
+        static_cb = glib.brandes_approx(csr, epsilon=epsilon, top_k=budget, seed=seed,
+                                        resolution=resolution)
+    elif method != 'approx':
+        raise ValueError(f"Método '{method}' não suportado.")
+
+    residual = csr
+    progress = tqdm(total=budget, desc="Remoção adaptativa", disable=not verbose)
+
+    while len(removed) < budget:
+        k = min(batch_size, budget - len(removed))
+        if method == 'approx':
+            cb = glib.brandes_approx(residual, epsilon=epsilon, top_k=k, seed=seed,
+                                     resolution=resolution)
+        elif method == 'incremental':
+            cb = dynamic.centrality()
+        else:
+            removed_set = set(removed)
+            cb = {v: c for v, c in static_cb.items() if v not in removed_set}
+
+        victims = heapq.nlargest(k, cb, key=cb.get)
+        if not victims:
+            break
+        removed.extend(victims)
+        if method == 'incremental':
+            dynamic.remove_nodes(victims)
+
+        residual = remove_nodes(residual, victims)
+        lcc, efficiency = _round_metrics(residual, efficiency_sources, seed)
+        results['n_removed'].append(len(removed))
+        results['lcc'].append(lcc)
+        results['efficiency'].append(efficiency)
+
+        progress.update(len(victims))
+        progress.set_description(f"Removidos {len(removed)} -> LCC: {lcc}, Eficiência: {efficiency:.4f}")
+
+    progress.close()
+    return results
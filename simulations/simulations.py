@@ -1,4 +1,6 @@
+import heapq
 import lib.graph_lib as glib
+import math
 import random
 from tqdm import tqdm
 from utils.utils import clip
@@ -51,12 +53,14 @@ def simulate_SIR(graph: glib.Graph,
                  mean_weight: float = 1,
                  verbose: bool = False,
                  min_days_infected: int = 3,
-                 days_to_lose_immunity: int = None):
+                 days_to_lose_immunity: int = None,
+                 engine: str = 'python',
+                 seed: int = None):
     """
     Simulação SIR com suporte a tempo mínimo de infecção e perda de imunidade.
 
     Args:
-        graph (glib.Graph): Grafo do graph_lib
+        graph (glib.Graph | glib.CSRGraph | glib.CSRView): Grafo do graph_lib
         beta (float): Taxa de transmissão
         gamma (float): Taxa de recuperação
         steps (int): Número de iterações
@@ -64,28 +68,56 @@ def simulate_SIR(graph: glib.Graph,
         verbose (bool): Se True, exibe barra de progresso
         min_days_infected (int): Dias mínimos para recuperação
         days_to_lose_immunity (int): Dias para um recuperado voltar a ser suscetível
+        engine (str): 'python' (laço por vértice), 'numpy' (estados em arrays
+            e sorteios vetorizados sobre as arestas dos infectados) ou 'event'
+            (fila de eventos: custo proporcional ao número de eventos)
+        seed (int): Semente da simulação (None usa o gerador global ``random``
+            no motor 'python')
 
     Returns:
         tuple: Listas S, I, R ao longo das iterações
     """
-    nodes = graph.nodes()
+    csr, ids, alive = glib.unwrap(graph)
+    labels = csr.labels
+    nodes = [labels[i] for i in ids]
     if not nodes:
         return []
 
-    status = {node: 'S' for node in nodes}
-    days_infected = {}
-    days_recovered = {}
+    if engine == 'numpy':
+        return _simulate_SIR_numpy(csr, ids, beta, gamma, steps, infected_nodes, mean_weight,
+                                   verbose, min_days_infected, days_to_lose_immunity, seed)
+    if engine == 'event':
+        return _simulate_SIR_event(csr, ids, alive, beta, gamma, steps, infected_nodes, mean_weight,
+                                   verbose, min_days_infected, days_to_lose_immunity, seed)
+    if engine != 'python':
+        raise ValueError(f"Motor '{engine}' não suportado.")
+
+    rng = random.Random(seed) if seed is not None else random
+    n = csr.size()
+    indptr, indices = csr.indptr, csr.indices
+
+    # A probabilidade de transmissão por aresta não muda entre iterações
+    probs = [clip(beta * (mean_weight / (weight + 1e-6)), 0.075, beta) for weight in csr.weights]
+
+    # Vértices ocultos por uma visão ficam fora dos três estados ('X'): como
+    # nunca são suscetíveis nem infectados, suas arestas nunca são usadas
+    status = ['X'] * n
+    for i in ids:
+        status[i] = 'S'
+    days_infected = [0] * n
+    days_recovered = [0] * n
 
     if not infected_nodes:
         k = max(1, int(len(nodes) * 0.001))
-        infected = random.sample(nodes, k)
+        infected = rng.sample(nodes, k)
     else:
         k = len(infected_nodes)
         infected = infected_nodes
-        
+
     for node in infected:
-        status[node] = 'I'
-        days_infected[node] = 0
+        i = csr.id_of(node)
+        status[i] = 'I'
+        days_infected[i] = 0
 
     S_count = [len(nodes) - k]
     I_count = [k]
@@ -102,13 +134,12 @@ def simulate_SIR(graph: glib.Graph,
         new_days_recovered = days_recovered.copy()
         infected_count = I_total_count[-1]
 
-        for node in nodes:
+        for node in range(n):
             if status[node] == 'I':
                 # Tenta infectar vizinhos
-                for neighbor in graph[node]:
-                    weight = graph[node][neighbor]['weight']
-                    prob = clip(beta * (mean_weight / (weight + 1e-6)), 0.075, beta)
-                    if status[neighbor] == 'S' and random.random() < prob:
+                for e in range(indptr[node], indptr[node + 1]):
+                    neighbor = indices[e]
+                    if status[neighbor] == 'S' and rng.random() < probs[e]:
                         new_status[neighbor] = 'I'
                         new_days_infected[neighbor] = 0
                         infected_count += 1
@@ -117,9 +148,8 @@ def simulate_SIR(graph: glib.Graph,
                 new_days_infected[node] += 1
 
                 # Só pode se recuperar após X dias
-                if new_days_infected[node] >= min_days_infected and random.random() < gamma:
+                if new_days_infected[node] >= min_days_infected and rng.random() < gamma:
                     new_status[node] = 'R'
-                    del new_days_infected[node]
                     new_days_recovered[node] = 0
 
             elif status[node] == 'R':
@@ -128,15 +158,106 @@ def simulate_SIR(graph: glib.Graph,
                     new_days_recovered[node] += 1
                     if new_days_recovered[node] >= days_to_lose_immunity:
                         new_status[node] = 'S'
-                        del new_days_recovered[node]
 
         status = new_status
         days_infected = new_days_infected
         days_recovered = new_days_recovered
 
-        S = sum(1 for s in status.values() if s == 'S')
-        I = sum(1 for s in status.values() if s == 'I')
-        R = sum(1 for s in status.values() if s == 'R')
+        S = status.count('S')
+        I = status.count('I')
+        R = status.count('R')
+
+        S_count.append(S)
+        I_count.append(I)
+        R_count.append(R)
+        I_total_count.append(infected_count)
+
+        progress.set_description(f"Iteração {step} -> S: {S}, I: {I}, R: {R}")
+
+        if S == 0 and I == 0:
+            break
+
+    return S_count, I_count, R_count, I_total_count
+
+
+def _simulate_SIR_numpy(csr, ids, beta, gamma, steps, infected_nodes, mean_weight,
+                        verbose, min_days_infected, days_to_lose_immunity, seed):
+    """
+    Motor vetorizado do ``simulate_SIR``: estados em um array int8, mesma
+    dinâmica do motor 'python' (cada aresta de um infectado para um suscetível
+    é um sorteio de Bernoulli por iteração), com contadores S/I/R mantidos
+    incrementalmente em vez de recontados a cada passo.
+    """
+    import numpy as np
+
+    SUSCEPTIBLE, INFECTED, RECOVERED, HIDDEN = 0, 1, 2, 3
+    rng = np.random.default_rng(seed)
+
+    n = csr.size()
+    indptr = np.frombuffer(csr.indptr, dtype=np.int64)
+    heads = np.frombuffer(csr.indices, dtype=np.int32 if csr.indices.itemsize == 4 else np.int64)
+    weights = np.frombuffer(csr.weights, dtype=np.float64)
+    probs = np.clip(beta * (mean_weight / (weights + 1e-6)), 0.075, beta)
+
+    ids = np.asarray(ids, dtype=np.int64)
+    status = np.full(n, HIDDEN, dtype=np.int8)
+    status[ids] = SUSCEPTIBLE
+    days_infected = np.zeros(n, dtype=np.int64)
+    days_recovered = np.zeros(n, dtype=np.int64)
+
+    if not infected_nodes:
+        k = max(1, int(len(ids) * 0.001))
+        infected = rng.choice(ids, k, replace=False)
+    else:
+        k = len(infected_nodes)
+        infected = np.array([csr.id_of(node) for node in infected_nodes], dtype=np.int64)
+    status[infected] = INFECTED
+
+    S, I, R = len(ids) - k, k, 0
+    infected_count = k
+    S_count, I_count, R_count, I_total_count = [S], [I], [R], [infected_count]
+
+    progress = tqdm(range(1, steps + 1),
+                    desc="Simulação de Pandemia - Evolução da Infecção",
+                    disable=not verbose)
+
+    for step in progress:
+        infected = np.flatnonzero(status == INFECTED)
+
+        # Arestas que saem dos infectados, concatenadas em um só array
+        starts = indptr[infected]
+        counts = indptr[infected + 1] - starts
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        edges = np.arange(int(counts.sum()), dtype=np.int64) + offsets
+
+        # Tentativas de infecção: só arestas para suscetíveis (estado do início do passo)
+        edges = edges[status[heads[edges]] == SUSCEPTIBLE]
+        hits = edges[rng.random(edges.size) < probs[edges]]
+        infected_count += hits.size
+        newly_infected = np.unique(heads[hits])
+
+        # Recuperação só após min_days_infected dias
+        days_infected[infected] += 1
+        recovering = infected[
+            (days_infected[infected] >= min_days_infected) & (rng.random(infected.size) < gamma)
+        ]
+
+        # Perda de imunidade
+        losing = np.empty(0, dtype=np.int64)
+        if days_to_lose_immunity is not None:
+            recovered = np.flatnonzero(status == RECOVERED)
+            days_recovered[recovered] += 1
+            losing = recovered[days_recovered[recovered] >= days_to_lose_immunity]
+
+        status[newly_infected] = INFECTED
+        days_infected[newly_infected] = 0
+        status[recovering] = RECOVERED
+        days_recovered[recovering] = 0
+        status[losing] = SUSCEPTIBLE
+
+        S += losing.size - newly_infected.size
+        I += newly_infected.size - recovering.size
+        R += recovering.size - losing.size
 
         S_count.append(S)
         I_count.append(I)
@@ -149,3 +270,160 @@ def simulate_SIR(graph: glib.Graph,
             break
 
     return S_count, I_count, R_count, I_total_count
+
+
+def _geometric(rng, p: float) -> float:
+    """
+    Número de tentativas diárias até o primeiro sucesso (>= 1) com
+    probabilidade ``p`` por dia; inf se ``p`` <= 0.
+    """
+    if p >= 1:
+        return 1
+    if p <= 0:
+        return math.inf
+    return 1 + int(math.log(1.0 - rng.random()) / math.log1p(-p))
+
+def _simulate_SIR_event(csr, ids, alive, beta, gamma, steps, infected_nodes, mean_weight,
+                        verbose, min_days_infected, days_to_lose_immunity, seed):
+    """
+    Motor orientado a eventos do ``simulate_SIR``. Em vez de varrer todos os
+    vértices a cada dia, sorteia quando cada evento acontece e os mantém em
+    uma fila de prioridade:
+
+    - infecção pela aresta (u, v): primeiro dia de sucesso das tentativas
+      diárias de u enquanto infectado (tempo geométrico com a probabilidade
+      da aresta). Os dias em que v não está suscetível são pulados: como as
+      tentativas são independentes, a próxima é sorteada a partir do dia em
+      que v volta a ser suscetível;
+    - recuperação: ``min_days_infected - 1`` dias mais um tempo geométrico
+      com probabilidade ``gamma``;
+    - perda de imunidade: ``days_to_lose_immunity`` dias após a recuperação.
+
+    Os tempos geométricos reproduzem a distribuição do modelo diário; os
+    eventos de um mesmo dia são validados contra o estado do início do dia e
+    aplicados juntos, como no laço síncrono. Eventos de episódios já
+    encerrados são invalidados pelo contador ``episode`` de cada vértice.
+    """
+    rng = random.Random(seed) if seed is not None else random
+    n = csr.size()
+    indptr, indices = csr.indptr, csr.indices
+    labels = csr.labels
+    probs = [clip(beta * (mean_weight / (weight + 1e-6)), 0.075, beta) for weight in csr.weights]
+
+    status = ['X'] * n
+    for i in ids:
+        status[i] = 'S'
+    episode = [0] * n
+    recover_day = [0] * n
+    release_day = [0] * n
+    recovery_delay = max(min_days_infected, 1) - 1
+    immunity = math.inf if days_to_lose_immunity is None else max(days_to_lose_immunity, 1)
+
+    events = []
+    counter = 0
+
+    def push(day, kind, node, ep, edge=-1):
+        nonlocal counter
+        counter += 1
+        heapq.heappush(events, (day, counter, kind, node, ep, edge))
+
+    def schedule_attempt(i, e, day):
+        # Último dia em que o vizinho ainda não está suscetível
+        v = indices[e]
+        if status[v] == 'I':
+            day = max(day, recover_day[v] + immunity)
+        elif status[v] == 'R':
+            day = max(day, release_day[v])
+        attempt = day + _geometric(rng, probs[e])
+        if attempt <= min(recover_day[i], steps):
+            push(attempt, 'I', i, episode[i], e)
+
+    def infect(i, day):
+        status[i] = 'I'
+        episode[i] += 1
+        recover_day[i] = day + recovery_delay + _geometric(rng, gamma)
+        if recover_day[i] <= steps:
+            push(recover_day[i], 'R', i, episode[i])
+        for e in range(indptr[i], indptr[i + 1]):
+            if alive is None or alive[e]:
+                schedule_attempt(i, e, day)
+
+    if not infected_nodes:
+        k = max(1, int(len(ids) * 0.001))
+        infected = rng.sample([labels[i] for i in ids], k)
+    else:
+        k = len(infected_nodes)
+        infected = infected_nodes
+
+    for node in infected:
+        infect(csr.id_of(node), 0)
+
+    S, I, R = len(ids) - k, k, 0
+    infected_count = k
+    S_count, I_count, R_count, I_total_count = [S], [I], [R], [infected_count]
+
+    progress = tqdm(total=steps,
+                    desc="Simulação de Pandemia - Evolução da Infecção",
+                    disable=not verbose)
+
+    day = 0
+    while day < steps and not (S == 0 and I == 0):
+        if not events:
+            # Sem eventos pendentes o estado não muda mais
+            remaining = steps - day
+            S_count.extend([S] * remaining)
+            I_count.extend([I] * remaining)
+            R_count.extend([R] * remaining)
+            I_total_count.extend([infected_count] * remaining)
+            progress.update(remaining)
+            break
+
+        next_day = events[0][0]
+        # Dias sem eventos repetem a contagem anterior
+        for _ in range(day + 1, next_day):
+            S_count.append(S)
+            I_count.append(I)
+            R_count.append(R)
+            I_total_count.append(infected_count)
+        day = next_day
+
+        newly_infected, recovering, losing = set(), [], []
+        while events and events[0][0] == day:
+            _, _, kind, node, ep, edge = heapq.heappop(events)
+            if episode[node] != ep:
+                continue
+            if kind == 'I':
+                neighbor = indices[edge]
+                if status[neighbor] == 'S':
+                    newly_infected.add(neighbor)
+                    infected_count += 1
+                schedule_attempt(node, edge, day)
+            elif kind == 'R' and status[node] == 'I':
+                recovering.append(node)
+            elif kind == 'L' and status[node] == 'R':
+                losing.append(node)
+
+        for i in recovering:
+            status[i] = 'R'
+            release_day[i] = day + immunity
+            if release_day[i] <= steps:
+                push(release_day[i], 'L', i, episode[i])
+        for i in losing:
+            status[i] = 'S'
+        for i in newly_infected:
+            infect(i, day)
+
+        S += len(losing) - len(newly_infected)
+        I += len(newly_infected) - len(recovering)
+        R += len(recovering) - len(losing)
+
+        S_count.append(S)
+        I_count.append(I)
+        R_count.append(R)
+        I_total_count.append(infected_count)
+
+        progress.update(len(S_count) - 1 - progress.n)
+        progress.set_description(f"Iteração {day} -> S: {S}, I: {I}, R: {R}")
+
+    progress.close()
+    return S_count, I_count, R_count, I_total_count
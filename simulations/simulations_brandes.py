@@ -1,8 +1,10 @@
+import heapq
 import matplotlib.pyplot as plt
 import networkx as nx
 import time
 import random
 import lib.graph_lib as glib  # Usa sua versão do algoritmo de Brandes
+from dataset.synthetic import synthetic_street_network
 import os
 import matplotlib as mpl
 
@@ -46,6 +48,47 @@ def save_graph_image(G, path, title='Grafo', node_size=30):
 
     
 
+def _random_weighted_graph(n: int, graph_type: str, seed: int):
+    """
+    Gera o grafo de teste do tipo ``graph_type`` com ~n vértices e pesos
+    aleatórios em [0.5, 10] (sorteados do ``random`` global). O tipo 'street'
+    é a malha viária sintética de ``dataset/synthetic.py`` (não dirigida),
+    com os comprimentos das ruas como pesos.
+    """
+    if graph_type == 'street':
+        csr = synthetic_street_network(n, oneway=0.0, seed=seed)
+        G = nx.Graph()
+        G.add_nodes_from(csr.nodes())
+        G.add_weighted_edges_from((u, v, attrs['weight']) for u, v, attrs in csr.edges())
+        return G
+
+    if graph_type == 'erdos':
+        p = min(0.05, 10 / n)
+        G_base = nx.erdos_renyi_graph(n, p, seed=seed)
+
+    elif graph_type == 'barabasi':
+        m = min(5, max(1, n // 20))
+        G_base = nx.barabasi_albert_graph(n, m, seed=seed)
+
+    elif graph_type == 'planar':
+        side = int(n ** 0.5)
+        G_base = nx.grid_2d_graph(side, side)
+        G_base = nx.convert_node_labels_to_integers(G_base)
+
+    elif graph_type == 'strogatz':
+        k = min(6, n - 1)
+        p = 0.3
+        G_base = nx.watts_strogatz_graph(n, k, p, seed=seed)
+
+    else:
+        raise ValueError(f"Tipo de grafo '{graph_type}' não suportado.")
+
+    # Pesos aleatórios
+    G2 = G_base.copy()
+    for u, v in G2.edges():
+        G2[u][v]['weight'] = random.uniform(0.5, 10.0)
+    return G2
+
 def benchmark_brandes_custom(
     sizes: list,
     graph_type: str = 'erdos',
@@ -61,31 +104,7 @@ def benchmark_brandes_custom(
     }
 
     for n in sizes:
-        if graph_type == 'erdos':
-            p = min(0.05, 10 / n)
-            G_base = nx.erdos_renyi_graph(n, p, seed=seed)
-
-        elif graph_type == 'barabasi':
-            m = min(5, max(1, n // 20))
-            G_base = nx.barabasi_albert_graph(n, m, seed=seed)
-
-        elif graph_type == 'planar':
-            side = int(n ** 0.5)
-            G_base = nx.grid_2d_graph(side, side)
-            G_base = nx.convert_node_labels_to_integers(G_base)
-
-        elif graph_type == 'strogatz':
-            k = min(6, n - 1)
-            p = 0.3
-            G_base = nx.watts_strogatz_graph(n, k, p, seed=seed)
-
-        else:
-            raise ValueError(f"Tipo de grafo '{graph_type}' não suportado.")
-
-        # Pesos aleatórios
-        G2 = G_base.copy()
-        for u, v in G2.edges():
-            G2[u][v]['weight'] = random.uniform(0.5, 10.0)
+        G2 = _random_weighted_graph(n, graph_type, seed)
 
         if save_img and n < 500:
             subfolder = os.path.join(folder, graph_type)
@@ -110,3 +129,124 @@ def benchmark_brandes_custom(
         print(f"[{graph_type} | n={n}] -> Tempo médio = {avg_time:.4f}s")
 
     return results
+
+def _indexed_dijkstra(csr, start, alive=None):
+    """
+    Kernel do Dijkstra do ``brandes`` antes das listas de adjacência: indexa
+    ``indptr``/``indices``/``weights`` a cada aresta. Mantido só como
+    referência para ``benchmark_shortest_paths``; a saída é a mesma de
+    ``glib._csr_dijkstra``.
+    """
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(indptr) - 1
+
+    distances = [float('inf')] * n
+    predecessors = [None] * n
+    paths = [0] * n
+
+    distances[start] = 0
+    predecessors[start] = []
+    paths[start] = 1
+
+    orders = []
+    heap = [(0, start)]
+
+    while heap:
+        dist_u, u = heapq.heappop(heap)
+        if dist_u > distances[u]:
+            continue
+        orders.append(u)
+
+        paths_u = paths[u]
+        for e in range(indptr[u], indptr[u + 1]):
+            if alive is not None and not alive[e]:
+                continue
+            v = indices[e]
+            alt = dist_u + weights[e]
+            dist_v = distances[v]
+
+            if alt < dist_v:
+                distances[v] = alt
+                predecessors[v] = [e]
+                paths[v] = paths_u
+                heapq.heappush(heap, (alt, v))
+            elif alt == dist_v:
+                predecessors[v].append(e)
+                paths[v] += paths_u
+
+    return orders, predecessors, paths
+
+def benchmark_shortest_paths(
+    sizes: list,
+    graph_type: str = 'erdos',
+    num_sources: int = 20,
+    seed: int = 42
+):
+    """
+    Compara o kernel do Dijkstra usado pelo ``brandes``
+    (``glib._csr_dijkstra``, com as listas de adjacência montadas uma vez)
+    com o kernel anterior, que indexa os buffers do CSR
+    (``_indexed_dijkstra``), nas mesmas fontes dos mesmos grafos de
+    ``benchmark_brandes_custom``. Também mede a montagem das listas e a
+    consulta ponto a ponto do ``glib.shortest_paths`` (parada antecipada),
+    com cada destino sorteado entre os vértices alcançáveis da fonte.
+
+    Returns:
+        dict: tamanhos e tempo médio por fonte (s) de 'indexed' e
+            'adjacency', tempo de 'adjacency_build' por grafo e tempo médio
+            por consulta de 'shortest_paths_target'
+    """
+    random.seed(seed)
+    results = {
+        'sizes': [],
+        'indexed': [],
+        'adjacency': [],
+        'adjacency_build': [],
+        'shortest_paths_target': []
+    }
+
+    for n in sizes:
+        G2 = _random_weighted_graph(n, graph_type, seed)
+        graph = glib.Graph()
+        # Vértices isolados também entram no grafo (podem ser sorteados)
+        for node in G2.nodes():
+            graph.add_node(node)
+        for u, v, w in G2.edges(data='weight'):
+            graph.add_edge(u, v, w)
+        csr = glib.as_csr(graph)
+
+        sources = random.sample(range(csr.size()), min(num_sources, csr.size()))
+
+        t0 = time.perf_counter()
+        for s in sources:
+            _indexed_dijkstra(csr, s)
+        t1 = time.perf_counter()
+        adjacency = csr.adjacency()
+        t2 = time.perf_counter()
+        reached = []
+        for s in sources:
+            orders, _, _ = glib._csr_dijkstra(csr, s, adjacency=adjacency)
+            reached.append(orders)
+        t3 = time.perf_counter()
+
+        # Destinos inalcançáveis (ou fontes isoladas) ficam de fora das consultas
+        labels = csr.labels
+        queries = [(labels[s], labels[random.choice(orders[1:])])
+                   for s, orders in zip(sources, reached) if len(orders) > 1]
+        t4 = time.perf_counter()
+        for s, t in queries:
+            glib.shortest_paths(csr, s, t)
+        t5 = time.perf_counter()
+
+        results['sizes'].append(n)
+        results['indexed'].append((t1 - t0) / len(sources))
+        results['adjacency'].append((t3 - t2) / len(sources))
+        results['adjacency_build'].append(t2 - t1)
+        results['shortest_paths_target'].append((t5 - t4) / len(queries) if queries else float('nan'))
+
+        print(f"[{graph_type} | n={n}] -> kernel anterior = {results['indexed'][-1] * 1e3:.2f}ms, "
+              f"_csr_dijkstra = {results['adjacency'][-1] * 1e3:.2f}ms "
+              f"(+ {results['adjacency_build'][-1] * 1e3:.2f}ms para as listas), "
+              f"shortest_paths com destino = {results['shortest_paths_target'][-1] * 1e3:.2f}ms")
+
+    return results
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import time
+from array import array
+
+import lib.graph_lib as glib
+
+class CentralityCache:
+   """
+   Cache em disco de centralidades (um valor por vértice), indexado pela
+   impressão digital do grafo (``glib.fingerprint``), pelo nome do algoritmo,
+   pelos parâmetros que alteram o resultado e pela versão dos resultados do
+   graph_lib (``glib.CACHE_VERSION``).
+
+   Mudou o grafo ou a versão, muda a chave: entradas antigas nunca são
+   reaproveitadas e acabam removidas pelo limite de tamanho (LRU pela data de
+   acesso dos arquivos).
+   """
+   def __init__(self, cache_dir: str = 'cache/centrality', max_bytes: int = 512 * 2 ** 20):
+      """
+      Args:
+         cache_dir (str): Diretório do cache.
+         max_bytes (int): Tamanho máximo do diretório; as entradas usadas há
+            mais tempo são removidas ao ultrapassá-lo.
+      """
+      self.cache_dir = cache_dir
+      self.max_bytes = max_bytes
+      os.makedirs(cache_dir, exist_ok=True)
+
+   def _path(self, graph, name: str, params: dict) -> str:
+      payload = json.dumps(
+         [glib.fingerprint(graph), name, params or {}, glib.CACHE_VERSION],
+         sort_keys=True, default=str
+      )
+      return os.path.join(self.cache_dir, hashlib.sha256(payload.encode()).hexdigest() + '.cent')
+
+   def load(self, graph, name: str, params: dict = None):
+      """
+      Busca uma centralidade no cache.
+
+      Args:
+         graph (glib.Graph | glib.CSRGraph | glib.CSRView): Grafo
+         name (str): Nome do algoritmo (por ex. 'brandes')
+         params (dict): Parâmetros que alteram o resultado
+
+      Returns:
+         tuple (dict, float) | None: centralidade de cada vértice e o tempo
+            (s) do cálculo original, ou None se não estiver no cache
+      """
+      path = self._path(graph, name, params)
+      try:
+         with open(path, 'rb') as file:
+            header = json.loads(file.readline())
+            values = array(header['typecode'])
+            values.frombytes(file.read())
+      except (OSError, ValueError, KeyError):
+         return None
+
+      nodes = graph.nodes()
+      if len(values) != len(nodes):
+         return None
+      # Marca o acesso para a política LRU
+      os.utime(path)
+      return dict(zip(nodes, values)), header['seconds']
+
+   def store(self, graph, name: str, centrality: dict, params: dict = None, seconds: float = 0.0):
+      """
+      Guarda uma centralidade no cache (na ordem de ``graph.nodes()``).
+
+      Args:
+         graph (glib.Graph | glib.CSRGraph | glib.CSRView): Grafo
+         name (str): Nome do algoritmo
+         centrality (dict): Valor de cada vértice
+         params (dict): Parâmetros que alteram o resultado
+         seconds (float): Tempo gasto no cálculo
+      """
+      values = [centrality[node] for node in graph.nodes()]
+      typecode = 'q' if all(type(value) is int for value in values) else 'd'
+      header = json.dumps({'name': name, 'typecode': typecode, 'seconds': seconds})
+
+      path = self._path(graph, name, params)
+      tmp_path = f'{path}.{os.getpid()}.tmp'
+      with open(tmp_path, 'wb') as file:
+         file.write(header.encode() + b'\n')
+         file.write(array(typecode, values).tobytes())
+      os.replace(tmp_path, path)
+      self._evict()
+
+   def get_or_compute(self, graph, name: str, compute, params: dict = None):
+      """
+      Retorna a centralidade do cache ou a calcula com ``compute()`` e a guarda.
+
+      Args:
+         graph (glib.Graph | glib.CSRGraph | glib.CSRView): Grafo
+         name (str): Nome do algoritmo
+         compute (callable): Função sem argumentos que calcula a centralidade
+         params (dict): Parâmetros que alteram o resultado
+
+      Returns:
+         tuple (dict, float): centralidade de cada vértice e o tempo (s) do cálculo
+      """
+      cached = self.load(graph, name, params)
+      if cached is not None:
+         return cached
+
+      start = time.perf_counter()
+      centrality = compute()
+      seconds = time.perf_counter() - start
+      self.store(graph, name, centrality, params, seconds)
+      return centrality, seconds
+
+   def _evict(self):
+      """
+      Remove as entradas acessadas há mais tempo até caber em ``max_bytes``.
+      """
+      entries = []
+      for entry in os.scandir(self.cache_dir):
+         if entry.is_file() and entry.name.endswith('.cent'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+      total = sum(size for _, size, _ in entries)
+      for _, size, path in sorted(entries):
+         if total <= self.max_bytes:
+            break
+         try:
+            os.remove(path)
+         except OSError:
+            continue
+         total -= size
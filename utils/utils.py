@@ -1,36 +1,144 @@
+import time
+import tracemalloc
+
 import networkx as nx
-import lib.graph_lib as glib  
-from copy import deepcopy
+import numpy as np
+
+import lib.graph_lib as glib
+
+PARALLEL_POLICIES = ('min', 'last', 'keep')
 
-def netx_to_graph_lib(G: nx.Graph) -> glib.Graph:
+def _check_parallel(parallel: str, allowed: tuple = PARALLEL_POLICIES):
+   if parallel not in allowed:
+      raise ValueError(f"Tratamento de arestas paralelas '{parallel}' não suportado.")
+
+class _conversion_report:
+   """
+   Mede tempo e pico de memória (``tracemalloc``) de uma conversão e os
+   imprime ao sair, se ``verbose``.
    """
-   Converte um networkx.Graph (ou DiGraph/MultiDiGraph) para um graph_lib.Graph
+   def __init__(self, label: str, verbose: bool):
+      self.label = label
+      self.verbose = verbose
+      self.details = ''
+
+   def __enter__(self):
+      if self.verbose:
+         self._tracing = tracemalloc.is_tracing()
+         if not self._tracing:
+            tracemalloc.start()
+         tracemalloc.reset_peak()
+         self._start = time.perf_counter()
+      return self
+
+   def __exit__(self, *exc):
+      if self.verbose:
+         elapsed = time.perf_counter() - self._start
+         _, peak = tracemalloc.get_traced_memory()
+         if not self._tracing:
+            tracemalloc.stop()
+         print(f"{self.label}: {elapsed:.3f}s, pico de memória {peak / 2 ** 20:.1f} MiB{self.details}")
+      return False
+
+def netx_to_graph_lib(G: nx.Graph, parallel: str = 'min', verbose: bool = False) -> glib.Graph:
+   """
+   Converte um networkx.Graph (ou DiGraph/MultiDiGraph) para um graph_lib.Graph,
+   em uma única passada pelas arestas (``glib.Graph.from_edges``)
 
    Args:
       G (nx.Graph): Um grafo do networkx (pode ser dirigido ou multigrafo)
+      parallel (str): Arestas paralelas de multigrafos: 'min' (fica a de menor
+         peso, a que os menores caminhos usariam) ou 'last' (a última vista)
+      verbose (bool): Se True, imprime o tempo e o pico de memória da conversão
 
    Returns:
       glib.Graph: Um grafo do graph_lib, com direção e pesos preservados
    """
-   graph = glib.Graph(G.is_directed())
+   _check_parallel(parallel, ('min', 'last'))
+   with _conversion_report('netx_to_graph_lib', verbose) as report:
+      edges = (
+         (u, v, 1.0 if weight is None else weight)
+         for u, v, weight in G.edges(data='weight')
+      )
+      graph = glib.Graph.from_edges(G.nodes(), edges, G.is_directed(), parallel)
+      if verbose:
+         report.details = f" ({graph.size()} vértices)"
+   return graph
 
-   # Adiciona os nós
-   for u in G.nodes():
-      graph.add_node(u)
-
-   # Verifica se é multigrafo para iterar com chave
-   if G.is_multigraph():
-      # G.edges(keys=True, data=True) retorna u,v,k,data
-      for u, v, k, data in G.edges(keys=True, data=True):
-         weight = data.get('weight', 1.0)
-         graph.add_edge(u, v, weight=weight)
-   else:
-      # Para grafos simples
-      for u, v, data in G.edges(data=True):
-         weight = data.get('weight', 1.0)
-         graph.add_edge(u, v, weight=weight)
 
-   return graph
+def netx_to_csr(G: nx.Graph, parallel: str = 'min', verbose: bool = False) -> glib.CSRGraph:
+   """
+   Converte um networkx.Graph (ou DiGraph/MultiDiGraph) diretamente para um
+   graph_lib.CSRGraph, sem passar pelo dict-of-dicts do graph_lib.Graph: as
+   arestas viram arrays do NumPy e o CSR é montado com ordenações
+   vetorizadas. Cada vértice mantém os vizinhos na ordem em que aparecem em
+   ``G.edges()``, como em ``glib.CSRGraph.from_edges``.
+
+   Args:
+      G (nx.Graph): Um grafo do networkx (pode ser dirigido ou multigrafo)
+      parallel (str): Arestas paralelas: 'min' (fica a de menor peso), 'last'
+         (a última vista) ou 'keep' (todas, como arcos distintos; os menores
+         caminhos por cada uma contam separadamente)
+      verbose (bool): Se True, imprime o tempo e o pico de memória da conversão
+
+   Returns:
+      glib.CSRGraph: Grafo compacto, com direção e pesos preservados
+   """
+   _check_parallel(parallel)
+   with _conversion_report('netx_to_csr', verbose) as report:
+      labels = list(G.nodes())
+      index = {node: i for i, node in enumerate(labels)}
+      n = len(labels)
+
+      edges = list(G.edges(data='weight'))
+      count = len(edges)
+      sources, targets, values = zip(*edges) if edges else ((), (), ())
+      tails = np.fromiter(map(index.__getitem__, sources), dtype=np.int64, count=count)
+      heads = np.fromiter(map(index.__getitem__, targets), dtype=np.int64, count=count)
+      weights = np.fromiter((1.0 if w is None else w for w in values), dtype=np.float64, count=count)
+
+      if not G.is_directed():
+         # Arco de volta logo após o de ida (sem duplicar laços), para que a
+         # ordem de aparição em cada vizinhança seja a mesma de from_edges
+         back = tails != heads
+         position = np.arange(count)
+         order = np.argsort(np.concatenate([2 * position, 2 * position[back] + 1]), kind='stable')
+         tails, heads = np.concatenate([tails, heads[back]])[order], np.concatenate([heads, tails[back]])[order]
+         weights = np.concatenate([weights, weights[back]])[order]
+
+      arcs = tails.size
+      if parallel != 'keep' and arcs:
+         # Agrupa os arcos (u, v) repetidos: a posição da primeira aparição
+         # define a ordem na vizinhança e o peso vem da política escolhida
+         key = tails * max(n, 1) + heads
+         order = np.argsort(key, kind='stable')
+         sorted_key = key[order]
+         starts = np.flatnonzero(np.concatenate([[True], sorted_key[1:] != sorted_key[:-1]]))
+         first = order[starts]
+         if parallel == 'min':
+            kept_weights = np.minimum.reduceat(weights[order], starts)
+         else:
+            ends = np.concatenate([starts[1:], [arcs]]) - 1
+            kept_weights = weights[order[ends]]
+         by_position = np.argsort(first, kind='stable')
+         tails, heads, weights = tails[first][by_position], heads[first][by_position], kept_weights[by_position]
+
+      order = np.argsort(tails, kind='stable')
+      tails, heads, weights = tails[order], heads[order], weights[order]
+      indptr = np.zeros(n + 1, dtype=np.int64)
+      np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+
+      csr = glib.CSRGraph(
+         glib._to_array('q', indptr),
+         glib._to_array('i' if n < 2 ** 31 else 'q', heads),
+         glib._to_array('d', weights),
+         labels,
+         G.is_directed()
+      )
+      if verbose:
+         report.details = (f" ({n} vértices, {arcs} arcos, {arcs - tails.size} paralelos "
+                           f"removidos, CSR com {csr.nbytes() / 2 ** 20:.1f} MiB)")
+   return csr
 
 
 def graph_lib_to_netx(G: glib.Graph) -> nx.Graph:
@@ -55,20 +163,19 @@ def graph_lib_to_netx(G: glib.Graph) -> nx.Graph:
 
 def remove_nodes(G: glib.Graph, nodes: list) -> glib.Graph:
    """
-   Remove vários vértices do grafo
+   Remove vários vértices do grafo, sem copiá-lo: retorna uma visão que
+   oculta os vértices removidos (e suas arestas)
 
    Args:
-       G (glib.Graph): Grafo do graph_lib
+       G (glib.Graph | glib.CSRGraph | glib.CSRView): Grafo do graph_lib
        nodes (list): Lista de vértices a serem removidos
 
    Returns:
-       glib.Graph: Grafo com os vértices removidos
+       glib.GraphView | glib.CSRView: Visão do grafo sem os vértices removidos
    """
-   G_copy = deepcopy(G)
-   for node in nodes:
-      G_copy.remove_node(node)
-
-   return G_copy
+   if isinstance(G, (glib.CSRGraph, glib.CSRView)):
+      return glib.CSRView(G, nodes)
+   return glib.GraphView(G, nodes)
 
 def clip(x: float, min_val: float, max_val: float) -> float:
    """
@@ -1,32 +1,116 @@
 import lib.graph_lib as glib
+import math
 import networkx as nx
 import random
-from utils.utils import netx_to_graph_lib
+import time
+from utils.utils import netx_to_graph_lib, netx_to_csr
 
-def test(G: nx.Graph) -> bool:
+ENGINES = ('python', 'lowmem', 'chains', 'blocks', 'numpy')
+# Motores que só aceitam grafos não dirigidos
+UNDIRECTED_ONLY = ('chains', 'blocks')
+
+def test(G: nx.Graph, resolution: float = None) -> bool:
    """
-   Função de teste dos algoritmos de centralidade de intermediação
+   Função de teste dos algoritmos de centralidade de intermediação: compara
+   a centralidade de todos os vértices, em cada motor do ``glib.brandes``,
+   com a do networkx
 
    Args:
       G (nx.Graph): Um grafo do networkx
+      resolution (float): Resolução dos pesos repassada ao ``glib.brandes``;
+         a referência do networkx é calculada com os pesos já convertidos
+         para inteiros nessa unidade (empates exatos)
 
    Returns:
       bool: True se os algoritmos de centralidade de intermediação forem equivalentes
    """
    G_own = netx_to_graph_lib(G)
-   
-   cb_own = glib.brandes(G_own)
-   cb_nx = nx.betweenness_centrality(G, normalized=False, weight='weight')
-   
-   k_top = max(1, len(G.nodes()) // 10)
-   top_own = sorted(cb_own.items(), key=lambda x: x[1], reverse=True)[:k_top]
-   top_nx = sorted(cb_nx.items(), key=lambda x: x[1], reverse=True)[:k_top]
-   
-   for i in range(k_top):
-      if top_own[i][0] != top_nx[i][0]:
-         return False
+
+   G_ref = G
+   if resolution is not None:
+      G_ref = G.copy()
+      for u, v, w in G_ref.edges(data='weight'):
+         G_ref[u][v]['weight'] = round(w / resolution)
+   cb_nx = nx.betweenness_centrality(G_ref, normalized=False, weight='weight')
+   # O networkx conta cada par uma única vez em grafos não dirigidos
+   scale = 1 if G.is_directed() else 2
+
+   for engine in ENGINES:
+      cb_own = glib.brandes(G_own, engine=engine, resolution=resolution)
+      for node, value in cb_nx.items():
+         if not math.isclose(cb_own[node], scale * value, rel_tol=1e-9, abs_tol=1e-9):
+            return False
+   return True
+
+def test_keep(G: nx.MultiGraph) -> bool:
+   """
+   Compara, em cada motor, a centralidade de um multigrafo convertido com
+   ``netx_to_csr(G, parallel='keep')`` (cada aresta paralela é um caminho
+   distinto) com a do networkx em um grafo simples equivalente: cada aresta
+   u - v de peso w vira u - x - v com pesos w/2, e só os pares de vértices
+   originais são contados (``betweenness_centrality_subset``)
+
+   Args:
+      G (nx.MultiGraph | nx.MultiDiGraph): Multigrafo com pesos inteiros
+
+   Returns:
+      bool: True se todos os motores concordarem com a referência
+   """
+   G_own = netx_to_csr(G, parallel='keep')
+
+   G_ref = nx.DiGraph() if G.is_directed() else nx.Graph()
+   G_ref.add_nodes_from(G.nodes())
+   for i, (u, v, w) in enumerate(G.edges(data='weight')):
+      if u == v:
+         continue
+      middle = ('aresta', i)
+      G_ref.add_edge(u, middle, weight=w / 2)
+      G_ref.add_edge(middle, v, weight=w / 2)
+   nodes = list(G.nodes())
+   cb_nx = nx.betweenness_centrality_subset(G_ref, nodes, nodes, normalized=False, weight='weight')
+   scale = 1 if G.is_directed() else 2
+
+   for engine in ENGINES:
+      if G.is_directed() and engine in UNDIRECTED_ONLY:
+         continue
+      cb_own = glib.brandes(G_own, engine=engine)
+      for node in nodes:
+         if not math.isclose(cb_own[node], scale * cb_nx[node], rel_tol=1e-9, abs_tol=1e-9):
+            return False
    return True
 
+def test_top_k_speed(n: int = 1500, repeats: int = 3) -> bool:
+   """
+   Teste de regressão do ``glib.top_k_betweenness``: em um ciclo todos os
+   vértices empatam e o top k nunca é certificado, então todas as fontes
+   são processadas (lotes dobrando). Nesse pior caso o resultado deve ser o
+   exato e o tempo não pode passar o do ``glib.brandes``
+
+   Args:
+      n (int): Número de vértices do ciclo
+      repeats (int): Execuções de cada função; compara os menores tempos
+
+   Returns:
+      bool: True se os valores forem os exatos e o tempo não for maior
+   """
+   G = nx.cycle_graph(n)
+   for u, v in G.edges():
+      G[u][v]['weight'] = 1 + u % 3
+   G_own = netx_to_csr(G)
+
+   top_time = brandes_time = math.inf
+   for _ in range(repeats):
+      start = time.perf_counter()
+      top = glib.top_k_betweenness(G_own, 10, seed=0)
+      top_time = min(top_time, time.perf_counter() - start)
+      start = time.perf_counter()
+      cb = glib.brandes(G_own)
+      brandes_time = min(brandes_time, time.perf_counter() - start)
+
+   exact = all(math.isclose(value, cb[node], rel_tol=1e-9) for node, value in top)
+   # 10% de folga para o ruído de medição
+   return exact and top_time <= 1.1 * brandes_time
+
 if __name__ == '__main__':
    print("=== Iniciando testes ===")
 
@@ -84,4 +168,52 @@ if __name__ == '__main__':
       print(f"  - Result: [{success_count}/{len(gens)}]")
       total_success += success_count
 
+   # Comprimentos decimais: 0.1 + 0.2 != 0.3 em float, então os empates
+   # só são exatos com a resolução
+   print("- Grades com pesos decimais (resolution=1e-3):")
+   success_count = 0
+   for idx, side in enumerate((8, 10, 12), start=1):
+      G = nx.grid_2d_graph(side, side)
+      for u, v in G.edges():
+         G[u][v]['weight'] = random.choice((0.1, 0.2, 0.3))
+      ok = test(G, resolution=1e-3)
+      total_tests += 1
+      if ok:
+         success_count += 1
+         print(f"  - Grafo {idx}: \033[92mSUCCESS\033[0m")
+      else:
+         print(f"  - Grafo {idx}: \033[91mERROR\033[0m")
+   print(f"  - Result: [{success_count}/3]")
+   total_success += success_count
+
+   # Multigrafos com arestas paralelas mantidas (parallel='keep'), com pesos
+   # pequenos para que haja caminhos paralelos empatados
+   print("- Multigrafos com arestas paralelas (parallel='keep'):")
+   success_count = 0
+   for idx, directed in enumerate((False, False, True, True), start=1):
+      base = nx.gnm_random_graph(30, 60, seed=idx, directed=directed)
+      G = nx.MultiDiGraph() if directed else nx.MultiGraph()
+      G.add_nodes_from(base.nodes())
+      for u, v in base.edges():
+         for _ in range(random.choice((1, 1, 2, 3))):
+            G.add_edge(u, v, weight=random.randint(1, 3))
+      ok = test_keep(G)
+      total_tests += 1
+      if ok:
+         success_count += 1
+         print(f"  - Grafo {idx}: \033[92mSUCCESS\033[0m")
+      else:
+         print(f"  - Grafo {idx}: \033[91mERROR\033[0m")
+   print(f"  - Result: [{success_count}/4]")
+   total_success += success_count
+
+   print("- Top k sem parada antecipada (não mais lento que o brandes):")
+   ok = test_top_k_speed()
+   total_tests += 1
+   if ok:
+      total_success += 1
+      print(f"  - Ciclo: \033[92mSUCCESS\033[0m")
+   else:
+      print(f"  - Ciclo: \033[91mERROR\033[0m")
+
    print(f"\n- Resultado final: [{total_success}/{total_tests}]")